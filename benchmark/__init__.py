@@ -0,0 +1,10 @@
+"""
+Benchmarks of the order book, order book tracker and strategy hot paths.
+
+Run from the repository root, after compiling the Cython modules:
+
+    python -m benchmark --output benchmark_results.json
+
+Every scenario is run with a fixed random seed, so two runs of the same version execute the same operations. The
+results (throughput, latency percentiles and memory peak of each scenario) are written as JSON to compare versions.
+"""
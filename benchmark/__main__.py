@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from os.path import dirname, join, realpath
+from typing import Any, Dict, List, Optional
+
+from benchmark.runner import ScenarioResult, results_to_json_dict, run_scenario
+from benchmark.scenarios import SCENARIOS
+from benchmark.workloads import recorded_order_book_workload, synthetic_order_book_workload
+
+ROOT_PATH = realpath(join(dirname(__file__), ".."))
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(prog="python -m benchmark",
+                         description="Benchmarks of the order book, order book tracker and strategy hot paths.")
+        self.add_argument("--scenario", "-s",
+                          action="append",
+                          choices=sorted(SCENARIOS.keys()),
+                          dest="scenarios",
+                          help="Scenario to run, can be repeated. All the scenarios are run by default.")
+        self.add_argument("--iterations", "-n",
+                          type=int,
+                          default=10000,
+                          help="Number of measured iterations of each scenario.")
+        self.add_argument("--warmup",
+                          type=int,
+                          default=1000,
+                          help="Number of iterations run before the measured ones.")
+        self.add_argument("--seed",
+                          type=int,
+                          default=42,
+                          help="Seed of the synthetic workload and of the scenarios random values.")
+        self.add_argument("--recorded-data",
+                          type=str,
+                          help="JSON lines file of order book snapshots and diffs recorded from an exchange, "
+                               "used instead of the synthetic workload.")
+        self.add_argument("--output", "-o",
+                          type=str,
+                          help="Path of the JSON results file.")
+        self.add_argument("--no-memory",
+                          action="store_true",
+                          help="Skip the memory peak measurement pass.")
+
+
+def environment_info() -> Dict[str, Any]:
+    with open(join(ROOT_PATH, "hummingbot", "VERSION")) as version_file:
+        version = version_file.read().strip()
+    git_commit: Optional[str] = None
+    try:
+        git_commit = subprocess.check_output(["git", "rev-parse", "HEAD"],
+                                             cwd=ROOT_PATH,
+                                             stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return {
+        "hummingbot_version": version,
+        "git_commit": git_commit,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+    }
+
+
+def print_results(results: List[ScenarioResult]):
+    print(f"{'Scenario':<40} {'ops/s':>14} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} {'max us':>10} "
+          f"{'peak KiB':>10}")
+    for result in results:
+        peak = f"{result.memory_peak_bytes / 1024:.1f}" if result.memory_peak_bytes is not None else "-"
+        print(f"{result.name:<40} {result.operations_per_second:>14.1f} {result.latency_p50_us:>10.2f} "
+              f"{result.latency_p90_us:>10.2f} {result.latency_p99_us:>10.2f} {result.latency_max_us:>10.2f} "
+              f"{peak:>10}")
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    if args.recorded_data is not None:
+        workload = recorded_order_book_workload(args.recorded_data)
+    else:
+        workload = synthetic_order_book_workload(args.seed)
+    scenario_names = args.scenarios or list(SCENARIOS.keys())
+
+    results = []
+    for scenario_name in scenario_names:
+        print(f"Running {scenario_name}...", file=sys.stderr)
+        results.append(run_scenario(SCENARIOS[scenario_name],
+                                    workload,
+                                    seed=args.seed,
+                                    iterations=args.iterations,
+                                    warmup_iterations=args.warmup,
+                                    measure_memory=not args.no_memory))
+    print_results(results)
+
+    if args.output is not None:
+        settings = {
+            "scenarios": scenario_names,
+            "iterations": args.iterations,
+            "warmup_iterations": args.warmup,
+            "seed": args.seed,
+            "workload": workload.source,
+            "workload_diffs": len(workload.diffs),
+            "memory_measured": not args.no_memory,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(results_to_json_dict(results, environment_info(), settings), output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
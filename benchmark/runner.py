@@ -0,0 +1,136 @@
+import asyncio
+import math
+import time
+import tracemalloc
+from random import Random
+from typing import Any, Dict, List, NamedTuple, Optional, Type
+
+from benchmark.workloads import OrderBookWorkload
+
+# Version of the results format, to be increased when the format changes in an incompatible way
+RESULTS_SCHEMA_VERSION = 1
+
+
+class Scenario:
+    """
+    A benchmarked operation. The scenario prepares everything it needs in `setup`, so that `run_iteration` only runs
+    the measured operation, `operations_per_iteration` times.
+    """
+    name: str = ""
+    description: str = ""
+    operations_per_iteration: int = 1
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        pass
+
+    def run_iteration(self):
+        raise NotImplementedError
+
+    def teardown(self):
+        pass
+
+
+class AsyncScenario(Scenario):
+    """
+    A scenario whose measured operation is a coroutine. The iterations are run one after the other on the event loop.
+    """
+    async def run_iteration(self):
+        raise NotImplementedError
+
+
+class ScenarioResult(NamedTuple):
+    name: str
+    iterations: int
+    operations: int
+    total_seconds: float
+    operations_per_second: float
+    latency_p50_us: float
+    latency_p90_us: float
+    latency_p99_us: float
+    latency_max_us: float
+    memory_peak_bytes: Optional[int]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest rank percentile of values sorted in ascending order.
+    """
+    if len(sorted_values) == 0:
+        return float("nan")
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _run_iterations(scenario: Scenario, iterations: int, timings_ns: Optional[List[int]] = None):
+    ev_loop = asyncio.get_event_loop()
+    is_async = isinstance(scenario, AsyncScenario)
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        if is_async:
+            ev_loop.run_until_complete(scenario.run_iteration())
+        else:
+            scenario.run_iteration()
+        if timings_ns is not None:
+            timings_ns.append(time.perf_counter_ns() - started)
+
+
+def run_scenario(scenario_class: Type[Scenario],
+                 workload: OrderBookWorkload,
+                 seed: int,
+                 iterations: int,
+                 warmup_iterations: int,
+                 measure_memory: bool = True) -> ScenarioResult:
+    """
+    Runs the warm up and measured iterations of a scenario, then, if measure_memory is True, runs the same iterations
+    again on a new instance of the scenario with tracemalloc enabled, since tracing slows down every allocation.
+    """
+    scenario = scenario_class()
+    scenario.setup(Random(seed), workload)
+    timings_ns: List[int] = []
+    try:
+        _run_iterations(scenario, warmup_iterations)
+        _run_iterations(scenario, iterations, timings_ns)
+    finally:
+        scenario.teardown()
+
+    memory_peak_bytes = None
+    if measure_memory:
+        scenario = scenario_class()
+        scenario.setup(Random(seed), workload)
+        try:
+            _run_iterations(scenario, warmup_iterations)
+            tracemalloc.start()
+            try:
+                _run_iterations(scenario, iterations)
+                memory_peak_bytes = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        finally:
+            scenario.teardown()
+
+    total_seconds = sum(timings_ns) * 1e-9
+    operations = iterations * scenario_class.operations_per_iteration
+    timings_us = sorted(timing * 1e-3 for timing in timings_ns)
+    return ScenarioResult(
+        name=scenario_class.name,
+        iterations=iterations,
+        operations=operations,
+        total_seconds=total_seconds,
+        operations_per_second=operations / total_seconds if total_seconds > 0 else float("nan"),
+        latency_p50_us=percentile(timings_us, 50),
+        latency_p90_us=percentile(timings_us, 90),
+        latency_p99_us=percentile(timings_us, 99),
+        latency_max_us=timings_us[-1] if len(timings_us) > 0 else float("nan"),
+        memory_peak_bytes=memory_peak_bytes,
+    )
+
+
+def results_to_json_dict(results: List[ScenarioResult],
+                         environment: Dict[str, Any],
+                         settings: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "environment": environment,
+        "settings": settings,
+        "results": [result._asdict() for result in results],
+    }
@@ -0,0 +1,26 @@
+from typing import Dict, Type
+
+from benchmark.runner import Scenario
+from benchmark.scenarios.order_book import (
+    OrderBookApplyDiffsScenario,
+    OrderBookApplyLazyDiffMessageScenario,
+    OrderBookGetVwapForVolumeScenario,
+)
+from benchmark.scenarios.order_book_tracker import OrderBookTrackerApplyDiffMessageScenario
+from benchmark.scenarios.pubsub import PubSubTriggerEventScenario, PubSubTriggerEventsScenario
+from benchmark.scenarios.strategy import PureMarketMakingTickScenario, TradingIntensityAddSampleScenario
+from benchmark.scenarios.throttler import AsyncThrottlerExecuteTaskScenario
+
+SCENARIOS: Dict[str, Type[Scenario]] = {
+    scenario.name: scenario for scenario in [
+        OrderBookApplyDiffsScenario,
+        OrderBookApplyLazyDiffMessageScenario,
+        OrderBookGetVwapForVolumeScenario,
+        OrderBookTrackerApplyDiffMessageScenario,
+        PubSubTriggerEventScenario,
+        PubSubTriggerEventsScenario,
+        PureMarketMakingTickScenario,
+        TradingIntensityAddSampleScenario,
+        AsyncThrottlerExecuteTaskScenario,
+    ]
+}
@@ -0,0 +1,72 @@
+from random import Random
+from typing import List, Tuple
+
+from benchmark.runner import Scenario
+from benchmark.workloads import OrderBookWorkload
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import LazyOrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+def order_book_from_workload(workload: OrderBookWorkload) -> OrderBook:
+    order_book = OrderBook()
+    order_book.apply_snapshot(workload.snapshot.bid_rows(), workload.snapshot.ask_rows(), workload.snapshot.update_id)
+    return order_book
+
+
+class OrderBookApplyDiffsScenario(Scenario):
+    name = "order_book.apply_diffs"
+    description = "OrderBook.apply_diffs of diffs already converted to OrderBookRow lists"
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._order_book = order_book_from_workload(workload)
+        self._diffs: List[Tuple[List[OrderBookRow], List[OrderBookRow], int]] = [
+            (diff.bid_rows(), diff.ask_rows(), diff.update_id) for diff in workload.diffs
+        ]
+        self._index = 0
+
+    def run_iteration(self):
+        bids, asks, update_id = self._diffs[self._index]
+        self._order_book.apply_diffs(bids, asks, update_id)
+        self._index = (self._index + 1) % len(self._diffs)
+
+
+class OrderBookApplyLazyDiffMessageScenario(Scenario):
+    name = "order_book.apply_lazy_diff_message"
+    description = "OrderBook.apply_diff_message of LazyOrderBookMessage diffs, including the parsing of the levels"
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._order_book = order_book_from_workload(workload)
+        self._diffs = workload.diffs
+        self._index = 0
+
+    def run_iteration(self):
+        diff = self._diffs[self._index]
+        # The message is created here since its levels are parsed only once, on the first diff application
+        message = LazyOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": diff.update_id,
+            "bids": diff.bids,
+            "asks": diff.asks,
+        }, timestamp=1640000000)
+        self._order_book.apply_diff_message(message)
+        self._index = (self._index + 1) % len(self._diffs)
+
+
+class OrderBookGetVwapForVolumeScenario(Scenario):
+    name = "order_book.get_vwap_for_volume"
+    description = "OrderBook.c_get_vwap_for_volume, through get_vwap_for_volume, of random sides and volumes"
+    samples = 1000
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._order_book = order_book_from_workload(workload)
+        total_bid_volume = sum(row.amount for row in workload.snapshot.bid_rows())
+        self._queries: List[Tuple[bool, float]] = [
+            (random.random() < 0.5, random.uniform(0, total_bid_volume / 2)) for _ in range(self.samples)
+        ]
+        self._index = 0
+
+    def run_iteration(self):
+        is_buy, volume = self._queries[self._index]
+        self._order_book.get_vwap_for_volume(is_buy, volume)
+        self._index = (self._index + 1) % len(self._queries)
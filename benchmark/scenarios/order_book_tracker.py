@@ -0,0 +1,67 @@
+import asyncio
+from random import Random
+from typing import List
+
+from benchmark.runner import Scenario
+from benchmark.scenarios.order_book import order_book_from_workload
+from benchmark.workloads import OrderBookWorkload
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class BenchmarkOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str], workload: OrderBookWorkload):
+        super().__init__(trading_pairs)
+        self._workload = workload
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return order_book_from_workload(self._workload)
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookTrackerApplyDiffMessageScenario(Scenario):
+    name = "order_book_tracker.apply_diff_message"
+    description = "Routing of sequenced diff messages by OrderBookTracker to the order book of their trading pair"
+    trading_pair = "COINALPHA-HBOT"
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._data_source = BenchmarkOrderBookTrackerDataSource([self.trading_pair], workload)
+        self._tracker = OrderBookTracker(data_source=self._data_source, trading_pairs=[self.trading_pair])
+        self._tracker._order_books[self.trading_pair] = order_book_from_workload(workload)
+        self._snapshot_update_id = workload.snapshot.update_id
+        self._messages = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": self.trading_pair,
+                "first_update_id": diff.update_id,
+                "update_id": diff.update_id,
+                "bids": diff.bids,
+                "asks": diff.asks,
+            }, timestamp=1640000000)
+            for diff in workload.diffs
+        ]
+        self._index = 0
+
+    def run_iteration(self):
+        if self._index == 0:
+            # Replays the diffs from the beginning, as if the order book had been restored from the snapshot
+            self._tracker._last_update_ids[self.trading_pair] = self._snapshot_update_id
+        self._tracker._apply_diff_message(self.trading_pair, self._messages[self._index])
+        self._index = (self._index + 1) % len(self._messages)
+
+    def teardown(self):
+        self._tracker.stop()
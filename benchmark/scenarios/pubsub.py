@@ -0,0 +1,45 @@
+from enum import Enum
+from random import Random
+
+from benchmark.runner import Scenario
+from benchmark.workloads import OrderBookWorkload
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+
+class BenchmarkEventType(Enum):
+    EVENT = 1
+
+
+class NoOpListener(EventListener):
+    def __call__(self, arg):
+        pass
+
+
+class PubSubTriggerEventScenario(Scenario):
+    name = "pubsub.trigger_event"
+    description = "PubSub.c_trigger_event, through trigger_event, of an event with 5 listeners"
+    number_of_listeners = 5
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._pubsub = PubSub()
+        self._listeners = [NoOpListener() for _ in range(self.number_of_listeners)]
+        for listener in self._listeners:
+            self._pubsub.add_listener(BenchmarkEventType.EVENT, listener)
+        self._event = object()
+
+    def run_iteration(self):
+        self._pubsub.trigger_event(BenchmarkEventType.EVENT, self._event)
+
+
+class PubSubTriggerEventsScenario(PubSubTriggerEventScenario):
+    name = "pubsub.trigger_events"
+    description = "PubSub.c_trigger_events, through trigger_events, of bursts of 100 events with 5 listeners"
+    operations_per_iteration = 100
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        super().setup(random, workload)
+        self._events = [object() for _ in range(self.operations_per_iteration)]
+
+    def run_iteration(self):
+        self._pubsub.trigger_events(BenchmarkEventType.EVENT, self._events)
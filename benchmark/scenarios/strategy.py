@@ -0,0 +1,70 @@
+from decimal import Decimal
+from random import Random
+
+from benchmark.runner import Scenario
+from benchmark.scenarios.order_book import order_book_from_workload
+from benchmark.workloads import OrderBookWorkload
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.mock.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class PureMarketMakingTickScenario(Scenario):
+    name = "pure_market_making.tick"
+    description = "One second backtest clock tick of PureMarketMakingStrategy (c_tick) and its paper exchange"
+    trading_pair = "HBOT-ETH"
+    start_timestamp = 1640000000.0
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        self._clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 1e9)
+        self._market = MockPaperExchange()
+        mid_price = workload.mid_price
+        self._market.set_balanced_order_book(self.trading_pair,
+                                             mid_price=mid_price,
+                                             min_price=mid_price / 2,
+                                             max_price=mid_price * 2,
+                                             price_step_size=mid_price / 100,
+                                             volume_step_size=10)
+        self._market.set_balance("HBOT", 500)
+        self._market.set_balance("ETH", 5000)
+        self._market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        market_info = MarketTradingPairTuple(self._market, self.trading_pair, "HBOT", "ETH")
+        self._strategy = PureMarketMakingStrategy()
+        self._strategy.init_params(
+            market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+        )
+        self._clock.add_iterator(self._market)
+        self._clock.add_iterator(self._strategy)
+        self._clock.backtest_til(self.start_timestamp)
+
+    def run_iteration(self):
+        self._clock.backtest_til(self._clock.current_timestamp + 1)
+
+
+class TradingIntensityAddSampleScenario(Scenario):
+    name = "trading_intensity.add_sample"
+    description = "TradingIntensityIndicator.add_sample of order book snapshots, including the intensity estimations"
+    samples = 200
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        order_book = order_book_from_workload(workload)
+        self._samples = []
+        for diff in workload.diffs[:self.samples]:
+            order_book.apply_diffs(diff.bid_rows(), diff.ask_rows(), diff.update_id)
+            self._samples.append(order_book.snapshot)
+        self._indicator = TradingIntensityIndicator(sampling_length=30)
+        self._index = 0
+
+    def run_iteration(self):
+        self._indicator.add_sample(self._samples[self._index])
+        self._index = (self._index + 1) % len(self._samples)
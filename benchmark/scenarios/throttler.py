@@ -0,0 +1,22 @@
+from random import Random
+
+from benchmark.runner import AsyncScenario
+from benchmark.workloads import OrderBookWorkload
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class AsyncThrottlerExecuteTaskScenario(AsyncScenario):
+    name = "async_throttler.execute_task"
+    description = "Acquisition and release of AsyncThrottler capacity for a request, with a limit never reached"
+    limit_id = "BENCHMARK"
+
+    def setup(self, random: Random, workload: OrderBookWorkload):
+        # The limit is high enough to never wait, only the cost of the rate limit checks is measured
+        self._throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=self.limit_id,
+                                                                limit=1_000_000_000,
+                                                                time_interval=1.0)])
+
+    async def run_iteration(self):
+        async with self._throttler.execute_task(self.limit_id):
+            pass
@@ -0,0 +1,99 @@
+import json
+from random import Random
+from typing import List, NamedTuple
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+# A level as received from an exchange, price and amount as strings
+RawLevel = List[str]
+
+
+class OrderBookUpdate(NamedTuple):
+    update_id: int
+    bids: List[RawLevel]
+    asks: List[RawLevel]
+
+    def bid_rows(self) -> List[OrderBookRow]:
+        return [OrderBookRow(float(price), float(amount), self.update_id) for price, amount in self.bids]
+
+    def ask_rows(self) -> List[OrderBookRow]:
+        return [OrderBookRow(float(price), float(amount), self.update_id) for price, amount in self.asks]
+
+
+class OrderBookWorkload(NamedTuple):
+    """
+    An order book snapshot followed by the diffs applied on top of it, in the order they were received.
+    """
+    source: str
+    snapshot: OrderBookUpdate
+    diffs: List[OrderBookUpdate]
+
+    @property
+    def mid_price(self) -> float:
+        return (float(self.snapshot.bids[0][0]) + float(self.snapshot.asks[0][0])) / 2
+
+
+def synthetic_order_book_workload(seed: int,
+                                  number_of_diffs: int = 10000,
+                                  depth: int = 500,
+                                  levels_per_diff: int = 10,
+                                  mid_price: float = 100.0,
+                                  tick_size: float = 0.01) -> OrderBookWorkload:
+    """
+    Generates an order book of `depth` levels on each side around `mid_price`, and diffs changing `levels_per_diff`
+    levels each, mostly close to the top of the book as on real markets. About one level in ten is removed (amount 0).
+    """
+    random = Random(seed)
+
+    def random_amount() -> str:
+        return f"{random.uniform(0.1, 50):.4f}"
+
+    snapshot = OrderBookUpdate(
+        update_id=1,
+        bids=[[f"{mid_price - tick_size * (i + 1):.2f}", random_amount()] for i in range(depth)],
+        asks=[[f"{mid_price + tick_size * (i + 1):.2f}", random_amount()] for i in range(depth)],
+    )
+    diffs = []
+    for update_id in range(2, number_of_diffs + 2):
+        bids = []
+        asks = []
+        for _ in range(levels_per_diff):
+            distance = min(depth, int(random.expovariate(0.05)) + 1)
+            amount = "0" if random.random() < 0.1 else random_amount()
+            if random.random() < 0.5:
+                bids.append([f"{mid_price - tick_size * distance:.2f}", amount])
+            else:
+                asks.append([f"{mid_price + tick_size * distance:.2f}", amount])
+        diffs.append(OrderBookUpdate(update_id=update_id, bids=bids, asks=asks))
+    return OrderBookWorkload(source="synthetic", snapshot=snapshot, diffs=diffs)
+
+
+def recorded_order_book_workload(path: str) -> OrderBookWorkload:
+    """
+    Loads a workload recorded from an exchange. The file has one JSON object per line:
+    {"type": "snapshot" or "diff", "update_id": 1, "bids": [["99.99", "1.5"], ...], "asks": [...]}
+    The first snapshot is the initial order book, the diffs received before it are ignored.
+    """
+    snapshot = None
+    diffs = []
+    with open(path) as recording:
+        for line in recording:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            update = OrderBookUpdate(update_id=int(record["update_id"]),
+                                     bids=[[str(price), str(amount)] for price, amount in record["bids"]],
+                                     asks=[[str(price), str(amount)] for price, amount in record["asks"]])
+            if record["type"] == "snapshot":
+                if snapshot is None:
+                    snapshot = update
+            elif record["type"] == "diff":
+                if snapshot is not None:
+                    diffs.append(update)
+            else:
+                raise ValueError(f"Unknown record type {record['type']} in {path}.")
+    if snapshot is None:
+        raise ValueError(f"No order book snapshot found in {path}.")
+    if len(diffs) == 0:
+        raise ValueError(f"No order book diff found after the snapshot in {path}.")
+    return OrderBookWorkload(source=path, snapshot=snapshot, diffs=diffs)
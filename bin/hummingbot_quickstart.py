@@ -31,7 +31,9 @@ from hummingbot.client.ui import login_prompt
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.gateway import start_existing_gateway_container
 from hummingbot.core.management.console import start_management_console
+from hummingbot.core.management.status_server import start_status_server
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.metrics import MetricsRegistry
 
 from bin.docker_connection import fork_and_start
 
@@ -52,6 +54,15 @@ class CmdlineParser(argparse.ArgumentParser):
                           required=False,
                           help="Try to automatically set config / logs / data dir permissions, "
                                "useful for Docker containers.")
+        self.add_argument("--headless",
+                          action="store_true",
+                          help="Run the strategy of the config file without the terminal UI. Notifications are "
+                               "written to the logs and the status is served on the status port.")
+        self.add_argument("--status-port",
+                          type=int,
+                          default=8213,
+                          help="(headless mode only) Local port of the status endpoint, the next available port is "
+                               "used if it is taken.")
 
 
 def autofix_permissions(user_group_spec: str):
@@ -92,7 +103,11 @@ async def quick_start(args: argparse.Namespace):
 
     AllConnectorSettings.initialize_paper_trade_settings(global_config_map.get("paper_trade_exchanges").value)
 
-    hb = HummingbotApplication.main_application()
+    if args.headless and config_file_name is None:
+        logging.getLogger().error("A config file is required to run in headless mode.")
+        return
+
+    hb = HummingbotApplication.main_application(headless=args.headless)
     # Todo: validate strategy and config_file_name before assinging
 
     if config_file_name is not None:
@@ -105,6 +120,10 @@ async def quick_start(args: argparse.Namespace):
 
     if hb.strategy_name and hb.strategy_file_name:
         if not all_configs_complete(hb.strategy_name):
+            if args.headless:
+                # The missing configs can't be entered without the UI
+                await hb.status_check_all()
+                return
             hb.status()
 
     # The listener needs to have a named variable for keeping reference, since the event listener system
@@ -113,6 +132,12 @@ async def quick_start(args: argparse.Namespace):
     hb.app.add_listener(HummingbotUIEvent.Start, start_listener)
 
     tasks: List[Coroutine] = [hb.run(), start_existing_gateway_container()]
+    if args.headless:
+        status_port: int = detect_available_port(args.status_port)
+        tasks.append(start_status_server(hb.status_summary,
+                                         host="localhost",
+                                         port=status_port,
+                                         get_metrics=MetricsRegistry.get_instance().snapshot))
     if global_config_map.get("debug_console").value:
         management_port: int = detect_available_port(8211)
         tasks.append(start_management_console(locals(), host="localhost", port=management_port))
@@ -130,9 +155,14 @@ def main():
         args.config_file_name = os.environ["CONFIG_FILE_NAME"]
     if args.config_password is None and len(os.environ.get("CONFIG_PASSWORD", "")) > 0:
         args.config_password = os.environ["CONFIG_PASSWORD"]
+    if not args.headless and os.environ.get("HEADLESS", "").lower() in ("1", "true", "yes"):
+        args.headless = True
 
     # If no password is given from the command line, prompt for one.
     if args.config_password is None:
+        if args.headless:
+            logging.getLogger().error("The config password is required to run in headless mode.")
+            return
         if not login_prompt():
             return
 
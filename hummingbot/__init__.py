@@ -120,6 +120,7 @@ def init_logging(conf_filename: str,
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
+    from hummingbot.logger.queue_log_handler import disable_queue_logging, enable_queue_logging
     from hummingbot.logger.struct_logger import (
         StructLogRecord,
         StructLogger
@@ -147,7 +148,17 @@ def init_logging(conf_filename: str,
                 if global_config_map["logger_override_whitelist"].value and \
                         logger in global_config_map["logger_override_whitelist"].value:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        queue_config: Dict = config_dict.pop("queue_logging", None) or {}
+        # Release any writer thread before dictConfig replaces the handlers it writes to.
+        disable_queue_logging()
         logging.config.dictConfig(config_dict)
+        if queue_config.get("enabled", False):
+            enable_queue_logging(
+                max_queue_size=int(queue_config.get("max_queue_size", 10000)),
+                high_watermark=float(queue_config.get("high_watermark", 0.8)),
+                priority_level=logging.getLevelName(queue_config.get("priority_level", "WARNING")),
+                summary_interval=float(queue_config.get("summary_interval", 10.0)),
+            )
 
 
 def get_strategy_list() -> List[str]:
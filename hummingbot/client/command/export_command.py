@@ -1,11 +1,7 @@
 import os
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 
 import pandas as pd
-from sqlalchemy.orm import (
-    Session,
-    Query
-)
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.security import Security
@@ -68,48 +64,25 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
-                self.notify("No past trades to export.")
-                return
-            self.placeholder_mode = True
-            self.app.hide_input = True
-            path = global_config_map["log_file_path"].value
-            if path is None:
-                path = DEFAULT_LOG_FILE_PATH
-            file_name = await self.prompt_new_export_file_name(path)
-            file_path = os.path.join(path, file_name)
-            try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(file_path, header=True)
-                self.notify(f"Successfully exported trades to {file_path}")
-            except Exception as e:
-                self.notify(f"Error exporting trades to {path}: {e}")
-            self.app.change_prompt(prompt=">>> ")
-            self.placeholder_mode = False
-            self.app.hide_input = False
-
-    def _get_trades_from_session(self,  # type: HummingbotApplication
-                                 start_timestamp: int,
-                                 session: Session,
-                                 number_of_rows: Optional[int] = None,
-                                 config_file_path: str = None) -> List[TradeFill]:
-
-        filters = [TradeFill.timestamp >= start_timestamp]
-        if config_file_path is not None:
-            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
-        query: Query = (session
-                        .query(TradeFill)
-                        .filter(*filters)
-                        .order_by(TradeFill.timestamp.desc()))
-        if number_of_rows is None:
-            result: List[TradeFill] = query.all() or []
-        else:
-            result: List[TradeFill] = query.limit(number_of_rows).all() or []
-
-        # Get the latest 100 trades in ascending timestamp order
-        result.reverse()
-        return result
+        trades: List[TradeFill] = await self.trade_fill_reader.get_trades(
+            int(self.init_time * 1e3),
+            with_orders=True)
+        if len(trades) == 0:
+            self.notify("No past trades to export.")
+            return
+        self.placeholder_mode = True
+        self.app.hide_input = True
+        path = global_config_map["log_file_path"].value
+        if path is None:
+            path = DEFAULT_LOG_FILE_PATH
+        file_name = await self.prompt_new_export_file_name(path)
+        file_path = os.path.join(path, file_name)
+        try:
+            df: pd.DataFrame = TradeFill.to_pandas(trades)
+            df.to_csv(file_path, header=True)
+            self.notify(f"Successfully exported trades to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting trades to {path}: {e}")
+        self.app.change_prompt(prompt=">>> ")
+        self.placeholder_mode = False
+        self.app.hide_input = False
@@ -40,28 +40,35 @@ class HistoryCommand:
     def history(self,  # type: HummingbotApplication
                 days: float = 0,
                 verbose: bool = False,
-                precision: Optional[int] = None
+                precision: Optional[int] = None,
+                archived: bool = False
                 ):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.history, days, verbose, precision)
+            self.ev_loop.call_soon_threadsafe(self.history, days, verbose, precision, archived)
             return
 
         if self.strategy_file_name is None:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            if self.strategy_name != "celo_arb":
-                safe_ensure_future(self.history_report(start_time, trades, precision))
+        safe_ensure_future(self._history(start_time, verbose, precision, archived))
+
+    async def _history(self,  # type: HummingbotApplication
+                       start_time: float,
+                       verbose: bool = False,
+                       precision: Optional[int] = None,
+                       archived: bool = False):
+        trades: List[TradeFill] = await self.trade_fill_reader.get_trades(
+            int(start_time * 1e3),
+            config_file_path=self.strategy_file_name,
+            include_archived=archived)
+        if not trades:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            await self.list_trades(start_time, archived)
+        if self.strategy_name != "celo_arb":
+            await self.history_report(start_time, trades, precision)
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
@@ -202,32 +209,27 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        trades: List[TradeFill] = await self.trade_fill_reader.get_trades(
+            int(start_time * 1e3),
+            config_file_path=self.strategy_file_name)
+        avg_return = await self.history_report(start_time, trades, display_report=False)
         return avg_return
 
-    def list_trades(self,  # type: HummingbotApplication
-                    start_time: float):
-        if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.list_trades, start_time)
-            return
-
+    async def list_trades(self,  # type: HummingbotApplication
+                          start_time: float,
+                          archived: bool = False):
         lines = []
 
-        with self.trade_fill_db.get_new_session() as session:
-            queried_trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
-                config_file_path=self.strategy_file_name)
-            if self.strategy_name == "celo_arb":
-                celo_trades = self.strategy.celo_orders_to_trade_fills()
-                queried_trades = queried_trades + celo_trades
-            df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
+        queried_trades: List[TradeFill] = await self.trade_fill_reader.get_trades(
+            int(start_time * 1e3),
+            number_of_rows=MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT + 1,
+            config_file_path=self.strategy_file_name,
+            with_orders=True,
+            include_archived=archived)
+        if self.strategy_name == "celo_arb":
+            celo_trades = self.strategy.celo_orders_to_trade_fills()
+            queried_trades = queried_trades + celo_trades
+        df: pd.DataFrame = TradeFill.to_pandas(queried_trades)
 
         if len(df) > 0:
             # Check if number of trades exceed maximum number of trades to display
@@ -1,7 +1,8 @@
 from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.utils.async_utils import safe_ensure_future
 import pandas as pd
-from typing import TYPE_CHECKING
+from typing import List, TYPE_CHECKING
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 import threading
@@ -42,12 +43,14 @@ class OrderBookCommand:
         else:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
-        def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
-            joined_df = pd.concat([bids, asks], axis=1)
+        def get_order_book(bids: List[OrderBookRow], asks: List[OrderBookRow]):
+            bids_df = pd.DataFrame(data=[(row.price, row.amount) for row in bids],
+                                   columns=['bid_price', 'bid_volume'],
+                                   dtype="float64")
+            asks_df = pd.DataFrame(data=[(row.price, row.amount) for row in asks],
+                                   columns=['ask_price', 'ask_volume'],
+                                   dtype="float64")
+            joined_df = pd.concat([bids_df, asks_df], axis=1)
             text_lines = ["    " + line for line in format_df_for_printout(joined_df).split("\n")]
             header = f"  market: {market_connector.name} {trading_pair}\n"
             return header + "\n".join(text_lines)
@@ -55,8 +58,16 @@ class OrderBookCommand:
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
+            displayed_levels = None
+            order_book_text = ""
             while self.app.live_updates:
-                await self.cls_display_delay(get_order_book(min(lines, 35)) + "\n\n Press escape key to stop update.", 0.5)
+                bids, asks = order_book.top_levels(min(lines, 35))
+                # The table is only formatted again when the displayed prices or amounts change
+                levels = ([(row.price, row.amount) for row in bids], [(row.price, row.amount) for row in asks])
+                if levels != displayed_levels:
+                    order_book_text = get_order_book(bids, asks)
+                    displayed_levels = levels
+                await self.cls_display_delay(order_book_text + "\n\n Press escape key to stop update.", 0.5)
             self.notify("Stopped live orderbook display update.")
         else:
-            self.notify(get_order_book(lines))
+            self.notify(get_order_book(*order_book.top_levels(lines)))
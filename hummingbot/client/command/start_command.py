@@ -168,7 +168,7 @@ class StartCommand:
                                   restore: Optional[bool] = False):
         try:
             self.start_time = time.time() * 1e3  # Time in milliseconds
-            self.clock = Clock(ClockMode.REALTIME)
+            self.clock = self._create_clock()
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
@@ -181,6 +181,8 @@ class StartCommand:
                             self.notify(f"Restored {len(market.limit_orders)} limit orders on {market.name}...")
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+                if self.clock.clock_mode is ClockMode.EVENT_DRIVEN:
+                    safe_ensure_future(self.wait_till_ready(self._add_event_driven_strategy), loop=self.ev_loop)
             if global_config.global_config_map[global_config.PMM_SCRIPT_ENABLED_KEY].value:
                 pmm_script_file = global_config.global_config_map[global_config.PMM_SCRIPT_FILE_PATH_KEY].value
                 folder = dirname(pmm_script_file)
@@ -206,6 +208,22 @@ class StartCommand:
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _create_clock(self) -> Clock:
+        config_map = global_config.global_config_map
+        if config_map["clock_mode"].value == "event_driven":
+            return Clock(ClockMode.EVENT_DRIVEN,
+                         event_debounce=float(config_map["clock_event_debounce"].value),
+                         event_min_interval=float(config_map["clock_event_min_interval"].value))
+        return Clock(ClockMode.REALTIME)
+
+    def _add_event_driven_strategy(self,  # type: HummingbotApplication
+                                   ):
+        # The order books are only created once the markets are ready
+        order_books = [self.markets[market_name].get_order_book(trading_pair)
+                       for market_name, trading_pairs in self.market_trading_pairs_map.items()
+                       for trading_pair in trading_pairs]
+        self.clock.add_event_driven_iterator(self.strategy, order_books)
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
@@ -2,7 +2,7 @@ import asyncio
 import inspect
 import time
 from collections import deque, OrderedDict
-from typing import Dict, List
+from typing import Any, Dict, List
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -80,6 +80,22 @@ class StatusCommand:
             self._pmm_script_iterator.request_status()
         return status
 
+    async def status_summary(self,  # type: HummingbotApplication
+                             ) -> Dict[str, Any]:
+        """
+        Returns the state of the bot and the status of the running strategy, as served by the status endpoint of the
+        headless mode.
+        """
+        return {
+            "strategy": self.strategy_name,
+            "strategy_file_name": self.strategy_file_name,
+            "running": self.strategy_task is not None and not self.strategy_task.done(),
+            "start_time": self.start_time * 1e-3 if self.start_time is not None else None,
+            "markets_ready": {market_name: market.ready for market_name, market in self.markets.items()},
+            "warnings": [app_warning.warning_msg for app_warning in self._app_warnings],
+            "status": await self.strategy_status(live=True) if self.strategy is not None else None,
+        }
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -1,6 +1,7 @@
 import threading
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.ui.interface_utils import format_df_for_printout
@@ -44,23 +45,32 @@ class TickerCommand:
         else:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
-        def get_ticker():
-            columns = ["Best Bid", "Best Ask", "Mid Price", "Last Trade"]
-            data = [[
+        def get_ticker_data():
+            return [
                 float(market_connector.get_price_by_type(trading_pair, PriceType.BestBid)),
                 float(market_connector.get_price_by_type(trading_pair, PriceType.BestAsk)),
                 float(market_connector.get_price_by_type(trading_pair, PriceType.MidPrice)),
                 float(market_connector.get_price_by_type(trading_pair, PriceType.LastTrade))
-            ]]
-            ticker_df = pd.DataFrame(data=data, columns=columns)
+            ]
+
+        def get_ticker(data):
+            columns = ["Best Bid", "Best Ask", "Mid Price", "Last Trade"]
+            ticker_df = pd.DataFrame(data=[data], columns=columns)
             ticker_df_str = format_df_for_printout(ticker_df)
             return f"   Market: {market_connector.name}\n{ticker_df_str}"
 
         if live:
             await self.stop_live_update()
             self.app.live_updates = True
+            displayed_data = None
+            ticker_text = ""
             while self.app.live_updates:
-                await self.cls_display_delay(get_ticker() + "\n\n Press escape key to stop update.", 1)
+                data = get_ticker_data()
+                # The table is only formatted again when the prices change (NaN prices compare as equal)
+                if displayed_data is None or not np.array_equal(data, displayed_data, equal_nan=True):
+                    ticker_text = get_ticker(data)
+                    displayed_data = data
+                await self.cls_display_delay(ticker_text + "\n\n Press escape key to stop update.", 1)
             self.notify("Stopped live ticker display update.")
         else:
-            self.notify(get_ticker())
+            self.notify(get_ticker(get_ticker_data()))
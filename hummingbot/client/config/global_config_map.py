@@ -7,7 +7,7 @@ from typing import Callable, Optional, Dict
 from tabulate import tabulate_formats
 
 from hummingbot.client.config.config_methods import using_exchange as using_exchange_pointer
-from hummingbot.client.config.config_validators import validate_bool, validate_decimal
+from hummingbot.client.config.config_validators import validate_bool, validate_decimal, validate_int
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.settings import AllConnectorSettings, DEFAULT_KEY_FILE_PATH, DEFAULT_LOG_FILE_PATH
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
@@ -82,6 +82,34 @@ main_config_map = {
                   type_str="bool",
                   required_if=lambda: False,
                   default=False),
+    "metrics_enabled":
+        ConfigVar(key="metrics_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
+    "clock_mode":
+        ConfigVar(key="clock_mode",
+                  prompt=None,
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=lambda s: None if s in {"realtime",
+                                                    "event_driven"} else "Invalid clock mode.",
+                  default="realtime"),
+    "clock_event_debounce":
+        ConfigVar(key="clock_event_debounce",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=Decimal("0")),
+                  default=0.005),
+    "clock_event_min_interval":
+        ConfigVar(key="clock_event_min_interval",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_decimal(v, min_value=Decimal("0")),
+                  default=0.05),
     "strategy_report_interval":
         ConfigVar(key="strategy_report_interval",
                   prompt=None,
@@ -201,6 +229,22 @@ main_config_map = {
                   type_str="str",
                   required_if=lambda: global_config_map.get("db_engine").value != "sqlite",
                   default="dbname"),
+    "db_sqlite_profile":
+        ConfigVar(key="db_sqlite_profile",
+                  prompt="Which SQLite tuning profile would you like to use? (default/performance) >>> ",
+                  type_str="str",
+                  required_if=lambda: False,
+                  validator=lambda s: None if s in {"default",
+                                                    "performance"} else "Invalid SQLite profile.",
+                  default="performance"),
+    "db_archive_after_days":
+        ConfigVar(key="db_archive_after_days",
+                  prompt="After how many days would you like to archive orders and trades out of the trades "
+                         "database? (Enter nothing to never archive) >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  validator=lambda v: validate_int(v, min_value=1),
+                  default=None),
     PMM_SCRIPT_ENABLED_KEY:
         ConfigVar(key=PMM_SCRIPT_ENABLED_KEY,
                   prompt="Would you like to enable PMM script feature? (Yes/No) >>> ",
@@ -423,6 +467,12 @@ paper_trade_config_map = {
                   required_if=lambda: False,
                   type_str="json",
                   ),
+    "paper_trade_queue_position_modelling":
+        ConfigVar(key="paper_trade_queue_position_modelling",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
 }
 
 global_config_map = {**key_config_map, **main_config_map, **color_config_map, **paper_trade_config_map}
@@ -17,6 +17,7 @@ from hummingbot.client.settings import AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
 from hummingbot.client.ui.completer import load_completer
+from hummingbot.client.ui.headless_cli import HeadlessCLI
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
@@ -26,12 +27,15 @@ from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.status_monitor import StatusMonitor as GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_archiver import TradeArchiver
+from hummingbot.model.trade_fill_reader import TradeFillReader
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
@@ -56,14 +60,20 @@ class HummingbotApplication(*commands):
         return s_logger
 
     @classmethod
-    def main_application(cls) -> "HummingbotApplication":
+    def main_application(cls, headless: bool = False) -> "HummingbotApplication":
+        """
+        :param headless: (only used when creating the application) if True, runs without the terminal UI
+        """
         if cls._main_app is None:
-            cls._main_app = HummingbotApplication()
+            cls._main_app = HummingbotApplication(headless=headless)
         return cls._main_app
 
-    def __init__(self):
-        # This is to start fetching trading pairs for auto-complete
-        TradingPairFetcher.get_instance()
+    def __init__(self, headless: bool = False):
+        self.headless = headless
+        if not headless:
+            # This is to start fetching trading pairs for auto-complete
+            TradingPairFetcher.get_instance()
+        MetricsRegistry.get_instance().enabled = bool(global_config_map.get("metrics_enabled").value)
         self.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         self.markets: Dict[str, ExchangeBase] = {}
         # strategy file name and name get assigned value after import or create command
@@ -89,6 +99,7 @@ class HummingbotApplication(*commands):
         self._last_started_strategy_file: Optional[str] = None
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
+        self.trade_fill_reader: Optional[TradeFillReader] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
@@ -99,12 +110,15 @@ class HummingbotApplication(*commands):
 
         command_tabs = self.init_command_tabs()
         self.parser: ThrowingArgumentParser = load_parser(self, command_tabs)
-        self.app = HummingbotCLI(
-            input_handler=self._handle_command,
-            bindings=load_key_bindings(self),
-            completer=load_completer(self),
-            command_tabs=command_tabs
-        )
+        if headless:
+            self.app = HeadlessCLI(input_handler=self._handle_command)
+        else:
+            self.app = HummingbotCLI(
+                input_handler=self._handle_command,
+                bindings=load_key_bindings(self),
+                completer=load_completer(self),
+                command_tabs=command_tabs
+            )
 
         self._init_gateway_monitor()
 
@@ -124,6 +138,16 @@ class HummingbotApplication(*commands):
             self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(db_name)
         else:
             self.trade_fill_db = None
+        self._update_trade_fill_reader()
+
+    def _update_trade_fill_reader(self):
+        if self.trade_fill_reader is not None:
+            if self.trade_fill_db is not None and self.trade_fill_reader.db_path == self.trade_fill_db.db_path:
+                return
+            self.trade_fill_reader.stop()
+            self.trade_fill_reader = None
+        if self.trade_fill_db is not None:
+            self.trade_fill_reader = TradeFillReader(self.trade_fill_db)
 
     @property
     def strategy_config_map(self):
@@ -263,7 +287,10 @@ class HummingbotApplication(*commands):
             conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
 
             if connector_name.endswith("paper_trade") and conn_setting.type == ConnectorType.Exchange:
-                connector = create_paper_trade_market(conn_setting.parent_name, trading_pairs)
+                queue_position_modelling = global_config_map.get("paper_trade_queue_position_modelling").value
+                connector = create_paper_trade_market(conn_setting.parent_name,
+                                                      trading_pairs,
+                                                      queue_position_modelling=queue_position_modelling is True)
                 paper_trade_account_balance = global_config_map.get("paper_trade_account_balance").value
                 if paper_trade_account_balance is not None:
                     for asset, balance in paper_trade_account_balance.items():
@@ -278,6 +305,7 @@ class HummingbotApplication(*commands):
                 connector = connector_class(**init_params)
             self.markets[connector_name] = connector
 
+        self._archive_trade_fills()
         self.markets_recorder = MarketsRecorder(
             self.trade_fill_db,
             list(self.markets.values()),
@@ -286,6 +314,16 @@ class HummingbotApplication(*commands):
         )
         self.markets_recorder.start()
 
+    def _archive_trade_fills(self):
+        archive_after_days = global_config_map.get("db_archive_after_days").value
+        if archive_after_days is None:
+            return
+        try:
+            cutoff_timestamp = int((time.time() - float(archive_after_days) * 24 * 60 * 60) * 1e3)
+            TradeArchiver(self.trade_fill_db).archive(cutoff_timestamp)
+        except Exception:
+            self.logger().error("Unexpected error while archiving the trades database.", exc_info=True)
+
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
             # TODO: refactor to use single instance
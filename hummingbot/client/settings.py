@@ -395,6 +395,8 @@ def gateway_connector_trading_pairs(connector: str) -> List[str]:
 
 MAXIMUM_OUTPUT_PANE_LINE_COUNT = 1000
 MAXIMUM_LOG_PANE_LINE_COUNT = 1000
+# Minimum time in seconds between two redraws of the log pane
+LOG_PANE_REFRESH_INTERVAL = 0.1
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 STRATEGIES: List[str] = get_strategy_list()
@@ -1,11 +1,12 @@
 import asyncio
 import pandas as pd
 
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
 
 from hummingbot.client.ui.custom_widgets import CustomTextArea
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from .tab_base import TabBase
 
 
@@ -54,20 +55,27 @@ class OrderBookTab(TabBase):
         else:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
-        def get_order_book_text(no_lines: int):
-            bids = order_book.snapshot[0][['price', 'amount']].head(no_lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(no_lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
-            joined_df = pd.concat([bids, asks], axis=1)
+        def get_order_book_text(bids: List[OrderBookRow], asks: List[OrderBookRow]):
+            bids_df = pd.DataFrame(data=[(row.price, row.amount) for row in bids],
+                                   columns=['bid_price', 'bid_volume'],
+                                   dtype="float64")
+            asks_df = pd.DataFrame(data=[(row.price, row.amount) for row in asks],
+                                   columns=['ask_price', 'ask_volume'],
+                                   dtype="float64")
+            joined_df = pd.concat([bids_df, asks_df], axis=1)
             text_lines = ["" + line for line in joined_df.to_string(index=False).split("\n")]
             header = f"market: {market_connector.name} {trading_pair}\n"
             return header + "\n".join(text_lines)
 
         if live:
+            displayed_levels = None
             while True:
-                order_book_text = get_order_book_text(min(lines, 35))
-                output_field.log(order_book_text, save_log=False)
+                bids, asks = order_book.top_levels(min(lines, 35))
+                # Only the prices and amounts are displayed, the rest of the book changes are ignored
+                levels = ([(row.price, row.amount) for row in bids], [(row.price, row.amount) for row in asks])
+                if levels != displayed_levels:
+                    output_field.log(get_order_book_text(bids, asks), save_log=False)
+                    displayed_levels = levels
                 await asyncio.sleep(0.5)
         else:
-            output_field.log(get_order_book_text(lines))
+            output_field.log(get_order_book_text(*order_book.top_levels(lines)))
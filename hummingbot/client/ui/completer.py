@@ -43,7 +43,7 @@ class HummingbotCompleter(Completer):
         self._connect_option_completer = WordCompleter(CONNECT_OPTIONS, ignore_case=True)
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
-        self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
+        self._history_completer = WordCompleter(["--days", "--verbose", "--precision", "--archived"], ignore_case=True)
         self._gateway_completer = WordCompleter(["create", "config", "connect", "generate-certs", "status", "test-connection", "start", "stop"], ignore_case=True)
         self._gateway_connect_completer = WordCompleter(GATEWAY_CONNECTORS, ignore_case=True)
         self._gateway_config_completer = WordCompleter(hummingbot_application.gateway_config_keys, ignore_case=True)
@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
+import time
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -42,6 +45,8 @@ class CustomBuffer(Buffer):
 class FormattedTextLexer(Lexer):
 
     PROMPT_TEXT = ">>> "
+    # Maximum number of lexed lines kept, the log and output panes keep up to 1000 lines each
+    LINE_CACHE_SIZE = 2000
 
     def __init__(self) -> None:
         super().__init__()
@@ -55,44 +60,68 @@ class FormattedTextLexer(Lexer):
         # Maps specific text to its corresponding UI styles
         self.text_style_tag_map: Dict[str, str] = text_ui_style
 
+        self._style_patterns_key: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._style_patterns: List[Tuple[Pattern, str]] = []
+        self._line_fragments_cache: Dict[str, StyleAndTextTuples] = {}
+
     def get_css_style(self, tag: str) -> str:
         return self.html_tag_css_style_map.get(tag, "")
 
+    def _get_style_patterns(self) -> List[Tuple[Pattern, str]]:
+        # The patterns are compiled again, and the lexed lines discarded, only when the style map changes
+        style_patterns_key = tuple(self.text_style_tag_map.items())
+        if style_patterns_key != self._style_patterns_key:
+            self._style_patterns_key = style_patterns_key
+            self._style_patterns = [(re.compile(special_word), style) for special_word, style in style_patterns_key]
+            self._line_fragments_cache.clear()
+        return self._style_patterns
+
+    def _lex_line(self, current_line: str, style_patterns: List[Tuple[Pattern, str]]) -> StyleAndTextTuples:
+        # Apply styling to command prompt
+        if current_line.startswith(self.PROMPT_TEXT):
+            return [(self.get_css_style("primary-label"), current_line)]
+
+        matched_indexes: List[Tuple[int, int, str]] = sorted((match.start(), match.end(), style)
+                                                             for pattern, style in style_patterns
+                                                             for match in pattern.finditer(current_line))
+        if len(matched_indexes) == 0:
+            return [("", current_line)]
+
+        previous_idx = 0
+        line_fragments = []
+        for start_idx, end_idx, style in matched_indexes:
+            line_fragments.extend([
+                ("", current_line[previous_idx:start_idx]),
+                (self.get_css_style("output-pane"), current_line[start_idx:start_idx + 2]),
+                (self.get_css_style(style), current_line[start_idx + 2:end_idx])
+            ])
+            previous_idx = end_idx
+
+        line_fragments.append(("", current_line[previous_idx:]))
+
+        return line_fragments
+
     def lex_document(self, document: Document) -> Callable[[int], StyleAndTextTuples]:
         lines = document.lines
+        style_patterns = self._get_style_patterns()
+        line_fragments_cache = self._line_fragments_cache
 
         def get_line(lineno: int) -> StyleAndTextTuples:
             "Return the tokens for the given line."
             try:
                 current_line = lines[lineno]
-
-                # Apply styling to command prompt
-                if current_line.startswith(self.PROMPT_TEXT):
-                    return [(self.get_css_style("primary-label"), current_line)]
-
-                matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
-                                                               for special_word, style in self.text_style_tag_map.items()
-                                                               for match in list(re.finditer(special_word, current_line))
-                                                               ]
-                if len(matched_indexes) == 0:
-                    return [("", current_line)]
-
-                previous_idx = 0
-                line_fragments = []
-                for start_idx, end_idx, style in matched_indexes:
-                    line_fragments.extend([
-                        ("", current_line[previous_idx:start_idx]),
-                        (self.get_css_style("output-pane"), current_line[start_idx:start_idx + 2]),
-                        (self.get_css_style(style), current_line[start_idx + 2:end_idx])
-                    ])
-                    previous_idx = end_idx
-
-                line_fragments.append(("", current_line[previous_idx:]))
-
-                return line_fragments
             except IndexError:
                 return []
 
+            line_fragments = line_fragments_cache.get(current_line)
+            if line_fragments is None:
+                line_fragments = self._lex_line(current_line, style_patterns)
+                if len(line_fragments_cache) >= self.LINE_CACHE_SIZE:
+                    # Evict the line cached first
+                    del line_fragments_cache[next(iter(line_fragments_cache))]
+                line_fragments_cache[current_line] = line_fragments
+            return list(line_fragments)
+
         return get_line
 
 
@@ -105,7 +134,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 refresh_interval=0):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -125,6 +155,8 @@ class CustomTextArea:
         self.read_only = read_only
         self.wrap_lines = wrap_lines
         self.max_line_count = max_line_count
+        # Minimum time between two document updates with the logged lines, 0 to update on every log
+        self.refresh_interval = refresh_interval
 
         self.buffer = CustomBuffer(
             document=Document(text, 0),
@@ -184,6 +216,13 @@ class CustomTextArea:
             align=align)
 
         self.log_lines: Deque[str] = deque()
+        # The log lines joined, updated as lines are added and removed instead of joining all the lines on each log
+        self._log_text: str = ""
+        # Logs can be written from other threads (see StdoutProxy)
+        self._log_lock = threading.Lock()
+        self._ev_loop = asyncio.get_event_loop()
+        self._refresh_scheduled = False
+        self._last_refresh_time = 0.0
         self.log(initial_text)
 
     @property
@@ -245,11 +284,41 @@ class CustomTextArea:
             new_lines.append(line)
 
         if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
-            new_text: str = "\n".join(new_lines)
-        if not silent:
-            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+            with self._log_lock:
+                self._append_log_lines(new_lines)
+            if not silent:
+                self._request_refresh()
+        elif not silent:
+            self._set_document_text("\n".join(new_lines))
+
+    def _append_log_lines(self, new_lines: List[str]):
+        new_text = "\n".join(new_lines)
+        self._log_text = f"{self._log_text}\n{new_text}" if len(self.log_lines) > 0 else new_text
+        self.log_lines.extend(new_lines)
+        removed_length = 0
+        while len(self.log_lines) > self.max_line_count:
+            removed_length += len(self.log_lines.popleft()) + 1
+        if removed_length > 0:
+            self._log_text = self._log_text[removed_length:]
+
+    def _request_refresh(self):
+        if self.refresh_interval <= 0:
+            self._refresh_document()
+            return
+        with self._log_lock:
+            if self._refresh_scheduled:
+                # The pending refresh will include the new lines
+                return
+            self._refresh_scheduled = True
+            delay = max(0.0, self._last_refresh_time + self.refresh_interval - time.time())
+        self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, delay, self._refresh_document)
+
+    def _refresh_document(self):
+        with self._log_lock:
+            self._refresh_scheduled = False
+            self._last_refresh_time = time.time()
+            log_text = self._log_text
+        self._set_document_text(log_text)
+
+    def _set_document_text(self, text: str):
+        self.buffer.document = Document(text=text, cursor_position=len(text))
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+
+from hummingbot import init_logging
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.event.events import HummingbotUIEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+s_logger = None
+
+
+class HeadlessCLI(PubSub):
+    """
+    Replaces HummingbotCLI when Hummingbot runs without a terminal UI. Nothing is rendered: the notifications are
+    written to the logs, and there is no input, so any prompt is canceled as if the user had stopped the config.
+    """
+    input_field = None
+    output_field = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self, input_handler: Callable):
+        super().__init__()
+        self.input_handler = input_handler
+        self.to_stop_config: bool = False
+        self.live_updates = False
+        self.prompt_text = ">>> "
+        self.hide_input = False
+        self._exit_event: Optional[asyncio.Event] = None
+
+    def did_start_ui(self):
+        log_level = global_config_map.get("log_level").value
+        init_logging("hummingbot_logs.yml", override_log_level=log_level)
+
+        self.trigger_event(HummingbotUIEvent.Start, self)
+
+    async def run(self):
+        self._exit_event = asyncio.Event()
+        self.did_start_ui()
+        await self._exit_event.wait()
+
+    def exit(self):
+        if self._exit_event is not None:
+            self._exit_event.set()
+
+    def log(self, text: str, save_log: bool = True):
+        # Live updates (e.g. `status --live`) are not saved, they would repeat the same text every second
+        if save_log and text:
+            self.logger().info(text)
+
+    def clear_input(self):
+        pass
+
+    def set_text(self, new_text: str):
+        pass
+
+    def toggle_hide_input(self):
+        self.hide_input = not self.hide_input
+
+    def change_prompt(self, prompt: str, is_password: bool = False):
+        self.prompt_text = prompt
+
+    async def prompt(self, prompt: str, is_password: bool = False) -> str:
+        self.logger().warning(f"No input can be entered in headless mode, canceling the prompt: {prompt.strip()}")
+        self.to_stop_config = True
+        return ""
+
+    def handle_tab_command(self, hummingbot: "HummingbotApplication", command_name: str, kwargs: Dict[str, Any]):
+        self.logger().warning(f"The {command_name} command is not available in headless mode.")
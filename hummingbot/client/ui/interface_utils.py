@@ -15,6 +15,7 @@ from tabulate import tabulate
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_reader import TradesSummary
 
 s_decimal_0 = Decimal("0")
 
@@ -62,39 +63,47 @@ async def start_trade_monitor(trade_monitor):
     trade_monitor.log("Trades: 0, Total P&L: 0.00, Return %: 0.00%")
     return_pcts = []
     pnls = []
+    trades: List[TradeFill] = []
+    last_summary: Optional[TradesSummary] = None
 
     while True:
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
-                    with hb.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
-                            int(hb.init_time * 1e3),
-                            session=session,
+                    start_timestamp = int(hb.init_time * 1e3)
+                    # Only the trades count is queried on every loop, the trades are reloaded when new ones arrived
+                    summary: TradesSummary = await hb.trade_fill_reader.get_trades_summary(
+                        start_timestamp,
+                        config_file_path=hb.strategy_file_name)
+                    if summary != last_summary:
+                        trades = await hb.trade_fill_reader.get_trades(
+                            start_timestamp,
                             config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                                cur_balances = await hb.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-                                return_pcts.append(perf.return_pct)
-                                pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
-                            return_pcts.clear()
-                            pnls.clear()
+                        last_summary = summary
+                    if len(trades) > 0:
+                        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                        for market, symbol in market_info:
+                            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                            cur_balances = await hb.get_current_balances(market)
+                            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+                            return_pcts.append(perf.return_pct)
+                            pnls.append(perf.total_pnl)
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(t.symbol.split("-")[1] for t in trades)
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
+                                          f"Return %: {avg_return:.2%}")
+                        return_pcts.clear()
+                        pnls.clear()
             await _sleep(2)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
             raise
         except Exception:
             hb.logger().exception("start_trade_monitor failed.")
+            await _sleep(2)
 
 
 def format_df_for_printout(
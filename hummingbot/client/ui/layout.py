@@ -18,7 +18,11 @@ from prompt_toolkit.layout.layout import Layout
 from prompt_toolkit.layout.menus import CompletionsMenu
 from prompt_toolkit.widgets import Box, Button, SearchToolbar
 
-from hummingbot.client.settings import MAXIMUM_LOG_PANE_LINE_COUNT, MAXIMUM_OUTPUT_PANE_LINE_COUNT
+from hummingbot.client.settings import (
+    LOG_PANE_REFRESH_INTERVAL,
+    MAXIMUM_LOG_PANE_LINE_COUNT,
+    MAXIMUM_OUTPUT_PANE_LINE_COUNT,
+)
 from hummingbot.client.tab.data_types import CommandTab
 from hummingbot.client.ui.custom_widgets import CustomTextArea as TextArea, FormattedTextLexer
 from hummingbot.core.gateway.status_monitor import Status as GatewayStatus
@@ -154,6 +158,7 @@ def create_log_field(search_field: SearchToolbar):
         read_only=False,
         scrollbar=True,
         max_line_count=MAXIMUM_LOG_PANE_LINE_COUNT,
+        refresh_interval=LOG_PANE_REFRESH_INTERVAL,
         initial_text="Running Logs \n",
         search_field=search_field,
         preview_search=False,
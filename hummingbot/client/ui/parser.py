@@ -87,6 +87,8 @@ def load_parser(hummingbot, command_tabs) -> [ThrowingArgumentParser, Any]:
                                 dest="verbose", help="List all trades")
     history_parser.add_argument("-p", "--precision", default=None, type=int,
                                 dest="precision", help="Level of precions for values displayed")
+    history_parser.add_argument("-a", "--archived", action="store_true", default=False,
+                                dest="archived", help="Include the archived trades")
     history_parser.set_defaults(func=hummingbot.history)
 
     gateway_parser = subparsers.add_parser("gateway", help="Helper comands for Gateway server.")
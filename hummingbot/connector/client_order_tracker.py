@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from decimal import Decimal
 from typing import Callable, Dict, Optional
@@ -21,6 +22,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.logger.logger import HummingbotLogger
 
 cot_logger = None
@@ -58,6 +60,17 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        self._metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        # perf_counter_ns() when the orders pending creation started being tracked, to measure the creation round trip
+        self._tracking_start_times: Dict[str, int] = {}
+        self._order_creation_histogram = self._metrics.histogram(
+            "client_order_tracker.order_creation_round_trip",
+            "Time between the start of the tracking of a new order and its confirmation by the exchange")
+        self._orders_created_counter = self._metrics.counter(
+            "client_order_tracker.orders_created", "Orders confirmed as created by the exchanges")
+        self._orders_failed_counter = self._metrics.counter(
+            "client_order_tracker.orders_failed", "Orders rejected by the exchanges")
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -88,8 +101,11 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        if self._metrics.enabled and order.is_pending_create:
+            self._tracking_start_times[order.client_order_id] = time.perf_counter_ns()
 
     def stop_tracking_order(self, client_order_id: str):
+        self._tracking_start_times.pop(client_order_id, None)
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
@@ -206,6 +222,11 @@ class ClientOrderTracker:
 
     def _trigger_order_creation(self, tracked_order: InFlightOrder, previous_state: OrderState, new_state: OrderState):
         if previous_state == OrderState.PENDING_CREATE and new_state == OrderState.OPEN:
+            tracking_start_time = self._tracking_start_times.pop(tracked_order.client_order_id, None)
+            if self._metrics.enabled:
+                self._orders_created_counter.increment()
+                if tracking_start_time is not None:
+                    self._order_creation_histogram.record(time.perf_counter_ns() - tracking_start_time)
             self.logger().info(
                 f"Created {tracked_order.order_type.name.upper()} {tracked_order.trade_type.name.upper()} order "
                 f"{tracked_order.client_order_id} for {tracked_order.amount} {tracked_order.trading_pair}."
@@ -248,6 +269,8 @@ class ClientOrderTracker:
 
         elif tracked_order.is_failure:
             self._trigger_failure_event(tracked_order)
+            if self._metrics.enabled:
+                self._orders_failed_counter.increment()
             self.logger().info(f"Order {tracked_order.client_order_id} has failed. Order Update: {order_update}")
 
         self.stop_tracking_order(tracked_order.client_order_id)
@@ -262,7 +285,7 @@ class ClientOrderTracker:
         )
 
         if tracked_order:
-            if order_update.new_state == OrderState.FILLED and not tracked_order.is_done:
+            if self._must_wait_for_fills(tracked_order, order_update):
                 try:
                     await asyncio.wait_for(
                         tracked_order.wait_until_completely_filled(),
@@ -272,19 +295,52 @@ class ClientOrderTracker:
                         f"The order fill updates did not arrive on time for {tracked_order.client_order_id}. "
                         f"The complete update will be processed with incomplete information.")
 
-            previous_state: OrderState = tracked_order.current_state
-
-            updated: bool = tracked_order.update_with_order_update(order_update)
-            if updated:
-                self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
-                self._trigger_order_completion(tracked_order, order_update)
+            self._apply_order_update(tracked_order, order_update)
 
         else:
             self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    @staticmethod
+    def _must_wait_for_fills(tracked_order: InFlightOrder, order_update: OrderUpdate) -> bool:
+        return (order_update.new_state == OrderState.FILLED
+                and not tracked_order.is_done
+                and not tracked_order.completely_filled_event.is_set())
+
+    def _apply_order_update(self, tracked_order: InFlightOrder, order_update: OrderUpdate):
+        previous_state: OrderState = tracked_order.current_state
+
+        updated: bool = tracked_order.update_with_order_update(order_update)
+        if updated:
+            self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
+            self._trigger_order_completion(tracked_order, order_update)
+
     def process_order_update(self, order_update: OrderUpdate):
         return safe_ensure_future(self._process_order_update(order_update))
 
+    def process_order_update_nowait(self, order_update: OrderUpdate) -> bool:
+        """
+        Applies the order update synchronously, without scheduling a task, when it does not have to wait for the
+        trade fills of the order (i.e. in every case but a FILLED update arriving before the fills it depends on).
+        :param order_update: the order update to apply
+        :return: False if the update has to wait for the fills, in which case it has not been applied and has to be
+            processed with `process_order_update`; True otherwise
+        """
+        if not order_update.client_order_id and not order_update.exchange_order_id:
+            self.logger().error("OrderUpdate does not contain any client_order_id or exchange_order_id", exc_info=True)
+            return True
+
+        tracked_order: Optional[InFlightOrder] = self.fetch_order(
+            order_update.client_order_id, order_update.exchange_order_id
+        )
+
+        if tracked_order:
+            if self._must_wait_for_fills(tracked_order, order_update):
+                return False
+            self._apply_order_update(tracked_order, order_update)
+        else:
+            self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
+        return True
+
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
@@ -16,6 +16,7 @@ cdef class ConnectorBase(NetworkIterator):
         public dict _exchange_order_ids
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
+        public dict _trading_pair_quantizers
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
@@ -1,11 +1,13 @@
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.connector_metrics_collector import TradeVolumeMetricCollector
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.trading_pair_quantizer import TradingPairQuantizer
+from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
@@ -63,6 +65,7 @@ cdef class ConnectorBase(NetworkIterator):
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
         self._trade_fee_schema = None
+        self._trading_pair_quantizers = {}  # Dict[trading_pair:str, TradingPairQuantizer]
         self._trade_volume_metric_collector = TradeVolumeMetricCollector.from_configuration(
             connector=self,
             rate_provider=RateOracle.get_instance())
@@ -387,7 +390,19 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def update_trading_pair_quantizers(self, trading_rules: Iterable[TradingRule]):
+        """
+        Precomputes the quantization of every trading pair from its trading rule. Connectors whose price and size
+        quanta are the trading rule increments call this every time they refresh their trading rules, quantization
+        then skips the trading rule lookup and quantum calculation.
+        """
+        self._trading_pair_quantizers = {trading_rule.trading_pair: TradingPairQuantizer.from_trading_rule(trading_rule)
+                                         for trading_rule in trading_rules}
+
     cdef object c_quantize_order_price(self, str trading_pair, object price):
+        quantizer = self._trading_pair_quantizers.get(trading_pair)
+        if quantizer is not None:
+            return quantizer.quantize_price(price)
         if price.is_nan():
             return price
         price_quantum = self.c_get_order_price_quantum(trading_pair, price)
@@ -400,6 +415,9 @@ cdef class ConnectorBase(NetworkIterator):
         return self.c_quantize_order_price(trading_pair, price)
 
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price=s_decimal_NaN):
+        quantizer = self._trading_pair_quantizers.get(trading_pair)
+        if quantizer is not None:
+            return quantizer.quantize_amount(amount)
         order_size_quantum = self.c_get_order_size_quantum(trading_pair, amount)
         return (amount // order_size_quantum) * order_size_quantum
 
@@ -12,6 +12,7 @@ import hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils
 import hummingbot.connector.derivative.binance_perpetual.binance_perpetual_web_utils as web_utils
 import hummingbot.connector.derivative.binance_perpetual.constants as CONSTANTS
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
+from hummingbot.connector.symbol_map_cache import SymbolMapCacheMixin
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -30,7 +31,7 @@ from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
-class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
+class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource, SymbolMapCacheMixin):
     _bpobds_logger: Optional[HummingbotLogger] = None
     _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
     _mapping_initialization_lock = asyncio.Lock()
@@ -110,7 +111,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param domain: the domain of the exchange being used
         :return: True if the mapping has been initialized, False otherwise
         """
-        return domain in cls._trading_pair_symbol_map and len(cls._trading_pair_symbol_map[domain]) > 0
+        return cls.symbol_map_ready(domain)
 
     @classmethod
     async def trading_pair_symbol_map(
@@ -120,13 +121,23 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             api_factory: WebAssistantsFactory = None,
             time_synchronizer: Optional[TimeSynchronizer] = None
     ) -> Mapping[str, str]:
-        if not cls.trading_pair_symbol_map_ready(domain=domain):
-            async with cls._mapping_initialization_lock:
-                # Check condition again (could have been initialized while waiting for the lock to be released)
-                if not cls.trading_pair_symbol_map_ready(domain=domain):
-                    await cls.init_trading_pair_symbols(domain, throttler, api_factory, time_synchronizer)
+        return await cls.ensure_symbol_map(
+            domain,
+            lambda: cls.init_trading_pair_symbols(domain, throttler, api_factory, time_synchronizer))
 
-        return cls._trading_pair_symbol_map[domain]
+    @classmethod
+    def start_trading_pair_symbol_map_refresh(
+            cls,
+            domain: str = CONSTANTS.DOMAIN,
+            throttler: Optional[AsyncThrottler] = None,
+            api_factory: WebAssistantsFactory = None,
+            time_synchronizer: Optional[TimeSynchronizer] = None):
+        """
+        Starts reloading the symbols map of the domain periodically in the background
+        """
+        cls.start_symbol_map_refresh(
+            domain,
+            lambda: cls.init_trading_pair_symbols(domain, throttler, api_factory, time_synchronizer))
 
     @classmethod
     async def init_trading_pair_symbols(
@@ -187,17 +198,12 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             api_factory: Optional[WebAssistantsFactory] = None,
             time_synchronizer: Optional[TimeSynchronizer] = None) -> str:
 
-        symbol_map = await cls.trading_pair_symbol_map(
+        await cls.trading_pair_symbol_map(
             domain=domain,
             throttler=throttler,
             api_factory=api_factory,
             time_synchronizer=time_synchronizer)
-        try:
-            pair = symbol_map[exchange_trading_pair]
-        except KeyError:
-            raise ValueError(f"There is no symbol mapping for exchange trading pair {exchange_trading_pair}")
-
-        return pair
+        return cls.trading_pair_for_symbol(exchange_trading_pair, domain)
 
     @classmethod
     async def convert_to_exchange_trading_pair(
@@ -208,17 +214,12 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             api_factory: Optional[WebAssistantsFactory] = None,
             time_synchronizer: Optional[TimeSynchronizer] = None) -> str:
 
-        symbol_map = await cls.trading_pair_symbol_map(
+        await cls.trading_pair_symbol_map(
             domain=domain,
             throttler=throttler,
             api_factory=api_factory,
             time_synchronizer=time_synchronizer)
-        try:
-            symbol = symbol_map.inverse[hb_trading_pair]
-        except KeyError:
-            raise ValueError(f"There is no symbol mapping for trading pair {hb_trading_pair}")
-
-        return symbol
+        return cls.symbol_for_trading_pair(hb_trading_pair, domain)
 
     @staticmethod
     async def get_snapshot(
@@ -366,16 +367,24 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             finally:
                 ws and await ws.disconnect()
 
+    async def _load_trading_pair_for_symbol(self, symbol: str) -> str:
+        return await self.convert_from_exchange_trading_pair(
+            exchange_trading_pair=symbol,
+            domain=self._domain,
+            throttler=self._throttler,
+            api_factory=self._api_factory,
+            time_synchronizer=self._time_synchronizer)
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             msg = await self._message_queue[CONSTANTS.DIFF_STREAM_ID].get()
             timestamp: float = time.time()
-            msg.data["data"]["s"] = await self.convert_from_exchange_trading_pair(
-                exchange_trading_pair=msg.data["data"]["s"],
-                domain=self._domain,
-                throttler=self._throttler,
-                api_factory=self._api_factory,
-                time_synchronizer=self._time_synchronizer)
+            symbol = msg.data["data"]["s"]
+            if self.symbol_map_ready(self._domain):
+                # Plain dictionary lookup once the shared symbols map is loaded
+                msg.data["data"]["s"] = self.trading_pair_for_symbol(symbol, self._domain)
+            else:
+                msg.data["data"]["s"] = await self._load_trading_pair_for_symbol(symbol)
             order_book_message: OrderBookMessage = BinancePerpetualOrderBook.diff_message_from_exchange(
                 msg.data, timestamp
             )
@@ -384,12 +393,12 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             msg = await self._message_queue[CONSTANTS.TRADE_STREAM_ID].get()
-            msg.data["data"]["s"] = await self.convert_from_exchange_trading_pair(
-                exchange_trading_pair=msg.data["data"]["s"],
-                domain=self._domain,
-                throttler=self._throttler,
-                api_factory=self._api_factory,
-                time_synchronizer=self._time_synchronizer)
+            symbol = msg.data["data"]["s"]
+            if self.symbol_map_ready(self._domain):
+                # Plain dictionary lookup once the shared symbols map is loaded
+                msg.data["data"]["s"] = self.trading_pair_for_symbol(symbol, self._domain)
+            else:
+                msg.data["data"]["s"] = await self._load_trading_pair_for_symbol(symbol)
             trade_message: OrderBookMessage = BinancePerpetualOrderBook.trade_message_from_exchange(msg.data)
             output.put_nowait(trade_message)
 
@@ -426,12 +435,10 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 funding_info_message: WSResponse = await self._message_queue[CONSTANTS.FUNDING_INFO_STREAM_ID].get()
                 data: Dict[str, Any] = funding_info_message.data["data"]
 
-                trading_pair: str = await self.convert_from_exchange_trading_pair(
-                    exchange_trading_pair=data["s"],
-                    domain=self._domain,
-                    throttler=self._throttler,
-                    api_factory=self._api_factory,
-                    time_synchronizer=self._time_synchronizer)
+                if self.symbol_map_ready(self._domain):
+                    trading_pair: str = self.trading_pair_for_symbol(data["s"], self._domain)
+                else:
+                    trading_pair: str = await self._load_trading_pair_for_symbol(data["s"])
 
                 if trading_pair not in self._trading_pairs:
                     continue
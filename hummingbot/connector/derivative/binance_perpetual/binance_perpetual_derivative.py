@@ -4,7 +4,7 @@ import time
 import warnings
 from collections import defaultdict
 from decimal import Decimal
-from typing import Any, AsyncIterable, Dict, List, Optional
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional
 
 from async_timeout import timeout
 
@@ -18,11 +18,22 @@ from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_auth im
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book_tracker import (
     BinancePerpetualOrderBookTracker
 )
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_polling_scheduler import (
+    BinancePerpetualPollingScheduler
+)
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_data_source import \
     BinancePerpetualUserStreamDataSource
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_events import (
+    MARGIN_CALL_EVENT_TYPE,
+    AccountUpdateRecord,
+    OrderTradeUpdateRecord,
+    PositionUpdateRecord,
+    decode_account_update,
+    decode_user_stream_event,
+)
 from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
 from hummingbot.connector.derivative.position import Position
-from hummingbot.connector.exchange_base import ExchangeBase, s_decimal_NaN
+from hummingbot.connector.exchange_base import ExchangeBase, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.perpetual_trading import PerpetualTrading
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
@@ -125,6 +136,9 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         self._last_poll_timestamp = 0
         self._budget_checker = PerpetualBudgetChecker(self)
         self._client_order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self)
+        self._polling_scheduler = BinancePerpetualPollingScheduler(
+            min_interval=self.UPDATE_ORDER_STATUS_MIN_INTERVAL,
+            max_interval=self.LONG_POLL_INTERVAL)
 
     @property
     def name(self) -> str:
@@ -195,6 +209,11 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         It starts tracking order books, polling trading rules, updating statuses, and tracking user data.
         """
         self._order_book_tracker.start()
+        BinancePerpetualAPIOrderBookDataSource.start_trading_pair_symbol_map_refresh(
+            domain=self._domain,
+            throttler=self._throttler,
+            api_factory=self._api_factory,
+            time_synchronizer=self._binance_time_synchronizer)
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
             await self._get_position_mode()
@@ -590,6 +609,7 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         self._funding_fee_poll_notifier = asyncio.Event()
 
         self._order_book_tracker.stop()
+        BinancePerpetualAPIOrderBookDataSource.stop_symbol_map_refresh(self._domain)
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
         if self._user_stream_tracker_task is not None:
@@ -631,6 +651,8 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         """
         Wait for new messages from _user_stream_tracker.user_stream queue and processes them according to their
         message channels. The respective UserStreamDataSource queues these messages.
+        Order, trade and known position updates are applied without awaiting, so a burst of messages already in the
+        queue is processed in a single pass of the event loop.
         """
         async for event_message in self._iter_user_event_queue():
             try:
@@ -642,101 +664,124 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
                 await self._sleep(5.0)
 
     async def _process_user_stream_event(self, event_message: Dict[str, Any]):
-        event_type = event_message.get("e")
-        if event_type == "ORDER_TRADE_UPDATE":
-            order_message = event_message.get("o")
-            client_order_id = order_message.get("c", None)
-
-            tracked_order: InFlightOrder = self._client_order_tracker.fetch_order(client_order_id)
-            if not tracked_order:
-                return
-
-            trade_id: str = str(order_message["t"])
+        if not self._process_user_stream_event_nowait(event_message):
+            # Only account updates with positions that are not tracked yet need to request the positions
+            await self._update_positions()
+            self._process_account_update(decode_account_update(event_message))
 
-            if trade_id != "0":  # Indicates that there has been a trade
-
-                fee_asset = order_message.get("N", tracked_order.quote_asset)
-                fee_amount = Decimal(order_message.get("n", "0"))
-                position_side = order_message.get("ps", "LONG")
-                position_action = (PositionAction.OPEN
-                                   if (tracked_order.trade_type is TradeType.BUY and position_side == "LONG"
-                                       or tracked_order.trade_type is TradeType.SELL and position_side == "SHORT")
-                                   else PositionAction.CLOSE)
-                flat_fees = [] if fee_amount == Decimal("0") else [TokenAmount(amount=fee_amount, token=fee_asset)]
-
-                fee = TradeFeeBase.new_perpetual_fee(
-                    fee_schema=self.trade_fee_schema(),
-                    position_action=position_action,
-                    percent_token=fee_asset,
-                    flat_fees=flat_fees,
-                )
-
-                trade_update: TradeUpdate = TradeUpdate(
-                    trade_id=trade_id,
-                    client_order_id=client_order_id,
-                    exchange_order_id=str(order_message["i"]),
-                    trading_pair=tracked_order.trading_pair,
-                    fill_timestamp=order_message["T"] * 1e-3,
-                    fill_price=Decimal(order_message["L"]),
-                    fill_base_amount=Decimal(order_message["l"]),
-                    fill_quote_amount=Decimal(order_message["L"]) * Decimal(order_message["l"]),
-                    fee=fee,
-                )
-                self._client_order_tracker.process_trade_update(trade_update)
+    def _process_user_stream_event_nowait(self, event_message: Dict[str, Any]) -> bool:
+        """
+        Processes a user stream event synchronously.
+        :return: False if the event is an account update for a position that is not tracked yet, in which case nothing
+            has been applied and it has to be processed with `_process_user_stream_event`; True otherwise
+        """
+        record = decode_user_stream_event(event_message)
+        if isinstance(record, OrderTradeUpdateRecord):
+            self._process_order_trade_update(record)
+        elif isinstance(record, AccountUpdateRecord):
+            if any(self._is_new_position(position_update) for position_update in record.positions):
+                return False
+            self._process_account_update(record)
+        elif event_message.get("e") == MARGIN_CALL_EVENT_TYPE:
+            self._process_margin_call(event_message)
+        return True
+
+    def _process_order_trade_update(self, order_trade_update: OrderTradeUpdateRecord):
+        client_order_id = order_trade_update.client_order_id
+        tracked_order: InFlightOrder = self._client_order_tracker.fetch_order(client_order_id)
+        if not tracked_order:
+            return
+
+        if order_trade_update.has_trade:
+            fee_asset = order_trade_update.fee_asset or tracked_order.quote_asset
+            fee_amount = Decimal(order_trade_update.fee_amount)
+            position_side = order_trade_update.position_side
+            position_action = (PositionAction.OPEN
+                               if (tracked_order.trade_type is TradeType.BUY and position_side == "LONG"
+                                   or tracked_order.trade_type is TradeType.SELL and position_side == "SHORT")
+                               else PositionAction.CLOSE)
+            flat_fees = [] if fee_amount == Decimal("0") else [TokenAmount(amount=fee_amount, token=fee_asset)]
+
+            fee = TradeFeeBase.new_perpetual_fee(
+                fee_schema=self.trade_fee_schema(),
+                position_action=position_action,
+                percent_token=fee_asset,
+                flat_fees=flat_fees,
+            )
 
-            order_update: OrderUpdate = OrderUpdate(
-                trading_pair=tracked_order.trading_pair,
-                update_timestamp=event_message["T"] * 1e-3,
-                new_state=CONSTANTS.ORDER_STATE[order_message["X"]],
+            fill_price = Decimal(order_trade_update.fill_price)
+            fill_base_amount = Decimal(order_trade_update.fill_base_amount)
+            trade_update: TradeUpdate = TradeUpdate(
+                trade_id=order_trade_update.trade_id,
                 client_order_id=client_order_id,
-                exchange_order_id=str(order_message["i"]),
+                exchange_order_id=order_trade_update.exchange_order_id,
+                trading_pair=tracked_order.trading_pair,
+                fill_timestamp=order_trade_update.fill_timestamp,
+                fill_price=fill_price,
+                fill_base_amount=fill_base_amount,
+                fill_quote_amount=fill_price * fill_base_amount,
+                fee=fee,
             )
+            self._client_order_tracker.process_trade_update(trade_update)
+
+        order_update: OrderUpdate = OrderUpdate(
+            trading_pair=tracked_order.trading_pair,
+            update_timestamp=order_trade_update.timestamp,
+            new_state=order_trade_update.new_state,
+            client_order_id=client_order_id,
+            exchange_order_id=order_trade_update.exchange_order_id,
+        )
 
+        # Only a FILLED update arriving before its trade fills has to wait for them in a separate task
+        if not self._client_order_tracker.process_order_update_nowait(order_update):
             self._client_order_tracker.process_order_update(order_update)
 
-        elif event_type == "ACCOUNT_UPDATE":
-            update_data = event_message.get("a", {})
-            # update balances
-            for asset in update_data.get("B", []):
-                asset_name = asset["a"]
-                self._account_balances[asset_name] = Decimal(asset["wb"])
-                self._account_available_balances[asset_name] = Decimal(asset["cw"])
-
-            # update position
-            for asset in update_data.get("P", []):
-                trading_pair = asset["s"]
-                side = PositionSide[asset['ps']]
-                position = self.get_position(trading_pair, side)
-                if position is not None:
-                    amount = Decimal(asset["pa"])
-                    if amount == Decimal("0"):
-                        pos_key = self.position_key(trading_pair, side)
-                        del self._account_positions[pos_key]
-                    else:
-                        position.update_position(position_side=PositionSide[asset["ps"]],
-                                                 unrealized_pnl=Decimal(asset["up"]),
-                                                 entry_price=Decimal(asset["ep"]),
-                                                 amount=Decimal(asset["pa"]))
+    def _is_new_position(self, position_update: PositionUpdateRecord) -> bool:
+        # A closed position that is not tracked does not need to be requested
+        return (self.get_position(position_update.symbol, PositionSide[position_update.position_side]) is None
+                and Decimal(position_update.amount) != s_decimal_0)
+
+    def _process_account_update(self, account_update: AccountUpdateRecord):
+        # update balances
+        for balance_update in account_update.balances:
+            asset_name = balance_update.asset
+            self._account_balances[asset_name] = Decimal(balance_update.wallet_balance)
+            self._account_available_balances[asset_name] = Decimal(balance_update.cross_wallet_balance)
+
+        # update position
+        for position_update in account_update.positions:
+            trading_pair = position_update.symbol
+            side = PositionSide[position_update.position_side]
+            position = self.get_position(trading_pair, side)
+            if position is not None:
+                amount = Decimal(position_update.amount)
+                if amount == s_decimal_0:
+                    pos_key = self.position_key(trading_pair, side)
+                    del self._account_positions[pos_key]
                 else:
-                    await self._update_positions()
-        elif event_type == "MARGIN_CALL":
-            positions = event_message.get("p", [])
-            total_maint_margin_required = Decimal(0)
-            # total_pnl = 0
-            negative_pnls_msg = ""
-            for position in positions:
-                existing_position = self.get_position(position['s'], PositionSide[position['ps']])
-                if existing_position is not None:
-                    existing_position.update_position(position_side=PositionSide[position["ps"]],
-                                                      unrealized_pnl=Decimal(position["up"]),
-                                                      amount=Decimal(position["pa"]))
-                total_maint_margin_required += Decimal(position.get("mm", "0"))
-                if float(position.get("up", 0)) < 1:
-                    negative_pnls_msg += f"{position.get('s')}: {position.get('up')}, "
-            self.logger().warning("Margin Call: Your position risk is too high, and you are at risk of "
-                                  "liquidation. Close your positions or add additional margin to your wallet.")
-            self.logger().info(f"Margin Required: {total_maint_margin_required}. "
-                               f"Negative PnL assets: {negative_pnls_msg}.")
+                    position.update_position(position_side=side,
+                                             unrealized_pnl=Decimal(position_update.unrealized_pnl),
+                                             entry_price=Decimal(position_update.entry_price),
+                                             amount=amount)
+
+    def _process_margin_call(self, event_message: Dict[str, Any]):
+        positions = event_message.get("p", [])
+        total_maint_margin_required = Decimal(0)
+        # total_pnl = 0
+        negative_pnls_msg = ""
+        for position in positions:
+            existing_position = self.get_position(position['s'], PositionSide[position['ps']])
+            if existing_position is not None:
+                existing_position.update_position(position_side=PositionSide[position["ps"]],
+                                                  unrealized_pnl=Decimal(position["up"]),
+                                                  amount=Decimal(position["pa"]))
+            total_maint_margin_required += Decimal(position.get("mm", "0"))
+            if float(position.get("up", 0)) < 1:
+                negative_pnls_msg += f"{position.get('s')}: {position.get('up')}, "
+        self.logger().warning("Margin Call: Your position risk is too high, and you are at risk of "
+                              "liquidation. Close your positions or add additional margin to your wallet.")
+        self.logger().info(f"Margin Required: {total_maint_margin_required}. "
+                           f"Negative PnL assets: {negative_pnls_msg}.")
 
     async def _update_trading_rules(self):
         """
@@ -749,6 +794,7 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
+        self.update_trading_pair_quantizers(trading_rules_list)
 
     def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
@@ -951,13 +997,7 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
             pos_key = self.position_key(trading_pair, position_side)
             if amount != 0:
                 self._account_positions[pos_key] = Position(
-                    trading_pair=await BinancePerpetualAPIOrderBookDataSource.convert_from_exchange_trading_pair(
-                        exchange_trading_pair=trading_pair,
-                        domain=self._domain,
-                        throttler=self._throttler,
-                        api_factory=self._api_factory,
-                        time_synchronizer=self._binance_time_synchronizer,
-                    ),
+                    trading_pair=await self._trading_pair_from_exchange_symbol(trading_pair),
                     position_side=position_side,
                     unrealized_pnl=unrealized_pnl,
                     entry_price=entry_price,
@@ -968,24 +1008,57 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
                 if pos_key in self._account_positions:
                     del self._account_positions[pos_key]
 
-    async def _update_order_fills_from_trades(self):
+    async def _exchange_symbol(self, trading_pair: str) -> str:
+        if BinancePerpetualAPIOrderBookDataSource.symbol_map_ready(self._domain):
+            return BinancePerpetualAPIOrderBookDataSource.symbol_for_trading_pair(trading_pair, self._domain)
+        return await BinancePerpetualAPIOrderBookDataSource.convert_to_exchange_trading_pair(
+            hb_trading_pair=trading_pair,
+            domain=self._domain,
+            throttler=self._throttler,
+            api_factory=self._api_factory,
+            time_synchronizer=self._binance_time_synchronizer)
+
+    async def _trading_pair_from_exchange_symbol(self, symbol: str) -> str:
+        if BinancePerpetualAPIOrderBookDataSource.symbol_map_ready(self._domain):
+            return BinancePerpetualAPIOrderBookDataSource.trading_pair_for_symbol(symbol, self._domain)
+        return await BinancePerpetualAPIOrderBookDataSource.convert_from_exchange_trading_pair(
+            exchange_trading_pair=symbol,
+            domain=self._domain,
+            throttler=self._throttler,
+            api_factory=self._api_factory,
+            time_synchronizer=self._binance_time_synchronizer)
+
+    def _is_order_status_poll_tick(self) -> bool:
         last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
         current_tick = int(self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        if current_tick > last_tick and len(self._client_order_tracker.active_orders) > 0:
+        return current_tick > last_tick and len(self._client_order_tracker.active_orders) > 0
+
+    async def _update_order_fills_from_trades(self):
+        """
+        Requests the trades of the trading pairs with orders due for a status check (see
+        BinancePerpetualPollingScheduler), within the request weight budget left for polling.
+        """
+        if self._is_order_status_poll_tick():
+            active_orders = list(self._client_order_tracker.active_orders.values())
+            due_orders = self._polling_scheduler.orders_due(active_orders, self.current_timestamp)
+            # The trading pairs of the orders waiting for the longest time first
+            trading_pairs = list(dict.fromkeys(order.trading_pair for order in due_orders))
+            budget = self._polling_scheduler.weight_budget(self._throttler, CONSTANTS.REQUEST_WEIGHT)
+            max_trading_pairs = budget // CONSTANTS.ACCOUNT_TRADE_LIST_WEIGHT
+            if len(trading_pairs) > max_trading_pairs:
+                self.logger().debug(f"Deferring the order fills polling of {len(trading_pairs) - max_trading_pairs} "
+                                    f"trading pairs to stay within the request weight budget.")
+                trading_pairs = trading_pairs[:max_trading_pairs]
+            if len(trading_pairs) == 0:
+                return
+
             trading_pairs_to_order_map: Dict[str, Dict[str, Any]] = defaultdict(lambda: {})
-            for order in self._client_order_tracker.active_orders.values():
+            for order in active_orders:
                 trading_pairs_to_order_map[order.trading_pair][order.exchange_order_id] = order
-            trading_pairs = list(trading_pairs_to_order_map.keys())
             tasks = [
                 self._api_request(
                     path=CONSTANTS.ACCOUNT_TRADE_LIST_URL,
-                    params={"symbol": await BinancePerpetualAPIOrderBookDataSource.convert_to_exchange_trading_pair(
-                        hb_trading_pair=trading_pair,
-                        domain=self._domain,
-                        throttler=self._throttler,
-                        api_factory=self._api_factory,
-                        time_synchronizer=self._binance_time_synchronizer
-                    )},
+                    params={"symbol": await self._exchange_symbol(trading_pair)},
                     is_auth_required=True,
                 )
                 for trading_pair in trading_pairs
@@ -1028,65 +1101,115 @@ class BinancePerpetualDerivative(ExchangeBase, PerpetualTrading):
                         )
                         self._client_order_tracker.process_trade_update(trade_update)
 
+    async def _fetch_open_orders(self, trading_pairs: Iterable[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Requests the open orders of the trading pairs, with a single account wide request when it is cheaper than
+        one request per trading pair.
+        :returns: the open orders by client order id, or None if any request failed
+        """
+        trading_pairs = list(trading_pairs)
+        try:
+            if len(trading_pairs) * CONSTANTS.OPEN_ORDERS_WEIGHT >= CONSTANTS.ALL_OPEN_ORDERS_WEIGHT:
+                responses = [await self._api_request(path=CONSTANTS.OPEN_ORDERS_URL,
+                                                     is_auth_required=True,
+                                                     limit_id=CONSTANTS.ALL_OPEN_ORDERS_LIMIT_ID)]
+            else:
+                responses = await safe_gather(*[
+                    self._api_request(path=CONSTANTS.OPEN_ORDERS_URL,
+                                      params={"symbol": await self._exchange_symbol(trading_pair)},
+                                      is_auth_required=True)
+                    for trading_pair in trading_pairs
+                ])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error fetching the open orders.", exc_info=True)
+            return None
+        return {order["clientOrderId"]: order for response in responses for order in response}
+
+    def _process_order_status_response(self, tracked_order: InFlightOrder, order_update: Dict[str, Any]):
+        new_order_update: OrderUpdate = OrderUpdate(
+            trading_pair=tracked_order.trading_pair,
+            update_timestamp=order_update["updateTime"] * 1e-3,
+            new_state=CONSTANTS.ORDER_STATE[order_update["status"]],
+            client_order_id=order_update["clientOrderId"],
+            exchange_order_id=order_update["orderId"],
+        )
+        self._client_order_tracker.process_order_update(new_order_update)
+
     async def _update_order_status(self):
         """
-        Calls the REST API to get order/trade updates for each in-flight order.
+        Calls the REST API to get order updates for the in-flight orders due for a status check (see
+        BinancePerpetualPollingScheduler), within the request weight budget left for polling.
+        When it is cheaper, the open orders of their trading pairs are requested at once and only the orders which are
+        not open anymore are requested one by one.
         """
-        last_tick = int(self._last_poll_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        current_tick = int(self.current_timestamp / self.UPDATE_ORDER_STATUS_MIN_INTERVAL)
-        if current_tick > last_tick and len(self._client_order_tracker.active_orders) > 0:
-            tracked_orders = list(self._client_order_tracker.active_orders.values())
+        if self._is_order_status_poll_tick():
+            self._polling_scheduler.prune(self._client_order_tracker.active_orders.keys())
+            due_orders = self._polling_scheduler.orders_due(self._client_order_tracker.active_orders.values(),
+                                                            self.current_timestamp)
+            budget = self._polling_scheduler.weight_budget(self._throttler, CONSTANTS.REQUEST_WEIGHT)
+
+            orders_to_request = due_orders
+            trading_pairs = set(order.trading_pair for order in due_orders)
+            open_orders_weight = min(len(trading_pairs) * CONSTANTS.OPEN_ORDERS_WEIGHT,
+                                     CONSTANTS.ALL_OPEN_ORDERS_WEIGHT)
+            if open_orders_weight < len(due_orders) * CONSTANTS.ORDER_WEIGHT and open_orders_weight <= budget:
+                open_orders = await self._fetch_open_orders(trading_pairs)
+                if open_orders is not None:
+                    budget -= open_orders_weight
+                    orders_to_request = []
+                    for tracked_order in due_orders:
+                        order_update = open_orders.get(tracked_order.client_order_id)
+                        if order_update is None:
+                            orders_to_request.append(tracked_order)
+                        else:
+                            self._process_order_status_response(tracked_order, order_update)
+                            self._polling_scheduler.record_check(tracked_order.client_order_id,
+                                                                 self.current_timestamp)
+
+            max_orders = budget // CONSTANTS.ORDER_WEIGHT
+            if len(orders_to_request) > max_orders:
+                self.logger().debug(f"Deferring the status update of {len(orders_to_request) - max_orders} orders "
+                                    f"to stay within the request weight budget.")
+                orders_to_request = orders_to_request[:max_orders]
+            if len(orders_to_request) == 0:
+                return
+
             tasks = [
                 self._api_request(
                     path=CONSTANTS.ORDER_URL,
                     params={
-                        "symbol": await BinancePerpetualAPIOrderBookDataSource.convert_to_exchange_trading_pair(
-                            hb_trading_pair=order.trading_pair,
-                            domain=self._domain,
-                            throttler=self._throttler,
-                            api_factory=self._api_factory,
-                            time_synchronizer=self._binance_time_synchronizer
-                        ),
+                        "symbol": await self._exchange_symbol(order.trading_pair),
                         "origClientOrderId": order.client_order_id
                     },
                     method=RESTMethod.GET,
                     is_auth_required=True,
                     return_err=True,
                 )
-                for order in tracked_orders
+                for order in orders_to_request
             ]
             self.logger().debug(f"Polling for order status updates of {len(tasks)} orders.")
             results = await safe_gather(*tasks, return_exceptions=True)
 
-            for order_update, tracked_order in zip(results, tracked_orders):
+            for order_update, tracked_order in zip(results, orders_to_request):
                 client_order_id = tracked_order.client_order_id
                 if client_order_id not in self._client_order_tracker.all_orders:
                     continue
                 if isinstance(order_update, Exception) or "code" in order_update:
                     if not isinstance(order_update, Exception) and \
                             (order_update["code"] == -2013 or order_update["msg"] == "Order does not exist."):
+                        self._polling_scheduler.record_check(client_order_id, self.current_timestamp)
                         await self._client_order_tracker.process_order_not_found(client_order_id)
                     else:
+                        # Not recorded as checked, the order is checked again at the next poll
                         self.logger().network(
                             f"Error fetching status update for the order {client_order_id}: " f"{order_update}."
                         )
                     continue
 
-                new_order_update: OrderUpdate = OrderUpdate(
-                    trading_pair=await BinancePerpetualAPIOrderBookDataSource.convert_from_exchange_trading_pair(
-                        exchange_trading_pair=order_update["symbol"],
-                        domain=self._domain,
-                        throttler=self._throttler,
-                        api_factory=self._api_factory,
-                        time_synchronizer=self._binance_time_synchronizer,
-                    ),
-                    update_timestamp=order_update["updateTime"] * 1e-3,
-                    new_state=CONSTANTS.ORDER_STATE[order_update["status"]],
-                    client_order_id=order_update["clientOrderId"],
-                    exchange_order_id=order_update["orderId"],
-                )
-
-                self._client_order_tracker.process_order_update(new_order_update)
+                self._polling_scheduler.record_check(client_order_id, self.current_timestamp)
+                self._process_order_status_response(tracked_order, order_update)
 
     async def _set_leverage(self, trading_pair: str, leverage: int = 1):
         """
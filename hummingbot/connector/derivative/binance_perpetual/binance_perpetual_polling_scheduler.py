@@ -0,0 +1,71 @@
+from typing import (
+    Dict,
+    Iterable,
+    List,
+)
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+
+class BinancePerpetualPollingScheduler:
+    """
+    Decides which in flight orders the status polling loop checks through the REST API, and how much request weight
+    the loop may use for it.
+
+    The user stream is the main source of order updates, polling is only a fallback. Young orders are the most likely
+    to change, so they are checked at every poll, while older orders are checked less and less often:
+    an order is due for a check when the time since its last check is at least `age * age_factor`, bounded by
+    `min_interval` and `max_interval`.
+    """
+
+    def __init__(self,
+                 min_interval: float,
+                 max_interval: float,
+                 age_factor: float = 0.25,
+                 weight_reserve_pct: float = 0.3):
+        """
+        :param min_interval: the minimum time between two checks of an order
+        :param max_interval: the maximum time between two checks of an order
+        :param age_factor: the interval between two checks of an order, as a fraction of the order's age
+        :param weight_reserve_pct: the share of the request weight limit polling must leave free for trading requests
+        """
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._age_factor = age_factor
+        self._weight_reserve_pct = weight_reserve_pct
+        self._last_check_timestamps: Dict[str, float] = {}
+
+    def check_interval(self, order: InFlightOrder, timestamp: float) -> float:
+        age = max(0.0, timestamp - order.creation_timestamp)
+        return min(max(age * self._age_factor, self._min_interval), self._max_interval)
+
+    def orders_due(self, orders: Iterable[InFlightOrder], timestamp: float) -> List[InFlightOrder]:
+        """
+        :returns: the orders due for a status check, the ones waiting for the longest time (or never checked) first
+        """
+        due_orders = []
+        for order in orders:
+            last_check = self._last_check_timestamps.get(order.client_order_id)
+            if last_check is None or timestamp - last_check >= self.check_interval(order, timestamp):
+                due_orders.append(order)
+        due_orders.sort(key=lambda o: self._last_check_timestamps.get(o.client_order_id, float("-inf")))
+        return due_orders
+
+    def record_check(self, client_order_id: str, timestamp: float):
+        self._last_check_timestamps[client_order_id] = timestamp
+
+    def prune(self, active_client_order_ids: Iterable[str]):
+        """
+        Forgets the check times of the orders which are not tracked anymore.
+        """
+        active_ids = set(active_client_order_ids)
+        for client_order_id in [oid for oid in self._last_check_timestamps if oid not in active_ids]:
+            del self._last_check_timestamps[client_order_id]
+
+    def weight_budget(self, throttler: AsyncThrottler, limit_id: str) -> int:
+        """
+        :returns: the request weight the polling loop can use now without eating into the share reserved for trading
+        """
+        reserve = int(throttler.get_limit(limit_id) * self._weight_reserve_pct)
+        return max(0, throttler.available_capacity(limit_id) - reserve)
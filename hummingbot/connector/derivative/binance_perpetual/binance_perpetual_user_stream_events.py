@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+import hummingbot.connector.derivative.binance_perpetual.constants as CONSTANTS
+from hummingbot.core.data_type.in_flight_order import OrderState
+
+ORDER_TRADE_UPDATE_EVENT_TYPE = "ORDER_TRADE_UPDATE"
+ACCOUNT_UPDATE_EVENT_TYPE = "ACCOUNT_UPDATE"
+MARGIN_CALL_EVENT_TYPE = "MARGIN_CALL"
+
+NO_TRADE_ID = "0"
+
+
+class OrderTradeUpdateRecord(NamedTuple):
+    """
+    The fields of an ORDER_TRADE_UPDATE user stream event used to update an order. Numeric values are kept as the
+    strings received so that they are only converted to Decimal when they are used.
+    """
+    timestamp: float
+    client_order_id: str
+    exchange_order_id: str
+    new_state: OrderState
+    trade_id: str
+    fill_timestamp: float
+    fill_price: str
+    fill_base_amount: str
+    fee_asset: Optional[str]
+    fee_amount: str
+    position_side: str
+
+    @property
+    def has_trade(self) -> bool:
+        return self.trade_id != NO_TRADE_ID
+
+
+class BalanceUpdateRecord(NamedTuple):
+    asset: str
+    wallet_balance: str
+    cross_wallet_balance: str
+
+
+class PositionUpdateRecord(NamedTuple):
+    symbol: str
+    position_side: str
+    amount: str
+    entry_price: str
+    unrealized_pnl: str
+
+
+class AccountUpdateRecord(NamedTuple):
+    timestamp: float
+    balances: List[BalanceUpdateRecord]
+    positions: List[PositionUpdateRecord]
+
+
+UserStreamRecord = Union[OrderTradeUpdateRecord, AccountUpdateRecord]
+
+
+def decode_order_trade_update(event_message: Dict[str, Any]) -> OrderTradeUpdateRecord:
+    order_message = event_message["o"]
+    return OrderTradeUpdateRecord(
+        timestamp=event_message["T"] * 1e-3,
+        client_order_id=order_message.get("c"),
+        exchange_order_id=str(order_message["i"]),
+        new_state=CONSTANTS.ORDER_STATE[order_message["X"]],
+        trade_id=str(order_message["t"]),
+        fill_timestamp=order_message.get("T", event_message["T"]) * 1e-3,
+        fill_price=order_message.get("L", "0"),
+        fill_base_amount=order_message.get("l", "0"),
+        fee_asset=order_message.get("N"),
+        fee_amount=order_message.get("n", "0"),
+        position_side=order_message.get("ps", "LONG"),
+    )
+
+
+def decode_account_update(event_message: Dict[str, Any]) -> AccountUpdateRecord:
+    update_data = event_message.get("a", {})
+    return AccountUpdateRecord(
+        timestamp=event_message.get("T", 0) * 1e-3,
+        balances=[BalanceUpdateRecord(asset=balance["a"],
+                                      wallet_balance=balance["wb"],
+                                      cross_wallet_balance=balance["cw"])
+                  for balance in update_data.get("B", [])],
+        positions=[PositionUpdateRecord(symbol=position["s"],
+                                        position_side=position["ps"],
+                                        amount=position["pa"],
+                                        entry_price=position["ep"],
+                                        unrealized_pnl=position["up"])
+                   for position in update_data.get("P", [])],
+    )
+
+
+def decode_user_stream_event(event_message: Dict[str, Any]) -> Optional[UserStreamRecord]:
+    """
+    Decodes the order and account updates of the user stream into records.
+    :param event_message: the user stream event as received
+    :return: the record of the event, or None for any other event type
+    """
+    event_type = event_message.get("e")
+    if event_type == ORDER_TRADE_UPDATE_EVENT_TYPE:
+        return decode_order_trade_update(event_message)
+    elif event_type == ACCOUNT_UPDATE_EVENT_TYPE:
+        return decode_account_update(event_message)
+    return None
@@ -34,6 +34,7 @@ SERVER_TIME_PATH_URL = "/time"
 # Private API v1 Endpoints
 ORDER_URL = "/order"
 CANCEL_ALL_OPEN_ORDERS_URL = "/allOpenOrders"
+OPEN_ORDERS_URL = "/openOrders"
 ACCOUNT_TRADE_LIST_URL = "/userTrades"
 SET_LEVERAGE_URL = "/leverage"
 GET_INCOME_HISTORY_URL = "/income"
@@ -42,6 +43,14 @@ CHANGE_POSITION_MODE_URL = "/positionSide/dual"
 POST_POSITION_MODE_LIMIT_ID = f"POST{CHANGE_POSITION_MODE_URL}"
 GET_POSITION_MODE_LIMIT_ID = f"GET{CHANGE_POSITION_MODE_URL}"
 
+# Request weights of the endpoints used by the status polling loop.
+# The weight of the open orders request depends on whether it is for one symbol or for all of them
+ORDER_WEIGHT = 1
+ACCOUNT_TRADE_LIST_WEIGHT = 5
+OPEN_ORDERS_WEIGHT = 1
+ALL_OPEN_ORDERS_WEIGHT = 40
+ALL_OPEN_ORDERS_LIMIT_ID = f"{OPEN_ORDERS_URL}/all"
+
 # Private API v2 Endpoints
 ACCOUNT_INFO_URL = "/account"
 POSITION_INFORMATION_URL = "/positionRisk"
@@ -103,13 +112,17 @@ RATE_LIMITS = [
     RateLimit(limit_id=SERVER_TIME_PATH_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=ORDER_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
-              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1),
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=ORDER_WEIGHT),
                              LinkedLimitWeightPair(ORDERS_1MIN, weight=1),
                              LinkedLimitWeightPair(ORDERS_1SEC, weight=1)]),
     RateLimit(limit_id=CANCEL_ALL_OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
+    RateLimit(limit_id=OPEN_ORDERS_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=OPEN_ORDERS_WEIGHT)]),
+    RateLimit(limit_id=ALL_OPEN_ORDERS_LIMIT_ID, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=ALL_OPEN_ORDERS_WEIGHT)]),
     RateLimit(limit_id=ACCOUNT_TRADE_LIST_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
-              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=5)]),
+              linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=ACCOUNT_TRADE_LIST_WEIGHT)]),
     RateLimit(limit_id=SET_LEVERAGE_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
               linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, weight=1)]),
     RateLimit(limit_id=GET_INCOME_HISTORY_URL, limit=MAX_REQUEST, time_interval=ONE_MINUTE,
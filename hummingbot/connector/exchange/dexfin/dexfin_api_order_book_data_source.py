@@ -14,6 +14,7 @@ import hummingbot.connector.exchange.dexfin.dexfin_constants as CONSTANTS
 from hummingbot.connector.exchange.dexfin import dexfin_utils
 from hummingbot.connector.exchange.dexfin import dexfin_web_utils as web_utils
 from hummingbot.connector.exchange.dexfin.dexfin_order_book import DexfinOrderBook
+from hummingbot.connector.symbol_map_cache import SymbolMapCacheMixin
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -28,7 +29,7 @@ from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
-class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
+class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource, SymbolMapCacheMixin):
     HEARTBEAT_TIME_INTERVAL = 30.0
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
@@ -138,7 +139,7 @@ class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :param base_url: the base_url of the exchange being used (either "com" or "us"). Default value is "com"
         :return: True if the mapping has been initialized, False otherwise
         """
-        return base_url in cls._trading_pair_symbol_map and len(cls._trading_pair_symbol_map[base_url]) > 0
+        return cls.symbol_map_ready(base_url)
 
     @classmethod
     async def trading_pair_symbol_map(
@@ -161,18 +162,38 @@ class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         :return: bidirectional mapping between trading pair exchange notation and client notation
         """
+        return await cls.ensure_symbol_map(
+            base_url,
+            lambda: cls._init_trading_pair_symbols(
+                base_url=base_url,
+                api_factory=api_factory,
+                throttler=throttler,
+                time_synchronizer=time_synchronizer))
 
-        if not cls.trading_pair_symbol_map_ready(base_url=base_url):
-            async with cls._mapping_initialization_lock:
-                # Check condition again (could have been initialized while waiting for the lock to be released)
-                if not cls.trading_pair_symbol_map_ready(base_url=base_url):
-                    await cls._init_trading_pair_symbols(
-                        base_url=base_url,
-                        api_factory=api_factory,
-                        throttler=throttler,
-                        time_synchronizer=time_synchronizer)
+    @classmethod
+    def start_trading_pair_symbol_map_refresh(
+            cls,
+            base_url: str = CONSTANTS.REST_URL,
+            api_factory: Optional[WebAssistantsFactory] = None,
+            throttler: Optional[AsyncThrottler] = None,
+            time_synchronizer: Optional[TimeSynchronizer] = None):
+        """
+        Starts reloading the symbols map periodically in the background, so that the synchronous lookups
+        (`trading_pair_for_symbol` and `symbol_for_trading_pair`) stay up to date
 
-        return cls._trading_pair_symbol_map[base_url]
+        :param base_url: the base_url of the exchange being used
+        :param api_factory: the web assistant factory to use to request the symbols information
+        :param throttler: the throttler instance to use to request the symbols information
+        :param time_synchronizer: the synchronizer instance being used to keep track of the time difference with the
+            exchange
+        """
+        cls.start_symbol_map_refresh(
+            base_url,
+            lambda: cls._init_trading_pair_symbols(
+                base_url=base_url,
+                api_factory=api_factory,
+                throttler=throttler,
+                time_synchronizer=time_synchronizer))
 
     @staticmethod
     async def exchange_symbol_associated_to_pair(
@@ -269,6 +290,14 @@ class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def _load_trading_pair_for_symbol(self, symbol: str) -> str:
+        return await DexfinAPIOrderBookDataSource.trading_pair_associated_to_exchange_symbol(
+            symbol=symbol,
+            base_url=self._base_url,
+            api_factory=self._api_factory,
+            throttler=self._throttler,
+            time_synchronizer=self._time_synchronizer)
+
     async def listen_for_trades(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the trade events queue. For each event creates a trade message instance and adds it to the output queue
@@ -282,12 +311,11 @@ class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 if "result" in json_msg:
                     continue
-                trading_pair = await DexfinAPIOrderBookDataSource.trading_pair_associated_to_exchange_symbol(
-                    symbol=json_msg["s"],
-                    base_url=self._base_url,
-                    api_factory=self._api_factory,
-                    throttler=self._throttler,
-                    time_synchronizer=self._time_synchronizer)
+                if self.symbol_map_ready(self._base_url):
+                    # Plain dictionary lookup once the shared symbols map is loaded
+                    trading_pair = self.trading_pair_for_symbol(json_msg["s"], self._base_url)
+                else:
+                    trading_pair = await self._load_trading_pair_for_symbol(json_msg["s"])
                 trade_msg: OrderBookMessage = DexfinOrderBook.trade_message_from_exchange(
                     json_msg, {"trading_pair": trading_pair})
                 output.put_nowait(trade_msg)
@@ -310,12 +338,11 @@ class DexfinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 json_msg = await message_queue.get()
                 if "result" in json_msg:
                     continue
-                trading_pair = await DexfinAPIOrderBookDataSource.trading_pair_associated_to_exchange_symbol(
-                    symbol=json_msg["s"],
-                    base_url=self._base_url,
-                    api_factory=self._api_factory,
-                    throttler=self._throttler,
-                    time_synchronizer=self._time_synchronizer)
+                if self.symbol_map_ready(self._base_url):
+                    # Plain dictionary lookup once the shared symbols map is loaded
+                    trading_pair = self.trading_pair_for_symbol(json_msg["s"], self._base_url)
+                else:
+                    trading_pair = await self._load_trading_pair_for_symbol(json_msg["s"])
                 order_book_message: OrderBookMessage = DexfinOrderBook.diff_message_from_exchange(
                     json_msg, time.time(), {"trading_pair": trading_pair})
                 output.put_nowait(order_book_message)
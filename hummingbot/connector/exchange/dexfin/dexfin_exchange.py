@@ -184,6 +184,11 @@ class DexfinExchange(ExchangeBase):
         - The background task to process the events received through the user stream tracker (websocket connection)
         """
         self._order_book_tracker.start()
+        DexfinAPIOrderBookDataSource.start_trading_pair_symbol_map_refresh(
+            base_url=self._base_url,
+            api_factory=self._api_factory,
+            throttler=self._throttler,
+            time_synchronizer=self._dexfin_time_synchronizer)
         self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
         if self._trading_required:
             self._status_polling_task = safe_ensure_future(self._status_polling_loop())
@@ -201,6 +206,7 @@ class DexfinExchange(ExchangeBase):
         self._poll_notifier = asyncio.Event()
 
         self._order_book_tracker.stop()
+        DexfinAPIOrderBookDataSource.stop_symbol_map_refresh(self._base_url)
         if self._status_polling_task is not None:
             self._status_polling_task.cancel()
         if self._user_stream_tracker_task is not None:
@@ -326,6 +332,12 @@ class DexfinExchange(ExchangeBase):
         :param price: the intended price for the order
         :return: the quantized order amount after applying the trading rules
         """
+        quantizer = self._trading_pair_quantizers.get(trading_pair)
+        if quantizer is not None:
+            if price == s_decimal_0:
+                price = self.get_price(trading_pair, False)
+            return quantizer.quantize_amount_with_limits(amount, price)
+
         trading_rule = self._trading_rules[trading_pair]
         quantized_amount: Decimal = super().quantize_order_amount(trading_pair, amount)
 
@@ -665,6 +677,7 @@ class DexfinExchange(ExchangeBase):
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
+        self.update_trading_pair_quantizers(trading_rules_list)
 
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
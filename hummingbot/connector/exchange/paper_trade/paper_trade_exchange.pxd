@@ -35,6 +35,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         dict _trading_pairs
         object _queued_orders
         dict _quantization_params
+        dict _last_crossing_check_prices
+        bint _queue_position_modelling
+        dict _queue_ahead_amounts
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
@@ -76,6 +79,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef bint c_consume_queue_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr, object trade_quantity)
+    cdef double c_get_resting_amount_at_price(self, str trading_pair, bint is_buy, double price)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
@@ -148,7 +148,15 @@ cdef class PaperTradeExchange(ExchangeBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
-    def __init__(self, order_book_tracker: OrderBookTracker, target_market: type, exchange_name: str):
+    def __init__(self,
+                 order_book_tracker: OrderBookTracker,
+                 target_market: type,
+                 exchange_name: str,
+                 queue_position_modelling: bool = False):
+        """
+        :param queue_position_modelling: when enabled, a limit order resting at the same price as existing liquidity
+        is only filled by trades at its price once the volume queued ahead of it at placement time has traded.
+        """
         order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
         self._order_book_tracker = order_book_tracker
         self._budget_checker = BudgetChecker(exchange=self)
@@ -160,6 +168,9 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        self._last_crossing_check_prices = {}
+        self._queue_position_modelling = queue_position_modelling
+        self._queue_ahead_amounts = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
@@ -229,6 +240,10 @@ cdef class PaperTradeExchange(ExchangeBase):
         else:
             return False
 
+    @property
+    def queue_position_modelling(self) -> bool:
+        return self._queue_position_modelling
+
     @property
     def queued_orders(self) -> List[QueuedOrder]:
         return self._queued_orders
@@ -347,6 +362,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            # A new order may already cross the book, make sure the next tick evaluates this side of the pair
+            self._last_crossing_check_prices.pop((cpp_trading_pair_str, True), None)
+            if self._queue_position_modelling:
+                self._queue_ahead_amounts[order_id] = self.c_get_resting_amount_at_price(trading_pair_str,
+                                                                                         True,
+                                                                                         float(quantized_price))
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -405,6 +426,12 @@ cdef class PaperTradeExchange(ExchangeBase):
                                                                               SingleTradingPairLimitOrders()))
                 map_it = insert_result.first
             limit_orders_collection_ptr = address(deref(map_it).second)
+            # A new order may already cross the book, make sure the next tick evaluates this side of the pair
+            self._last_crossing_check_prices.pop((cpp_trading_pair_str, False), None)
+            if self._queue_position_modelling:
+                self._queue_ahead_amounts[order_id] = self.c_get_resting_amount_at_price(trading_pair_str,
+                                                                                         False,
+                                                                                         float(quantized_price))
             limit_orders_collection_ptr.insert(CPPLimitOrder(
                 cpp_order_id,
                 cpp_trading_pair_str,
@@ -616,6 +643,8 @@ cdef class PaperTradeExchange(ExchangeBase):
         cdef:
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
         try:
+            if self._queue_position_modelling:
+                self._queue_ahead_amounts.pop(deref(orders_it).getClientOrderID().decode("utf8"), None)
             orders_collection_ptr.erase(orders_it)
             if orders_collection_ptr.empty():
                 map_it_ptr[0] = limit_orders_map_ptr.erase(deref(map_it_ptr))
@@ -828,19 +857,34 @@ cdef class PaperTradeExchange(ExchangeBase):
         Trigger limit orders when the opposite side of the order book has crossed the limit order's price.
         This implies someone was ready to fill the limit order, if that limit order was on the market.
 
+        Crossing only depends on the opposite top of book price, so the orders of a pair are only re-evaluated when
+        that price moved or a new order was placed since the previous check.
+
         :param is_buy: are the limit orders on the bid side?
         :param limit_orders_map_ptr: pointer to the limit orders map
         :param map_it_ptr: limit orders map iterator, which implies the trading pair being processed
         """
         cdef:
+            object check_key = (deref(deref(map_it_ptr)).first, is_buy)
             str trading_pair = deref(deref(map_it_ptr)).first.decode("utf8")
-            object opposite_order_book_price = self.c_get_price(trading_pair, is_buy)
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+            double opposite_top_price
+            object opposite_order_book_price
             SingleTradingPairLimitOrders *orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
             SingleTradingPairLimitOrdersIterator orders_it = orders_collection_ptr.begin()
             SingleTradingPairLimitOrdersRIterator orders_rit = orders_collection_ptr.rbegin()
             vector[SingleTradingPairLimitOrdersIterator] process_order_its
             const CPPLimitOrder *cpp_limit_order_ptr = NULL
 
+        try:
+            opposite_top_price = order_book.c_get_price(is_buy)
+        except EnvironmentError:
+            return
+        if self._last_crossing_check_prices.get(check_key) == opposite_top_price:
+            return
+        self._last_crossing_check_prices[check_key] = opposite_top_price
+        opposite_order_book_price = Decimal(opposite_top_price)
+
         if is_buy:
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
@@ -882,6 +926,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
         Trigger limit orders when incoming market orders have crossed the limit order's price.
+        With queue position modelling, orders at exactly the trade price are also filled once the volume queued
+        ahead of them has been consumed by trades.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -908,23 +954,57 @@ cdef class PaperTradeExchange(ExchangeBase):
             orders_rit = orders_collection_ptr.rbegin()
             while orders_rit != orders_collection_ptr.rend():
                 cpp_limit_order_ptr = address(deref(orders_rit))
-                if <object>cpp_limit_order_ptr.getPrice() <= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() < trade_price:
                     break
-                process_order_its.push_back(getIteratorFromReverseIterator(
-                    <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
+                if (<object>cpp_limit_order_ptr.getPrice() > trade_price or
+                        self.c_consume_queue_ahead(cpp_limit_order_ptr, trade_quantity)):
+                    process_order_its.push_back(getIteratorFromReverseIterator(
+                        <reverse_iterator[SingleTradingPairLimitOrdersIterator]>orders_rit))
                 inc(orders_rit)
         else:
             orders_it = orders_collection_ptr.begin()
             while orders_it != orders_collection_ptr.end():
                 cpp_limit_order_ptr = address(deref(orders_it))
-                if <object>cpp_limit_order_ptr.getPrice() >= trade_price:
+                if <object>cpp_limit_order_ptr.getPrice() > trade_price:
                     break
-                process_order_its.push_back(orders_it)
+                if (<object>cpp_limit_order_ptr.getPrice() < trade_price or
+                        self.c_consume_queue_ahead(cpp_limit_order_ptr, trade_quantity)):
+                    process_order_its.push_back(orders_it)
                 inc(orders_it)
 
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef bint c_consume_queue_ahead(self, const CPPLimitOrder *cpp_limit_order_ptr, object trade_quantity):
+        """
+        Reduces the volume queued ahead of a limit order resting at the trade price.
+
+        :returns: True if the order reached the front of the queue and is filled by this trade
+        """
+        cdef:
+            str order_id
+            double remaining_ahead
+        if not self._queue_position_modelling:
+            return False
+        order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+        remaining_ahead = self._queue_ahead_amounts.get(order_id, 0.0) - float(trade_quantity)
+        self._queue_ahead_amounts[order_id] = remaining_ahead
+        return remaining_ahead < 0
+
+    cdef double c_get_resting_amount_at_price(self, str trading_pair, bint is_buy, double price):
+        """
+        :returns: the amount resting in the order book at exactly the given price, on the side of a limit order
+        """
+        cdef:
+            OrderBook order_book = self.c_get_order_book(trading_pair)
+        entries = order_book.bid_entries() if is_buy else order_book.ask_entries()
+        for row in entries:
+            if row.price == price:
+                return row.amount
+            if (is_buy and row.price < price) or (not is_buy and row.price > price):
+                break
+        return 0.0
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
@@ -22,8 +22,12 @@ s_decimal_0 = Decimal("0")
 
 cdef class MockPaperExchange(PaperTradeExchange):
 
-    def __init__(self, trade_fee_schema: Optional[TradeFeeSchema] = None):
-        PaperTradeExchange.__init__(self, MockOrderTracker(), MockPaperExchange, exchange_name="mock")
+    def __init__(self, trade_fee_schema: Optional[TradeFeeSchema] = None, queue_position_modelling: bool = False):
+        PaperTradeExchange.__init__(self,
+                                    MockOrderTracker(),
+                                    MockPaperExchange,
+                                    exchange_name="mock",
+                                    queue_position_modelling=queue_position_modelling)
 
         trade_fee_schema = trade_fee_schema or TradeFeeSchema(
             maker_percent_fee_decimal=Decimal("0"), taker_percent_fee_decimal=Decimal("0")
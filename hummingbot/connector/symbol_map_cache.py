@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class SymbolMapCacheMixin:
+    """
+    Class level index between exchange symbols and client trading pairs, shared by all the instances of an order book
+    data source, with one bidirectional map (bidict from exchange symbol to trading pair) per domain.
+
+    The map of a domain is loaded once with `ensure_symbol_map` and can then be reloaded periodically in the
+    background with `start_symbol_map_refresh`. A reload replaces the whole map, and a failed reload keeps the previous
+    one, so after the warm-up the lookups are plain synchronous dictionary accesses that message parsing loops can run
+    without awaiting.
+
+    Classes using it declare their own `_trading_pair_symbol_map` and `_mapping_initialization_lock` class attributes.
+    """
+    SYMBOL_MAP_REFRESH_INTERVAL = 60 * 60
+
+    _smc_logger: Optional[HummingbotLogger] = None
+    _trading_pair_symbol_map: Dict[str, Mapping[str, str]]
+    _mapping_initialization_lock: asyncio.Lock
+    _symbol_map_refresh_tasks: Dict[Tuple[type, str], asyncio.Task] = {}
+
+    @classmethod
+    def _symbol_map_logger(cls) -> HummingbotLogger:
+        if cls._smc_logger is None:
+            cls._smc_logger = logging.getLogger(__name__)
+        return cls._smc_logger
+
+    @classmethod
+    def symbol_map_ready(cls, domain: str) -> bool:
+        return domain in cls._trading_pair_symbol_map and len(cls._trading_pair_symbol_map[domain]) > 0
+
+    @classmethod
+    def trading_pair_for_symbol(cls, symbol: str, domain: str) -> str:
+        """
+        Synchronous translation of an exchange symbol to the client notation, for use once the map is loaded
+        :raises ValueError: if the symbol is unknown or the map has not been loaded yet
+        """
+        try:
+            return cls._trading_pair_symbol_map[domain][symbol]
+        except KeyError:
+            raise ValueError(f"There is no symbol mapping for exchange trading pair {symbol}")
+
+    @classmethod
+    def symbol_for_trading_pair(cls, trading_pair: str, domain: str) -> str:
+        """
+        Synchronous translation of a trading pair to the exchange notation, for use once the map is loaded
+        :raises ValueError: if the trading pair is unknown or the map has not been loaded yet
+        """
+        try:
+            return cls._trading_pair_symbol_map[domain].inverse[trading_pair]
+        except KeyError:
+            raise ValueError(f"There is no symbol mapping for trading pair {trading_pair}")
+
+    @classmethod
+    async def ensure_symbol_map(cls,
+                                domain: str,
+                                init_function: Callable[[], Awaitable[None]]) -> Mapping[str, str]:
+        """
+        Loads the map of the domain with `init_function` unless it is already loaded
+        :param domain: the domain (or base url) the map belongs to
+        :param init_function: coroutine function requesting the symbols and storing the map in
+            `_trading_pair_symbol_map[domain]`
+        :return: the map of the domain
+        """
+        if not cls.symbol_map_ready(domain):
+            async with cls._mapping_initialization_lock:
+                # Check condition again (could have been initialized while waiting for the lock to be released)
+                if not cls.symbol_map_ready(domain):
+                    await init_function()
+        return cls._trading_pair_symbol_map[domain]
+
+    @classmethod
+    def start_symbol_map_refresh(cls,
+                                 domain: str,
+                                 init_function: Callable[[], Awaitable[None]],
+                                 interval: Optional[float] = None):
+        """
+        Starts reloading the map of the domain every `interval` seconds in the background, unless it is already being
+        reloaded
+        """
+        task = cls._symbol_map_refresh_tasks.get((cls, domain))
+        if task is None or task.done():
+            cls._symbol_map_refresh_tasks[(cls, domain)] = safe_ensure_future(
+                cls._symbol_map_refresh_loop(domain, init_function, interval or cls.SYMBOL_MAP_REFRESH_INTERVAL))
+
+    @classmethod
+    def stop_symbol_map_refresh(cls, domain: str):
+        task = cls._symbol_map_refresh_tasks.pop((cls, domain), None)
+        if task is not None:
+            task.cancel()
+
+    @classmethod
+    async def refresh_symbol_map(cls, domain: str, init_function: Callable[[], Awaitable[None]]):
+        previous_map = cls._trading_pair_symbol_map.get(domain)
+        async with cls._mapping_initialization_lock:
+            await init_function()
+        if not cls.symbol_map_ready(domain) and previous_map:
+            cls._symbol_map_logger().warning(f"Could not refresh the symbols map of {cls.__name__} ({domain}). "
+                                             f"Keeping the previous one.")
+            cls._trading_pair_symbol_map[domain] = previous_map
+
+    @classmethod
+    async def _symbol_map_refresh_loop(cls,
+                                       domain: str,
+                                       init_function: Callable[[], Awaitable[None]],
+                                       interval: float):
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                await cls.refresh_symbol_map(domain, init_function)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                cls._symbol_map_logger().exception(f"Unexpected error refreshing the symbols map of {cls.__name__}.")
@@ -0,0 +1,106 @@
+from decimal import Decimal, InvalidOperation, ROUND_DOWN
+
+from hummingbot.connector.trading_rule import TradingRule
+
+s_decimal_0 = Decimal(0)
+NOTIONAL_SAFETY_FACTOR = Decimal("1.01")
+
+
+class TradingPairQuantizer:
+    """
+    Precomputed price and amount quantization for one trading pair, built once every time the trading rules are
+    refreshed instead of looking up the trading rule and recomputing the quantum on every call.
+
+    When a quantum is a power of ten up to 1 (the usual tick and step sizes), quantization is a single `Decimal.quantize`
+    call using the precomputed exponent. Other quanta fall back to floor division.
+    """
+
+    __slots__ = (
+        "trading_pair",
+        "price_quantum",
+        "amount_quantum",
+        "min_order_size",
+        "max_order_size",
+        "min_notional_size",
+        "min_notional_size_with_buffer",
+        "_price_exponent",
+        "_amount_exponent",
+    )
+
+    def __init__(self,
+                 trading_pair: str,
+                 price_quantum: Decimal,
+                 amount_quantum: Decimal,
+                 min_order_size: Decimal = s_decimal_0,
+                 max_order_size: Decimal = Decimal("1e56"),
+                 min_notional_size: Decimal = s_decimal_0):
+        self.trading_pair = trading_pair
+        self.price_quantum = price_quantum
+        self.amount_quantum = amount_quantum
+        self.min_order_size = min_order_size
+        self.max_order_size = max_order_size
+        self.min_notional_size = min_notional_size
+        # Add 1% as a safety factor in case the prices changed while making the order.
+        self.min_notional_size_with_buffer = min_notional_size * NOTIONAL_SAFETY_FACTOR
+        self._price_exponent = self._power_of_ten_exponent(price_quantum)
+        self._amount_exponent = self._power_of_ten_exponent(amount_quantum)
+
+    @classmethod
+    def from_trading_rule(cls, trading_rule: TradingRule) -> "TradingPairQuantizer":
+        return cls(trading_pair=trading_rule.trading_pair,
+                   price_quantum=Decimal(trading_rule.min_price_increment),
+                   amount_quantum=Decimal(trading_rule.min_base_amount_increment),
+                   min_order_size=Decimal(trading_rule.min_order_size),
+                   max_order_size=Decimal(trading_rule.max_order_size),
+                   min_notional_size=Decimal(trading_rule.min_notional_size))
+
+    @staticmethod
+    def _power_of_ten_exponent(quantum: Decimal):
+        """
+        :returns: the quantum normalized as 1E<exp> if it is a power of ten not above 1, None otherwise. Larger powers
+        of ten (e.g. 10) are left to the floor division, quantizing to them would give values in scientific notation.
+        """
+        if not quantum.is_finite() or quantum <= s_decimal_0:
+            return None
+        normalized = quantum.normalize()
+        digits_tuple = normalized.as_tuple()
+        if digits_tuple.digits != (1,) or digits_tuple.exponent > 0:
+            return None
+        return normalized
+
+    @staticmethod
+    def _quantize(value: Decimal, quantum: Decimal, exponent) -> Decimal:
+        if exponent is not None:
+            try:
+                # ROUND_DOWN truncates towards zero, like the Decimal floor division below
+                return value.quantize(exponent, rounding=ROUND_DOWN)
+            except InvalidOperation:
+                pass
+        return (value // quantum) * quantum
+
+    def quantize_price(self, price: Decimal) -> Decimal:
+        if price.is_nan():
+            return price
+        return self._quantize(price, self.price_quantum, self._price_exponent)
+
+    def quantize_amount(self, amount: Decimal) -> Decimal:
+        return self._quantize(amount, self.amount_quantum, self._amount_exponent)
+
+    def quantize_amount_with_limits(self, amount: Decimal, price: Decimal) -> Decimal:
+        """
+        Quantizes the amount and returns 0 if it is below the minimum order size or the minimum notional size at the
+        given price.
+        """
+        quantized_amount = self.quantize_amount(amount)
+        if quantized_amount < self.min_order_size:
+            return s_decimal_0
+        if price * quantized_amount < self.min_notional_size_with_buffer:
+            return s_decimal_0
+        return quantized_amount
+
+    def __repr__(self) -> str:
+        return (f"TradingPairQuantizer(trading_pair='{self.trading_pair}', "
+                f"price_quantum={self.price_quantum}, "
+                f"amount_quantum={self.amount_quantum}, "
+                f"min_order_size={self.min_order_size}, "
+                f"min_notional_size={self.min_notional_size})")
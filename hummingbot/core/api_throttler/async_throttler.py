@@ -67,3 +67,25 @@ class AsyncThrottler(AsyncThrottlerBase):
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
         )
+
+    def get_limit(self, limit_id: str) -> int:
+        """
+        :param limit_id: the limit_id of a RateLimit
+        :return: the capacity of the rate limit per time interval, after applying the configured rate limits share
+        """
+        return self._id_to_limit_map[limit_id].limit
+
+    def available_capacity(self, limit_id: str) -> int:
+        """
+        Returns the capacity of a rate limit still available in its current time window, e.g. for callers deciding
+        how many optional requests they can make without having to wait for capacity.
+        :param limit_id: the limit_id of a RateLimit
+        :return: the remaining capacity (weight units)
+        """
+        rate_limit = self._id_to_limit_map[limit_id]
+        now: float = time.time()
+        capacity_used: int = sum([task.weight
+                                  for task in self._task_logs
+                                  if task.rate_limit.limit_id == limit_id and
+                                  now - task.timestamp - (task.rate_limit.time_interval * self._safety_margin_pct) <= task.rate_limit.time_interval])
+        return max(0, rate_limit.limit - capacity_used)
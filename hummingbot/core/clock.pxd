@@ -1,5 +1,21 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+
+
+cdef class TickSchedule:
+    cdef:
+        double _tick_interval
+        int _priority
+        object _missed_tick_policy
+        double _next_tick
+        double _last_tick_duration
+        double _max_tick_duration
+        int64_t _overrun_count
+        int64_t _missed_tick_count
+        double _last_overrun_log_time
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +26,13 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _event_debounce
+        double _event_min_interval
+        object _wake_up_event
+        dict _event_forwarders
+        dict _event_order_books
+        dict _last_event_ticks
+        set _pending_event_iterators
+        dict _tick_schedules
+
+    cdef c_tick_due_iterator(self, object iterator, TickSchedule schedule, double now)
@@ -3,14 +3,83 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import List, Optional
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
-from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_mode import ClockMode, MissedTickPolicy
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
+# Minimum time between two warnings about the tick overruns of an iterator
+OVERRUN_LOG_INTERVAL = 60.0
+
+cdef object metrics_registry = MetricsRegistry.get_instance()
+cdef object tick_duration_histogram = metrics_registry.histogram(
+    "clock.tick_duration", "Time to tick all the iterators due at a real time clock tick")
+cdef object tick_lag_histogram = metrics_registry.histogram(
+    "clock.tick_lag", "Delay between the time a real time clock tick is due and the time it starts")
+cdef object tick_overruns_counter = metrics_registry.counter(
+    "clock.tick_overruns", "Iterator ticks that took longer than the iterator tick interval")
+
+
+cdef class TickSchedule:
+    """
+    When and in which order the clock ticks an iterator, and how long the iterator ticks take.
+    """
+    def __init__(self, tick_interval: float, priority: int, missed_tick_policy: MissedTickPolicy):
+        self._tick_interval = tick_interval
+        self._priority = priority
+        self._missed_tick_policy = missed_tick_policy
+        self._next_tick = NaN
+        self._last_tick_duration = NaN
+        self._max_tick_duration = NaN
+        self._overrun_count = 0
+        self._missed_tick_count = 0
+        self._last_overrun_log_time = NaN
+
+    @property
+    def tick_interval(self) -> float:
+        return self._tick_interval
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def missed_tick_policy(self) -> MissedTickPolicy:
+        return self._missed_tick_policy
+
+    @property
+    def next_tick(self) -> float:
+        return self._next_tick
+
+    @property
+    def last_tick_duration(self) -> float:
+        return self._last_tick_duration
+
+    @property
+    def max_tick_duration(self) -> float:
+        return self._max_tick_duration
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        The number of ticks that took longer than the tick interval
+        """
+        return self._overrun_count
+
+    @property
+    def missed_tick_count(self) -> int:
+        """
+        The number of tick times that were skipped or coalesced because the iterator (or the process) was late
+        """
+        return self._missed_tick_count
 
 
 cdef class Clock:
@@ -21,12 +90,21 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 event_debounce: float = 0.005,
+                 event_min_interval: float = 0.05):
         """
-        :param clock_mode: either real time mode or back testing mode
+        :param clock_mode: either real time mode, event driven real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param event_debounce: (event driven mode only) time to wait after a top of book change for the following
+        changes before ticking the event driven iterators
+        :param event_min_interval: (event driven mode only) minimum time between two event ticks of an iterator
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +114,14 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._event_debounce = event_debounce
+        self._event_min_interval = event_min_interval
+        self._wake_up_event = asyncio.Event() if clock_mode is ClockMode.EVENT_DRIVEN else None
+        self._event_forwarders = {}
+        self._event_order_books = {}
+        self._last_event_ticks = {}
+        self._pending_event_iterators = set()
+        self._tick_schedules = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -69,32 +155,199 @@ cdef class Clock:
                 (<TimeIterator>iterator).c_stop(self)
         self._current_context = None
 
-    def add_iterator(self, iterator: TimeIterator):
+    def add_iterator(self,
+                     iterator: TimeIterator,
+                     tick_interval: Optional[float] = None,
+                     priority: int = 0,
+                     missed_tick_policy: MissedTickPolicy = MissedTickPolicy.SKIP):
+        """
+        :param iterator: the iterator to tick
+        :param tick_interval: time between two ticks of the iterator, the clock tick size by default
+        :param priority: iterators with a higher priority are ticked first when they are due at the same time,
+        iterators with the same priority are ticked in the order they were added
+        :param missed_tick_policy: what to do with the ticks missed when a tick of the iterator (or of another
+        iterator) took longer than the tick interval
+        """
+        if tick_interval is not None and not tick_interval > 0:
+            raise ValueError(f"The tick interval must be positive (got {tick_interval}).")
+        self._tick_schedules[iterator] = TickSchedule(tick_interval if tick_interval is not None else self._tick_size,
+                                                      priority,
+                                                      missed_tick_policy)
         if self._current_context is not None:
             self._current_context.append(iterator)
+            self._sort_by_priority(self._current_context)
         if self._started:
             (<TimeIterator>iterator).c_start(self, self._current_tick)
         self._child_iterators.append(iterator)
+        self._sort_by_priority(self._child_iterators)
 
     def remove_iterator(self, iterator: TimeIterator):
         if self._current_context is not None and iterator in self._current_context:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._tick_schedules.pop(iterator, None)
+
+    def tick_schedule(self, iterator: TimeIterator) -> TickSchedule:
+        """
+        :return: the tick interval, priority and tick duration statistics of a child iterator
+        """
+        return self._tick_schedules[iterator]
+
+    def _sort_by_priority(self, iterators: List[TimeIterator]):
+        # The sort is stable, so the iterators with the same priority keep the order in which they were added
+        iterators.sort(key=lambda it: -self._tick_schedules[it].priority)
+
+    def add_event_driven_iterator(self, iterator: TimeIterator, order_books: List[OrderBook]):
+        """
+        Ticks the iterator, in addition to the regular ticks, shortly after the top of any of the order books changes.
+        The iterator has to be added to the clock with `add_iterator` too.
+        :param iterator: the iterator to tick on top of book changes
+        :param order_books: the order books whose changes tick the iterator
+        """
+        if self._clock_mode is not ClockMode.EVENT_DRIVEN:
+            raise ValueError("Event driven iterators can only be added to an event driven clock.")
+        self.remove_event_driven_iterator(iterator)
+        forwarder = EventForwarder(lambda _: self._on_top_of_book_change(iterator))
+        for order_book in order_books:
+            order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, forwarder)
+        self._event_forwarders[iterator] = forwarder
+        self._event_order_books[iterator] = list(order_books)
+
+    def remove_event_driven_iterator(self, iterator: TimeIterator):
+        forwarder = self._event_forwarders.pop(iterator, None)
+        for order_book in self._event_order_books.pop(iterator, []):
+            order_book.remove_listener(OrderBookEvent.TopOfBookChangeEvent, forwarder)
+        self._last_event_ticks.pop(iterator, None)
+        self._pending_event_iterators.discard(iterator)
+
+    def _on_top_of_book_change(self, iterator: TimeIterator):
+        self._pending_event_iterators.add(iterator)
+        self._wake_up_event.set()
+
+    async def _wait_for_top_of_book_change(self, timeout: float) -> bool:
+        """
+        Waits up to timeout seconds for a top of book change, then for the debounce time (if there is time left
+        before the timeout) so that the changes received meanwhile are processed in the same event tick.
+        :return: True if there was a change
+        """
+        cdef double deadline = time.time() + timeout
+        try:
+            await asyncio.wait_for(self._wake_up_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        debounce = min(self._event_debounce, deadline - time.time())
+        if debounce > 0:
+            await asyncio.sleep(debounce)
+        return True
+
+    def _run_event_ticks(self):
+        cdef:
+            TimeIterator child_iterator
+            double now = time.time()
+            double next_event_tick
+            double next_wake_up = float("nan")
+
+        self._wake_up_event.clear()
+        pending_iterators = self._pending_event_iterators
+        self._pending_event_iterators = set()
+        for ci in self._current_context:
+            if ci not in pending_iterators:
+                continue
+            next_event_tick = self._last_event_ticks.get(ci, 0) + self._event_min_interval
+            if next_event_tick > now:
+                # Rate limited, the change is processed once the minimum interval has elapsed
+                self._pending_event_iterators.add(ci)
+                if not (next_wake_up <= next_event_tick):
+                    next_wake_up = next_event_tick
+                continue
+            self._last_event_ticks[ci] = now
+            child_iterator = ci
+            try:
+                child_iterator.c_tick(now)
+            except StopIteration:
+                self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+            except Exception:
+                self.logger().error("Unexpected error running clock event tick.", exc_info=True)
+        if next_wake_up == next_wake_up:
+            asyncio.get_event_loop().call_later(next_wake_up - now, self._wake_up_event.set)
 
     async def run(self):
         await self.run_til(float("nan"))
 
+    def _next_tick_time(self, double now) -> float:
+        """
+        Schedules the first tick of the iterators that were not ticked yet.
+        :return: the time the next child iterator is due
+        """
+        cdef:
+            TickSchedule schedule
+            double next_tick_time = NaN
+
+        for ci in self._current_context:
+            schedule = self._tick_schedules[ci]
+            if schedule._next_tick != schedule._next_tick:
+                schedule._next_tick = ((now // schedule._tick_interval) + 1) * schedule._tick_interval
+            if not (next_tick_time <= schedule._next_tick):
+                next_tick_time = schedule._next_tick
+        return next_tick_time
+
+    cdef c_tick_due_iterator(self, object iterator, TickSchedule schedule, double now):
+        cdef:
+            double interval = schedule._tick_interval
+            double tick_time = max(schedule._next_tick, (now // interval) * interval)
+            double latest_tick_time
+            double started
+            double ended
+            double duration
+            int64_t missed_ticks
+
+        # The process was late, only the latest of the tick times that passed is ticked
+        schedule._missed_tick_count += <int64_t>round((tick_time - schedule._next_tick) / interval)
+        if tick_time > self._current_tick:
+            self._current_tick = tick_time
+        started = time.perf_counter()
+        try:
+            (<TimeIterator>iterator).c_tick(tick_time)
+        finally:
+            duration = time.perf_counter() - started
+            ended = time.time()
+            schedule._last_tick_duration = duration
+            if not (schedule._max_tick_duration >= duration):
+                schedule._max_tick_duration = duration
+            if duration > interval:
+                schedule._overrun_count += 1
+                if metrics_registry.enabled:
+                    tick_overruns_counter.increment()
+                if not (ended - schedule._last_overrun_log_time < OVERRUN_LOG_INTERVAL):
+                    schedule._last_overrun_log_time = ended
+                    self.logger().warning(f"{iterator.__class__.__name__} tick took {duration:.3f}s, longer than its "
+                                          f"tick interval of {interval}s ({schedule._overrun_count} overruns so far).")
+
+            schedule._next_tick = tick_time + interval
+            if ended >= schedule._next_tick:
+                latest_tick_time = (ended // interval) * interval
+                missed_ticks = <int64_t>round((latest_tick_time - schedule._next_tick) / interval)
+                if schedule._missed_tick_policy is MissedTickPolicy.COALESCE:
+                    # The tick times that passed are run as a single tick right away
+                    schedule._missed_tick_count += missed_ticks
+                    schedule._next_tick = latest_tick_time
+                else:
+                    schedule._missed_tick_count += missed_ticks + 1
+                    schedule._next_tick = latest_tick_time + interval
+
     async def run_til(self, timestamp: float):
         cdef:
             TimeIterator child_iterator
+            TickSchedule schedule
             double now = time.time()
             double next_tick_time
+            int64_t started = 0
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
-        self._current_tick = (now // self._tick_size) * self._tick_size
+        self._current_tick = max(self._current_tick, (now // self._tick_size) * self._tick_size)
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
@@ -107,28 +360,50 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
-                next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                # Sleep until the next child iterator is due
+                next_tick_time = self._next_tick_time(now)
+                if next_tick_time != next_tick_time:
+                    next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                if self._clock_mode is ClockMode.EVENT_DRIVEN:
+                    if await self._wait_for_top_of_book_change(next_tick_time - now):
+                        self._run_event_ticks()
+                        if time.time() < next_tick_time:
+                            continue
+                else:
+                    await asyncio.sleep(next_tick_time - now)
+                now = time.time()
+                if metrics_registry.enabled:
+                    tick_lag_histogram.record_seconds(now - next_tick_time)
+                    started = time.perf_counter_ns()
+                now = max(now, next_tick_time)
+                # The clock time advances with the wall clock, even when no child iterator is due
+                self._current_tick = max(self._current_tick, (now // self._tick_size) * self._tick_size)
 
-                # Run through all the child iterators.
+                # Run through the child iterators that are due, by priority.
                 for ci in self._current_context:
+                    schedule = self._tick_schedules.get(ci)
+                    if schedule is None or schedule._next_tick > now:
+                        continue
                     child_iterator = ci
                     try:
-                        child_iterator.c_tick(self._current_tick)
+                        self.c_tick_due_iterator(child_iterator, schedule, now)
                     except StopIteration:
                         self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                if started > 0:
+                    tick_duration_histogram.record(time.perf_counter_ns() - started)
+                    started = 0
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            TickSchedule schedule
 
         if not self._started:
             for ci in self._child_iterators:
@@ -140,6 +415,10 @@ cdef class Clock:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
+                    schedule = self._tick_schedules[ci]
+                    if schedule._next_tick > self._current_tick:
+                        continue
+                    schedule._next_tick = self._current_tick + schedule._tick_interval
                     child_iterator = ci
                     try:
                         child_iterator.c_tick(self._current_tick)
@@ -6,3 +6,12 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    # Real time mode that also ticks the event driven iterators when the top of their order books changes
+    EVENT_DRIVEN = 3
+
+
+class MissedTickPolicy(Enum):
+    # Wait for the next tick time, dropping the ticks missed while an iterator was late
+    SKIP = 1
+    # Tick once right away in place of all the ticks missed while an iterator was late
+    COALESCE = 2
@@ -1,8 +1,19 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.set cimport set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.data_type.order_book cimport OrderBook
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        set[OrderBookEntry] _composite_bid_book
+        set[OrderBookEntry] _composite_ask_book
 
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_update_composite_level(self, bint is_bid, double price)
+    cdef c_trim_composite_books(self)
+    cdef c_rebuild_composite_books(self)
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -1,10 +1,11 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from typing import Iterator, List, Tuple
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -16,6 +17,10 @@ cdef class CompositeOrderBook(OrderBook):
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
     Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    The composite entries (live amount minus recorded filled amount per price level) are kept in their own books and
+    updated incrementally, only for the price levels touched by a diff or a recorded fill. Reading the composite book
+    then costs the same as reading a live order book.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -28,49 +33,130 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_rebuild_composite_books()
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
-
-        price = order_fill_event.price
-        amount = float(order_fill_event.amount)
-        timestamp = order_fill_event.timestamp
+            bint is_bid
+            double price = float(order_fill_event.price)
+            double amount = float(order_fill_event.amount)
+            int64_t timestamp = int(order_fill_event.timestamp)
+            set[OrderBookEntry] *traded_book
+            set[OrderBookEntry].iterator traded_it
 
         if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
+            is_bid = False
         elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+            is_bid = True
+        else:
+            return
+
+        traded_book = ref(self._traded_order_book._bid_book) if is_bid else ref(self._traded_order_book._ask_book)
+        traded_it = deref(traded_book).find(OrderBookEntry(price, 0, 0))
+        # price is already in the traded book, sum the amount
+        if traded_it != deref(traded_book).end():
+            amount += deref(traded_it).getAmount()
+            deref(traded_book).erase(traded_it)
+        deref(traded_book).insert(OrderBookEntry(price, amount, timestamp))
+        self.c_update_composite_level(is_bid, price)
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        for bid in bids:
+            self.c_update_composite_level(True, bid.getPrice())
+        for ask in asks:
+            self.c_update_composite_level(False, ask.getPrice())
+        self.c_trim_composite_books()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        self.c_rebuild_composite_books()
+
+    cdef c_update_composite_level(self, bint is_bid, double price):
+        """
+        Recomputes the composite entry at the given price level from the live and the traded books.
+        """
+        cdef:
+            set[OrderBookEntry] *live_book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._bid_book) if is_bid
+                                                else ref(self._traded_order_book._ask_book))
+            set[OrderBookEntry] *composite_book = (ref(self._composite_bid_book) if is_bid
+                                                   else ref(self._composite_ask_book))
+            OrderBookEntry key = OrderBookEntry(price, 0, 0)
+            set[OrderBookEntry].iterator live_it = deref(live_book).find(key)
+            set[OrderBookEntry].iterator traded_it = deref(traded_book).find(key)
+            set[OrderBookEntry].iterator composite_it = deref(composite_book).find(key)
+            OrderBookEntry live_entry
+            OrderBookEntry traded_entry
+            double composite_amount
+
+        if composite_it != deref(composite_book).end():
+            deref(composite_book).erase(composite_it)
+
+        # The price level left the live book, the fills recorded against it are no longer relevant
+        if live_it == deref(live_book).end():
+            if traded_it != deref(traded_book).end():
+                deref(traded_book).erase(traded_it)
+            return
+
+        live_entry = deref(live_it)
+        if traded_it == deref(traded_book).end():
+            deref(composite_book).insert(live_entry)
+            return
+
+        traded_entry = deref(traded_it)
+        composite_amount = live_entry.getAmount() - traded_entry.getAmount()
+        if composite_amount > 0:
+            deref(composite_book).insert(OrderBookEntry(price, composite_amount, live_entry.getUpdateId()))
+        else:
+            # The whole level was consumed, cap the recorded amount to what is currently on the book
+            deref(traded_book).erase(traded_it)
+            deref(traded_book).insert(OrderBookEntry(price, live_entry.getAmount(), traded_entry.getUpdateId()))
+
+    cdef c_trim_composite_books(self):
+        """
+        Removes the top composite levels which are no longer in the live book, e.g. removed when overlapping bid and
+        ask entries were truncated.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._composite_bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._composite_ask_book.begin()
+            double price
+
+        while bid_it != self._composite_bid_book.rend():
+            price = deref(bid_it).getPrice()
+            if self._bid_book.find(deref(bid_it)) != self._bid_book.end():
+                break
+            self.c_update_composite_level(True, price)
+            bid_it = self._composite_bid_book.rbegin()
+        while ask_it != self._composite_ask_book.end():
+            price = deref(ask_it).getPrice()
+            if self._ask_book.find(deref(ask_it)) != self._ask_book.end():
+                break
+            self.c_update_composite_level(False, price)
+            ask_it = self._composite_ask_book.begin()
+
+    cdef c_rebuild_composite_books(self):
+        cdef:
+            vector[double] traded_bid_prices
+            vector[double] traded_ask_prices
+            set[OrderBookEntry].iterator it
+            double price
+
+        self._composite_bid_book = self._bid_book
+        self._composite_ask_book = self._ask_book
+        it = self._traded_order_book._bid_book.begin()
+        while it != self._traded_order_book._bid_book.end():
+            traded_bid_prices.push_back(deref(it).getPrice())
+            inc(it)
+        it = self._traded_order_book._ask_book.begin()
+        while it != self._traded_order_book._ask_book.end():
+            traded_ask_prices.push_back(deref(it).getPrice())
+            inc(it)
+        for price in traded_bid_prices:
+            self.c_update_composite_level(True, price)
+        for price in traded_ask_prices:
+            self.c_update_composite_level(False, price)
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -80,115 +166,48 @@ cdef class CompositeOrderBook(OrderBook):
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            set[OrderBookEntry].reverse_iterator it = self._composite_bid_book.rbegin()
+            OrderBookEntry entry
+        while it != self._composite_bid_book.rend():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
+            set[OrderBookEntry].iterator it = self._composite_ask_book.begin()
+            OrderBookEntry entry
+        while it != self._composite_ask_book.end():
+            entry = deref(it)
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            inc(it)
+
+    def top_levels(self, number_of_levels: int) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Returns the best composite bids, by descending price, and the best composite asks, by ascending price.
+        :param number_of_levels: the maximum number of bids and of asks returned
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._composite_bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._composite_ask_book.begin()
+            OrderBookEntry entry
+            list bids = []
+            list asks = []
+        while len(bids) < number_of_levels and bid_it != self._composite_bid_book.rend():
+            entry = deref(bid_it)
+            bids.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(bid_it)
+        while len(asks) < number_of_levels and ask_it != self._composite_ask_book.end():
+            entry = deref(ask_it)
+            asks.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(ask_it)
+        return bids, asks
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *book = ref(self._composite_ask_book) if is_buy else ref(self._composite_bid_book)
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
-
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
-            else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+        if is_buy:
+            return deref(self._composite_ask_book.begin()).getPrice()
+        return deref(self._composite_bid_book.rbegin()).getPrice()
@@ -20,10 +20,18 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef double _emitted_best_bid
+    cdef double _emitted_best_ask
+    cdef double _emitted_best_bid_size
+    cdef double _emitted_best_ask_size
+    cdef double _top_of_book_size_change_threshold
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_apply_diff_levels(self, const double[:] bid_levels, const double[:] ask_levels, int64_t update_id)
+    cdef c_apply_snapshot_levels(self, const double[:] bid_levels, const double[:] ask_levels, int64_t update_id)
+    cdef c_check_top_of_book_change(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -21,13 +21,14 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import LazyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookTopOfBookChangeEvent,
     OrderBookTradeEvent
 )
 
@@ -36,9 +37,34 @@ cimport numpy as np
 ob_logger = None
 NaN = float("nan")
 
+cdef int64_t TOP_OF_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.TopOfBookChangeEvent.value
+
+
+cdef vector[OrderBookEntry] c_entries_from_levels(const double[:] levels, int64_t update_id):
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t i
+    entries.reserve(levels.shape[0] // 2)
+    for i in range(0, levels.shape[0] - 1, 2):
+        entries.push_back(OrderBookEntry(levels[i], levels[i + 1], update_id))
+    return entries
+
+
+cdef inline bint c_price_changed(double price, double previous_price):
+    # NaN (empty side of the book) is considered equal to NaN
+    return not (price == previous_price or (price != price and previous_price != previous_price))
+
+
+cdef inline bint c_size_changed(double size, double previous_size, double threshold):
+    # Size changes are only reported when a threshold is set
+    if threshold != threshold:
+        return False
+    return abs(size - previous_size) > threshold * previous_size
+
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGE_EVENT_TAG = OrderBookEvent.TopOfBookChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -56,6 +82,9 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._emitted_best_bid = self._emitted_best_ask = float("NaN")
+        self._emitted_best_bid_size = self._emitted_best_ask_size = 0
+        self._top_of_book_size_change_threshold = float("NaN")
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -97,6 +126,8 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_check_top_of_book_change()
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -137,6 +168,52 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_check_top_of_book_change()
+
+    cdef c_check_top_of_book_change(self):
+        """
+        Emits a top of book change event if the best bid or ask price changed since the last event, or if the size
+        at one of them changed by more than the size change threshold. Nothing is computed when there is no listener.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            double best_bid = float("NaN")
+            double best_ask = float("NaN")
+            double best_bid_size = 0
+            double best_ask_size = 0
+
+        if self._events.find(TOP_OF_BOOK_CHANGE_EVENT_TAG) == self._events.end():
+            return
+
+        bid_iterator = self._bid_book.rbegin()
+        ask_iterator = self._ask_book.begin()
+        if bid_iterator != self._bid_book.rend():
+            top_bid = deref(bid_iterator)
+            best_bid = top_bid.getPrice()
+            best_bid_size = top_bid.getAmount()
+        if ask_iterator != self._ask_book.end():
+            top_ask = deref(ask_iterator)
+            best_ask = top_ask.getPrice()
+            best_ask_size = top_ask.getAmount()
+
+        if (c_price_changed(best_bid, self._emitted_best_bid)
+                or c_price_changed(best_ask, self._emitted_best_ask)
+                or c_size_changed(best_bid_size, self._emitted_best_bid_size, self._top_of_book_size_change_threshold)
+                or c_size_changed(best_ask_size, self._emitted_best_ask_size, self._top_of_book_size_change_threshold)):
+            self._emitted_best_bid = best_bid
+            self._emitted_best_ask = best_ask
+            self._emitted_best_bid_size = best_bid_size
+            self._emitted_best_ask_size = best_ask_size
+            self.c_trigger_event(TOP_OF_BOOK_CHANGE_EVENT_TAG,
+                                 OrderBookTopOfBookChangeEvent(timestamp=time.time(),
+                                                               best_bid=best_bid,
+                                                               best_bid_size=best_bid_size,
+                                                               best_ask=best_ask,
+                                                               best_ask_size=best_ask_size))
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -162,6 +239,18 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def top_of_book_size_change_threshold(self) -> float:
+        """
+        Relative change of the size at the best bid or ask since the last event (e.g. 0.1 for 10%) that triggers a top
+        of book change event even if the prices did not change. NaN (the default) to only report price changes.
+        """
+        return self._top_of_book_size_change_threshold
+
+    @top_of_book_size_change_threshold.setter
+    def top_of_book_size_change_threshold(self, value: float):
+        self._top_of_book_size_change_threshold = value
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -198,6 +287,41 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diff_levels(self, bid_levels, ask_levels, update_id: int):
+        """
+        Applies diffs given as flat buffers of doubles (e.g. `array("d")`) holding the price and amount of each level.
+        """
+        self.c_apply_diff_levels(bid_levels, ask_levels, update_id)
+
+    cdef c_apply_diff_levels(self, const double[:] bid_levels, const double[:] ask_levels, int64_t update_id):
+        self.c_apply_diffs(c_entries_from_levels(bid_levels, update_id),
+                           c_entries_from_levels(ask_levels, update_id),
+                           update_id)
+
+    def apply_snapshot_levels(self, bid_levels, ask_levels, update_id: int):
+        """
+        Applies a snapshot given as flat buffers of doubles (e.g. `array("d")`) holding the price and amount of each
+        level.
+        """
+        self.c_apply_snapshot_levels(bid_levels, ask_levels, update_id)
+
+    cdef c_apply_snapshot_levels(self, const double[:] bid_levels, const double[:] ask_levels, int64_t update_id):
+        self.c_apply_snapshot(c_entries_from_levels(bid_levels, update_id),
+                              c_entries_from_levels(ask_levels, update_id),
+                              update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        if isinstance(message, LazyOrderBookMessage):
+            self.c_apply_diff_levels(message.bid_levels, message.ask_levels, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        if isinstance(message, LazyOrderBookMessage):
+            self.c_apply_snapshot_levels(message.bid_levels, message.ask_levels, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -263,6 +387,28 @@ cdef class OrderBook(PubSub):
             last_update_id = max(last_update_id, <int64_t>row[2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    def top_levels(self, number_of_levels: int) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Returns the best bids, by descending price, and the best asks, by ascending price, without going through
+        the rest of the order book.
+        :param number_of_levels: the maximum number of bids and of asks returned
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            list bids = []
+            list asks = []
+        while len(bids) < number_of_levels and bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            bids.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(bid_it)
+        while len(asks) < number_of_levels and ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            asks.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+            inc(ask_it)
+        return bids, asks
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -487,6 +633,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 
+from array import array
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
@@ -98,3 +100,89 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+def _parse_levels(levels: List[Any]) -> array:
+    parsed_levels = array("d")
+    for price, amount, *trash in levels:
+        parsed_levels.append(float(price))
+        parsed_levels.append(float(amount))
+    return parsed_levels
+
+
+@total_ordering
+class LazyOrderBookMessage:
+    """
+    Order book message for high volume diff and snapshot streams. The bids and asks are kept as received from the
+    exchange and parsed once, on first use, into flat arrays of price and amount pairs that the order book applies
+    directly (see `OrderBook.apply_diff_message`). The update id and trading pair are cached after the first lookup.
+    The content must not be modified once the message has been created.
+    """
+    __slots__ = ("type", "content", "timestamp", "_update_id", "_trading_pair", "_bid_levels", "_ask_levels",
+                 "_bids", "_asks")
+
+    def __init__(self, message_type: OrderBookMessageType, content: Dict[str, any], timestamp: Optional[float] = None):
+        self.type = message_type
+        self.content = content
+        self.timestamp = timestamp
+        self._update_id = None
+        self._trading_pair = None
+        self._bid_levels = None
+        self._ask_levels = None
+        self._bids = None
+        self._asks = None
+
+    def __repr__(self) -> str:
+        return f"LazyOrderBookMessage(type={self.type!r}, content={self.content!r}, timestamp={self.timestamp!r})"
+
+    @property
+    def update_id(self) -> int:
+        if self._update_id is None:
+            self._update_id = OrderBookMessage.update_id.fget(self)
+        return self._update_id
+
+    @property
+    def trading_pair(self) -> str:
+        if self._trading_pair is None:
+            self._trading_pair = self.content["trading_pair"]
+        return self._trading_pair
+
+    @property
+    def bid_levels(self) -> array:
+        """
+        The bids as a flat array of doubles: price and amount of the first level, then of the second level...
+        """
+        if self._bid_levels is None:
+            self._bid_levels = _parse_levels(self.content["bids"])
+        return self._bid_levels
+
+    @property
+    def ask_levels(self) -> array:
+        """
+        The asks as a flat array of doubles: price and amount of the first level, then of the second level...
+        """
+        if self._ask_levels is None:
+            self._ask_levels = _parse_levels(self.content["asks"])
+        return self._ask_levels
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        if self._bids is None:
+            levels = self.bid_levels
+            self._bids = [OrderBookRow(levels[i], levels[i + 1], self.update_id) for i in range(0, len(levels), 2)]
+        return self._bids
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        if self._asks is None:
+            levels = self.ask_levels
+            self._asks = [OrderBookRow(levels[i], levels[i + 1], self.update_id) for i in range(0, len(levels), 2)]
+        return self._asks
+
+    first_update_id = OrderBookMessage.first_update_id
+    trade_id = OrderBookMessage.trade_id
+    has_update_id = OrderBookMessage.has_update_id
+    has_trade_id = OrderBookMessage.has_trade_id
+    __eq__ = OrderBookMessage.__eq__
+    __lt__ = OrderBookMessage.__lt__
+    __hash__ = None
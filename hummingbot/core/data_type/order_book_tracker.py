@@ -11,8 +11,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +25,8 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker():
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_MIN_INTERVAL: float = 5.0  # minimum seconds between two snapshot requests of the same trading pair
+    RESYNC_BUFFER_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -46,6 +50,29 @@ class OrderBookTracker():
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
+        # Sequence gap detection, for the diff messages specifying their first update id
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.RESYNC_BUFFER_SIZE))
+        self._last_resync_timestamps: Dict[str, float] = {}
+        self._sequence_gaps_count: Dict[str, int] = defaultdict(int)
+        self._resyncs_count: Dict[str, int] = defaultdict(int)
+
+        # Top of book change listeners, with the trading pairs they listen to (None for all of them)
+        self._top_of_book_listeners: List[Tuple[EventListener, Optional[List[str]], Optional[float]]] = []
+
+        self._metrics: MetricsRegistry = MetricsRegistry.get_instance()
+        self._diff_latency_histogram = self._metrics.histogram(
+            "order_book_tracker.diff_latency",
+            "Time between the timestamp of an order book diff message and its application to the order book")
+        self._diffs_applied_counter = self._metrics.counter(
+            "order_book_tracker.diffs_applied", "Order book diff messages applied to the order books")
+        self._sequence_gaps_counter = self._metrics.counter(
+            "order_book_tracker.sequence_gaps", "Order book diff sequence gaps, each one causing a new snapshot")
+        self._diff_queue_size_gauge = self._metrics.gauge(
+            "order_book_tracker.diff_queue_size", "Order book diff messages waiting to be routed")
+
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
         self._order_book_diff_listener_task: Optional[asyncio.Task] = None
@@ -68,6 +95,55 @@ class OrderBookTracker():
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def sequence_gaps_count(self) -> Dict[str, int]:
+        """
+        Number of sequence gaps detected in the diff messages of each trading pair
+        """
+        return dict(self._sequence_gaps_count)
+
+    @property
+    def resyncs_count(self) -> Dict[str, int]:
+        """
+        Number of order books of each trading pair restored from a new snapshot after a sequence gap
+        """
+        return dict(self._resyncs_count)
+
+    def add_top_of_book_listener(self,
+                                 listener: EventListener,
+                                 trading_pairs: Optional[List[str]] = None,
+                                 size_change_threshold: Optional[float] = None):
+        """
+        Subscribes a listener to the top of book change events (OrderBookTopOfBookChangeEvent) of the order books,
+        including the ones not initialized yet. The order book emitting the event is the listener's
+        `current_event_caller`.
+        :param listener: the listener, the caller has to keep a reference to it (listeners are weak referenced)
+        :param trading_pairs: the trading pairs of the order books to listen to, all of them if not specified
+        :param size_change_threshold: if specified, the relative change of the size at the best bid or ask that also
+            triggers an event (see `OrderBook.top_of_book_size_change_threshold`)
+        """
+        self._top_of_book_listeners.append((listener, trading_pairs, size_change_threshold))
+        for trading_pair in self._order_books:
+            self._subscribe_top_of_book_listener(trading_pair, listener, trading_pairs, size_change_threshold)
+
+    def remove_top_of_book_listener(self, listener: EventListener):
+        self._top_of_book_listeners = [subscription for subscription in self._top_of_book_listeners
+                                       if subscription[0] is not listener]
+        for order_book in self._order_books.values():
+            order_book.remove_listener(OrderBookEvent.TopOfBookChangeEvent, listener)
+
+    def _subscribe_top_of_book_listener(self,
+                                        trading_pair: str,
+                                        listener: EventListener,
+                                        trading_pairs: Optional[List[str]],
+                                        size_change_threshold: Optional[float]):
+        if trading_pairs is not None and trading_pair not in trading_pairs:
+            return
+        order_book: OrderBook = self._order_books[trading_pair]
+        if size_change_threshold is not None:
+            order_book.top_of_book_size_change_threshold = size_change_threshold
+        order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, listener)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -137,6 +213,11 @@ class OrderBookTracker():
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        if len(self._resync_tasks) > 0:
+            for _, task in self._resync_tasks.items():
+                task.cancel()
+            self._resync_tasks.clear()
+        self._resync_buffers.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -175,6 +256,8 @@ class OrderBookTracker():
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+            for listener, trading_pairs, size_change_threshold in self._top_of_book_listeners:
+                self._subscribe_top_of_book_listener(trading_pair, listener, trading_pairs, size_change_threshold)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
@@ -195,6 +278,8 @@ class OrderBookTracker():
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
+                if self._metrics.enabled:
+                    self._diff_queue_size_gauge.set(self._order_book_diff_stream.qsize())
 
                 if trading_pair not in self._tracking_message_queues:
                     messages_queued += 1
@@ -250,6 +335,82 @@ class OrderBookTracker():
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _is_sequenced(message: OrderBookMessage) -> bool:
+        # Only the diffs specifying the first update id they include allow checking that none is missing
+        return "first_update_id" in message.content
+
+    def _last_update_id(self, trading_pair: str) -> int:
+        return self._last_update_ids.get(trading_pair, self._order_books[trading_pair].snapshot_uid)
+
+    def _apply_diff_message(self, trading_pair: str, message: OrderBookMessage) -> bool:
+        """
+        Applies a diff message to the order book of the trading pair, unless the order book is being restored from a
+        new snapshot or there is a gap between the last update applied and the first update of the diff. In both
+        cases the diff is buffered to be applied once the order book is restored.
+        :return: True if the diff has been applied
+        """
+        if trading_pair in self._resync_tasks:
+            self._resync_buffers[trading_pair].append(message)
+            return False
+
+        if self._is_sequenced(message):
+            last_update_id = self._last_update_id(trading_pair)
+            if message.update_id <= last_update_id:
+                # Already included in the order book
+                return False
+            if last_update_id > 0 and message.first_update_id > last_update_id + 1:
+                self._sequence_gaps_count[trading_pair] += 1
+                if self._metrics.enabled:
+                    self._sequence_gaps_counter.increment()
+                self.logger().warning(f"Order book diff sequence gap detected for {trading_pair} (updates "
+                                      f"{last_update_id + 1} to {message.first_update_id - 1} are missing). "
+                                      f"Requesting a new snapshot.")
+                self._resync_buffers[trading_pair].append(message)
+                self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+                return False
+
+        self._order_books[trading_pair].apply_diff_message(message)
+        self._past_diffs_windows[trading_pair].append(message)
+        self._last_update_ids[trading_pair] = message.update_id
+        if self._metrics.enabled:
+            self._diffs_applied_counter.increment()
+            # Not recorded for the messages without timestamp, or with a timestamp in milliseconds (in the future)
+            latency = time.time() - message.timestamp if message.timestamp is not None else -1
+            if latency >= 0:
+                self._diff_latency_histogram.record_seconds(latency)
+        return True
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Restores the order book of a trading pair from a new snapshot after a sequence gap, then applies the diffs
+        received meanwhile. Snapshot requests of the same trading pair are at least RESYNC_MIN_INTERVAL seconds apart.
+        """
+        try:
+            delay = self._last_resync_timestamps.get(trading_pair, 0) + self.RESYNC_MIN_INTERVAL - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_resync_timestamps[trading_pair] = time.time()
+            new_order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+            self._order_books[trading_pair].apply_snapshot(list(new_order_book.bid_entries()),
+                                                           list(new_order_book.ask_entries()),
+                                                           new_order_book.snapshot_uid)
+            self._last_update_ids[trading_pair] = new_order_book.snapshot_uid
+            self._resyncs_count[trading_pair] += 1
+            self.logger().info(f"Order book for {trading_pair} restored from a new snapshot.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The buffered diffs will detect the gap again and request a new snapshot
+            self.logger().network(f"Unexpected error requesting a new order book snapshot for {trading_pair}.",
+                                  exc_info=True)
+        finally:
+            self._resync_tasks.pop(trading_pair, None)
+
+        buffered_messages: Deque[OrderBookMessage] = self._resync_buffers.pop(trading_pair, deque())
+        for message in buffered_messages:
+            self._apply_diff_message(trading_pair, message)
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
@@ -269,9 +430,8 @@ class OrderBookTracker():
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if self._apply_diff_message(trading_pair, message):
+                        diff_messages_accepted += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -282,6 +442,8 @@ class OrderBookTracker():
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._last_update_ids[trading_pair] = max([message.update_id] +
+                                                              [diff.update_id for diff in past_diffs])
                     self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
@@ -31,6 +31,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    TopOfBookChangeEvent = 902
 
 
 class TokenApprovalEvent(Enum):
@@ -141,6 +142,14 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTopOfBookChangeEvent(NamedTuple):
+    timestamp: float
+    best_bid: float
+    best_bid_size: float
+    best_ask: float
+    best_ask_size: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -89,7 +89,8 @@ class StatusMonitor:
             build_config_namespace_keys(config_list, config_dict)
 
             self.gateway_config_keys = config_list
-            self._app.app.input_field.completer = load_completer(self._app)
+            if self._app.app.input_field is not None:
+                self._app.app.input_field.completer = load_completer(self._app)
         except Exception:
             self.logger().error("Error fetching gateway configs. Please check that Gateway service is online. ",
                                 exc_info=True)
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aiohttp import web
+
+
+async def start_status_server(get_status: Callable[[], Awaitable[Dict[str, Any]]],
+                              host: str = "localhost",
+                              port: int = 8213,
+                              get_metrics: Optional[Callable[[], Dict[str, Any]]] = None) -> web.AppRunner:
+    """
+    Serves the status of the bot as JSON on `GET /status`, for the deployments running without the terminal UI.
+    :param get_status: coroutine function returning the status
+    :param get_metrics: function returning the performance metrics, served on `GET /metrics` if given
+    :return: the runner of the server, to stop it with `cleanup()`
+    """
+    async def status_handler(_: web.Request) -> web.Response:
+        try:
+            status = await get_status()
+        except Exception as e:
+            logging.getLogger(__name__).error("Unexpected error getting the bot status.", exc_info=True)
+            return web.json_response({"error": str(e)}, status=500)
+        return web.json_response(status, dumps=lambda obj: json.dumps(obj, default=str))
+
+    async def metrics_handler(_: web.Request) -> web.Response:
+        return web.json_response(get_metrics())
+
+    app = web.Application()
+    app.router.add_get("/status", status_handler)
+    if get_metrics is not None:
+        app.router.add_get("/metrics", metrics_handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
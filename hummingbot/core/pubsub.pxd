@@ -18,10 +18,18 @@ cdef class PubSub:
     cdef:
         Events _events
         object __weakref__
+        int _dispatch_depth
+        list _pending_listener_changes
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_defer_listener_change(self, int change, int64_t event_tag, object listener)
+    cdef c_apply_pending_listener_changes(self)
+    cdef list c_live_listeners(self, EventListenersCollection *listeners_ptr, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
+    cdef c_call_listener(self, EventListener listener, int64_t event_tag, object arg)
+    cdef c_end_dispatch(self)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_trigger_events(self, int64_t event_tag, list args)
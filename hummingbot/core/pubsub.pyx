@@ -15,13 +15,23 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
+import time
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.utils.metrics import MetricsRegistry
 
 class_logger = None
+cdef object metrics_registry = MetricsRegistry.get_instance()
+cdef object trigger_event_histogram = metrics_registry.histogram(
+    "pubsub.trigger_event_duration", "Time to call all the listeners of an event")
+
+# Listener changes requested while events are being dispatched, applied once the dispatch is over
+cdef int LISTENER_ADDED = 1
+cdef int LISTENER_REMOVED = 2
+cdef int DEAD_LISTENERS_REMOVED = 3
 
 
 cdef class PubSub:
@@ -40,7 +50,11 @@ cdef class PubSub:
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
     3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+       Only when they come across a dead listener, since they dereference every listener weak reference anyway.
+
+    The listener sets are not copied to dispatch an event. Instead, the listeners added or removed by the listeners
+    being called (and the GC of the dead listeners found meanwhile) are deferred until the dispatch is over: like with
+    a copy, the listeners removed during a dispatch are still called, and the listeners added are not.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -54,6 +68,8 @@ cdef class PubSub:
 
     def __init__(self):
         self._events = Events()
+        self._dispatch_depth = 0
+        self._pending_listener_changes = None
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -67,6 +83,9 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def trigger_events(self, event_tag: Enum, messages: List[any]):
+        self.c_trigger_events(event_tag.value, messages)
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -77,6 +96,10 @@ cdef class PubSub:
             EventListenersCollection *listeners_ptr
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
+        if self._dispatch_depth > 0:
+            self.c_defer_listener_change(LISTENER_ADDED, event_tag, listener)
+            return
+
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
             deref(listeners_ptr).insert(listener_wrapper)
@@ -94,6 +117,10 @@ cdef class PubSub:
             object listener_weakref = PyWeakref_NewRef(listener, None)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
             EventListenersIterator lit
+        if self._dispatch_depth > 0:
+            self.c_defer_listener_change(LISTENER_REMOVED, event_tag, listener)
+            return
+
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
@@ -109,6 +136,10 @@ cdef class PubSub:
             object listener_weakref
             EventListenersIterator lit
             vector[EventListenersIterator] lit_to_remove
+        if self._dispatch_depth > 0:
+            self.c_defer_listener_change(DEAD_LISTENERS_REMOVED, event_tag, None)
+            return
+
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
@@ -123,47 +154,119 @@ cdef class PubSub:
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+    cdef c_defer_listener_change(self, int change, int64_t event_tag, object listener):
+        if self._pending_listener_changes is None:
+            self._pending_listener_changes = []
+        self._pending_listener_changes.append((change, event_tag, listener))
 
+    cdef c_apply_pending_listener_changes(self):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            list changes = self._pending_listener_changes
+            int change
+            int64_t event_tag
+        self._pending_listener_changes = None
+        for change, event_tag, listener in changes:
+            if change == LISTENER_ADDED:
+                self.c_add_listener(event_tag, listener)
+            elif change == LISTENER_REMOVED:
+                self.c_remove_listener(event_tag, listener)
+            else:
+                self.c_remove_dead_listeners(event_tag)
 
+    cdef list c_live_listeners(self, EventListenersCollection *listeners_ptr, int64_t event_tag):
+        """
+        Dereferences the listener weak references, and requests the GC of the event listeners if some are dead.
+        """
+        cdef:
+            EventListenersIterator lit = deref(listeners_ptr).begin()
+            object listener
+            list live_listeners = []
+            bint has_dead_listeners = False
+        while lit != deref(listeners_ptr).end():
+            listener = <object>PyWeakref_GetObject(<object>deref(lit).get())
+            if listener is None:
+                has_dead_listeners = True
+            else:
+                live_listeners.append(listener)
+            inc(lit)
+        if has_dead_listeners:
+            self.c_remove_dead_listeners(event_tag)
+        return live_listeners
+
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef EventsIterator it = self._events.find(event_tag)
         if it == self._events.end():
             return []
+        return self.c_live_listeners(address(deref(it).second), event_tag)
 
-        retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
-        return retval
+    cdef c_call_listener(self, EventListener listener, int64_t event_tag, object arg):
+        try:
+            listener.c_set_event_info(event_tag, self)
+            listener.c_call(arg)
+        except Exception:
+            self.c_log_exception(event_tag, arg)
+        finally:
+            listener.c_set_event_info(0, None)
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+    cdef c_end_dispatch(self):
+        self._dispatch_depth -= 1
+        if self._dispatch_depth == 0 and self._pending_listener_changes is not None:
+            self.c_apply_pending_listener_changes()
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
             EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
-            EventListener typed_listener
+            EventListenersCollection *listeners_ptr
+            EventListenersIterator lit
+            object listener
+            bint has_dead_listeners = False
+            int64_t started = 0
         if it == self._events.end():
             return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            try:
-                typed_listener.c_set_event_info(event_tag, self)
-                typed_listener.c_call(arg)
-            except Exception:
-                self.c_log_exception(event_tag, arg)
-            finally:
-                typed_listener.c_set_event_info(0, None)
+        if metrics_registry.enabled:
+            started = time.perf_counter_ns()
+        # The listener set can't change until the end of the dispatch, see c_defer_listener_change()
+        listeners_ptr = address(deref(it).second)
+        self._dispatch_depth += 1
+        try:
+            lit = deref(listeners_ptr).begin()
+            while lit != deref(listeners_ptr).end():
+                listener = <object>PyWeakref_GetObject(<object>deref(lit).get())
+                inc(lit)
+                if listener is None:
+                    has_dead_listeners = True
+                    continue
+                self.c_call_listener(listener, event_tag, arg)
+            if has_dead_listeners:
+                self.c_remove_dead_listeners(event_tag)
+        finally:
+            self.c_end_dispatch()
+        if started > 0:
+            trigger_event_histogram.record(time.perf_counter_ns() - started)
+
+    cdef c_trigger_events(self, int64_t event_tag, list args):
+        """
+        Triggers a burst of events of the same type, looking up their listeners once. Each event is dispatched to all
+        the listeners before the next one, as with successive c_trigger_event() calls, except that the listeners
+        added or removed during the burst are only added or removed at its end.
+        """
+        cdef:
+            EventsIterator it = self._events.find(event_tag)
+            list listeners
+            int64_t started = 0
+        if it == self._events.end() or len(args) == 0:
+            return
+
+        if metrics_registry.enabled:
+            started = time.perf_counter_ns()
+        self._dispatch_depth += 1
+        try:
+            listeners = self.c_live_listeners(address(deref(it).second), event_tag)
+            for arg in args:
+                for listener in listeners:
+                    self.c_call_listener(listener, event_tag, arg)
+        finally:
+            self.c_end_dispatch()
+        if started > 0:
+            trigger_event_histogram.record(time.perf_counter_ns() - started)
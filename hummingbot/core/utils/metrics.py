@@ -0,0 +1,232 @@
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Number of bits of the sub-bucket index of the latency histograms: every power of 2 range is split in
+# 2 ** (SUB_BUCKET_BITS - 1) buckets, i.e. the recorded values are kept with a relative precision of 1/128
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF_COUNT = SUB_BUCKET_COUNT >> 1
+
+
+class Counter:
+    """
+    A value that only increases, e.g. a number of messages processed.
+    """
+    __slots__ = ("name", "description", "_value")
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def increment(self, amount: int = 1):
+        self._value += amount
+
+    def reset(self):
+        self._value = 0
+
+    def snapshot(self) -> int:
+        return self._value
+
+
+class Gauge:
+    """
+    A value that is set to its current level, e.g. the size of a queue.
+    """
+    __slots__ = ("name", "description", "_value")
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def set(self, value: float):
+        self._value = value
+
+    def reset(self):
+        self._value = 0.0
+
+    def snapshot(self) -> float:
+        return self._value
+
+
+class LatencyHistogram:
+    """
+    Distribution of durations in nanoseconds, with HdrHistogram style buckets: the values are counted in buckets that
+    are linear within each power of 2, so that any value is known with a relative precision better than 1%, from
+    nanoseconds to hours, in at most a few thousand buckets. Recording a value is a bucket index computation and a
+    dict update.
+    """
+    __slots__ = ("name", "description", "_counts", "_count", "_total", "_min", "_max")
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self.reset()
+
+    @staticmethod
+    def _bucket_index(value: int) -> int:
+        if value < SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return shift * SUB_BUCKET_HALF_COUNT + (value >> shift)
+
+    @staticmethod
+    def _bucket_highest_value(index: int) -> int:
+        if index < SUB_BUCKET_COUNT:
+            return index
+        shift = index // SUB_BUCKET_HALF_COUNT - 1
+        sub_bucket = index - shift * SUB_BUCKET_HALF_COUNT
+        return ((sub_bucket + 1) << shift) - 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def min(self) -> int:
+        return self._min if self._count > 0 else 0
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    def record(self, value_ns: int):
+        if value_ns < 0:
+            value_ns = 0
+        index = self._bucket_index(value_ns)
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+        self._count += 1
+        self._total += value_ns
+        if value_ns < self._min:
+            self._min = value_ns
+        if value_ns > self._max:
+            self._max = value_ns
+
+    def record_seconds(self, value_s: float):
+        self.record(int(value_s * 1e9))
+
+    def percentile(self, pct: float) -> int:
+        """
+        :return: the highest value of the bucket including the pct percentile, capped at the maximum recorded value
+        """
+        if self._count == 0:
+            return 0
+        rank = max(1, int(pct / 100 * self._count + 0.5))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bucket_highest_value(index), self._max)
+        return self._max
+
+    def reset(self):
+        self._counts: Dict[int, int] = {}
+        self._count = 0
+        self._total = 0
+        self._min = 1 << 63
+        self._max = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        :return: the count and distribution of the recorded durations, in microseconds
+        """
+        return {
+            "count": self._count,
+            "min_us": self.min / 1e3,
+            "mean_us": self.mean / 1e3,
+            "p50_us": self.percentile(50) / 1e3,
+            "p90_us": self.percentile(90) / 1e3,
+            "p99_us": self.percentile(99) / 1e3,
+            "p999_us": self.percentile(99.9) / 1e3,
+            "max_us": self.max / 1e3,
+        }
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and latency histograms of the hot paths (order book updates, clock ticks, order placement,
+    REST requests, websocket messages and event dispatch), to size hosts and notice performance degradation.
+
+    The instrumented code records values only when `enabled` is True (`metrics_enabled` global config), so that the
+    cost of disabled metrics is a single attribute check. The values are pulled with `snapshot()`, e.g. from the
+    `/metrics` endpoint of the status server, or written to a JSON file with `export_json()`.
+    """
+    _shared_instance: "MetricsRegistry" = None
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._shared_instance is None:
+            cls._shared_instance = MetricsRegistry()
+        return cls._shared_instance
+
+    def __init__(self, enabled: bool = False):
+        self.enabled: bool = enabled
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._started_timestamp: float = time.time()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """
+        :return: the counter with the given name, created on the first request
+        """
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter(name, description))
+        return counter
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        gauge = self._gauges.get(name)
+        if gauge is None:
+            with self._lock:
+                gauge = self._gauges.setdefault(name, Gauge(name, description))
+        return gauge
+
+    def histogram(self, name: str, description: str = "") -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram(name, description))
+        return histogram
+
+    def reset(self):
+        """
+        Resets the values of all the metrics. The metrics objects remain the same, the instrumented code keeps them.
+        """
+        with self._lock:
+            for metric in list(self._counters.values()) + list(self._gauges.values()) + list(self._histograms.values()):
+                metric.reset()
+            self._started_timestamp = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "started_timestamp": self._started_timestamp,
+                "timestamp": time.time(),
+                "counters": {name: counter.snapshot() for name, counter in sorted(self._counters.items())},
+                "gauges": {name: gauge.snapshot() for name, gauge in sorted(self._gauges.items())},
+                "histograms": {name: histogram.snapshot() for name, histogram in sorted(self._histograms.items())},
+            }
+
+    def export_json(self, file_path: str, indent: Optional[int] = 2):
+        with open(file_path, "w") as metrics_file:
+            json.dump(self.snapshot(), metrics_file, indent=indent)
@@ -1,7 +1,9 @@
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import List, Optional
 
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -28,13 +30,26 @@ class RESTAssistant:
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
+        self._metrics = MetricsRegistry.get_instance()
+        self._call_duration_histogram = self._metrics.histogram(
+            "rest_assistant.call_duration", "Time to send a REST request and process its response")
+        self._call_errors_counter = self._metrics.counter(
+            "rest_assistant.call_errors", "REST requests that failed or timed out")
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
-        request = await self._pre_process_request(request)
-        request = await self._authenticate(request)
-        resp = await wait_for(self._connection.call(request), timeout)
-        resp = await self._post_process_response(resp)
+        started = time.perf_counter_ns() if self._metrics.enabled else 0
+        try:
+            request = deepcopy(request)
+            request = await self._pre_process_request(request)
+            request = await self._authenticate(request)
+            resp = await wait_for(self._connection.call(request), timeout)
+            resp = await self._post_process_response(resp)
+        except Exception:
+            if started > 0:
+                self._call_errors_counter.increment()
+            raise
+        if started > 0:
+            self._call_duration_histogram.record(time.perf_counter_ns() - started)
         return resp
 
     async def _pre_process_request(self, request: RESTRequest) -> RESTRequest:
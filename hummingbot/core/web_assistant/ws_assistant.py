@@ -1,3 +1,4 @@
+import time
 from copy import deepcopy
 from typing import (
     AsyncGenerator,
@@ -6,6 +7,7 @@ from typing import (
     Optional,
 )
 
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
@@ -32,6 +34,11 @@ class WSAssistant:
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
+        self._metrics = MetricsRegistry.get_instance()
+        self._send_duration_histogram = self._metrics.histogram(
+            "ws_assistant.send_duration", "Time to process and send a websocket request")
+        self._messages_received_counter = self._metrics.counter(
+            "ws_assistant.messages_received", "Websocket messages received")
 
     @property
     def last_recv_time(self) -> float:
@@ -55,10 +62,13 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
+        started = time.perf_counter_ns() if self._metrics.enabled else 0
         request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         await self._connection.send(request)
+        if started > 0:
+            self._send_duration_histogram.record(time.perf_counter_ns() - started)
 
     async def ping(self):
         await self._connection.ping()
@@ -68,6 +78,8 @@ class WSAssistant:
         while self._connection.connected:
             response = await self._connection.receive()
             if response is not None:
+                if self._metrics.enabled:
+                    self._messages_received_counter.increment()
                 response = await self._post_process_response(response)
                 yield response
 
@@ -75,6 +87,8 @@ class WSAssistant:
         """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
         response = await self._connection.receive()
         if response is not None:
+            if self._metrics.enabled:
+                self._messages_received_counter.increment()
             response = await self._post_process_response(response)
         return response
 
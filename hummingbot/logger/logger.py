@@ -28,14 +28,19 @@ else:   # pragma: no cover
 
 
 class HummingbotLogger(PythonLogger):
+    _testing_mode: Optional[bool] = None
+
     def __init__(self, name: str):
         super().__init__(name)
 
     @staticmethod
     def is_testing_mode() -> bool:
-        return any(tools in arg
-                   for tools in TESTING_TOOLS
-                   for arg in sys.argv)
+        # sys.argv does not change during the life of the process, scan it only once
+        if HummingbotLogger._testing_mode is None:
+            HummingbotLogger._testing_mode = any(tools in arg
+                                                 for tools in TESTING_TOOLS
+                                                 for arg in sys.argv)
+        return HummingbotLogger._testing_mode
 
     def notify(self, msg: str):
         from . import INFO
@@ -46,15 +51,17 @@ class HummingbotLogger(PythonLogger):
             hummingbot_app.notify(f"({pd.Timestamp.fromtimestamp(int(time.time()))}) {msg}")
 
     def network(self, log_msg: str, app_warning_msg: Optional[str] = None, *args, **kwargs):
-        from hummingbot.client.hummingbot_application import HummingbotApplication
         from . import NETWORK
 
         self.log(NETWORK, log_msg, *args, **kwargs)
         if app_warning_msg is not None and not HummingbotLogger.is_testing_mode():
+            from hummingbot.client.hummingbot_application import HummingbotApplication
             app_warning: ApplicationWarning = ApplicationWarning(
                 time.time(),
                 self.name,
-                self.findCaller(),
+                # Walking the stack to find the caller is too slow for the network error paths, the logger name
+                # identifies the source of the warning well enough
+                (self.name, 0, "(unknown function)", None),
                 app_warning_msg
             )
             self.warning(app_warning.warning_msg)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+_SENTINEL = None
+
+
+class QueueLogListener:
+    """
+    Background writer thread shared by all `QueueLogHandler` instances. Records are pulled from a single bounded
+    queue and handed to the downstream handlers (file, CLI, ...) the producer logger was originally configured with,
+    so that slow I/O never runs on the asyncio thread.
+
+    Under pressure the producer side drops records instead of blocking: once the queue is filled beyond
+    `high_watermark` only records at `priority_level` or above are accepted, and once it is full everything is
+    dropped. The number of dropped records is reported through a periodic summary warning once the writer catches up.
+    """
+
+    def __init__(self,
+                 max_queue_size: int = 10000,
+                 high_watermark: float = 0.8,
+                 priority_level: int = logging.WARNING,
+                 summary_interval: float = 10.0):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._max_queue_size: int = max_queue_size
+        self._high_watermark_size: int = int(max_queue_size * high_watermark)
+        self._priority_level: int = priority_level
+        self._summary_interval: float = summary_interval
+        self._dropped_lock: threading.Lock = threading.Lock()
+        self._dropped_count: int = 0
+        self._last_summary_ts: float = 0.0
+        self._summary_handlers: List[logging.Handler] = []
+        self._stop_event: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(self, handlers: Tuple[logging.Handler, ...], record: logging.LogRecord):
+        if record.levelno < self._priority_level and self._queue.qsize() >= self._high_watermark_size:
+            self._record_drop()
+            return
+        try:
+            self._queue.put_nowait((handlers, record))
+        except queue.Full:
+            self._record_drop()
+
+    def register_summary_handlers(self, handlers: Tuple[logging.Handler, ...]):
+        for handler in handlers:
+            if handler not in self._summary_handlers:
+                self._summary_handlers.append(handler)
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._monitor, name="HummingbotLogWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """
+        Flushes every queued record and stops the writer thread. Stopping never blocks on a full queue: the writer
+        checks the stop event after every record, the sentinel only wakes it up when it is waiting on an empty queue.
+        """
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        try:
+            self._queue.put_nowait((_SENTINEL, _SENTINEL))
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        self._thread = None
+        self._emit_drop_summary(force=True)
+
+    def _record_drop(self):
+        with self._dropped_lock:
+            self._dropped_count += 1
+
+    def _monitor(self):
+        while not self._stop_event.is_set():
+            handlers, record = self._queue.get()
+            if handlers is _SENTINEL:
+                continue
+            self._handle(handlers, record)
+            if self._queue.empty():
+                self._emit_drop_summary()
+        self._drain()
+
+    def _drain(self):
+        while True:
+            try:
+                handlers, record = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if handlers is not _SENTINEL:
+                self._handle(handlers, record)
+
+    def _emit_drop_summary(self, force: bool = False):
+        now = time.time()
+        if self._dropped_count == 0 or (not force and now - self._last_summary_ts < self._summary_interval):
+            return
+        with self._dropped_lock:
+            dropped = self._dropped_count
+            self._dropped_count = 0
+        self._last_summary_ts = now
+        record = logging.LogRecord(name=__name__,
+                                   level=logging.WARNING,
+                                   pathname=__file__,
+                                   lineno=0,
+                                   msg=f"{dropped} log records were dropped because the log queue was congested.",
+                                   args=None,
+                                   exc_info=None)
+        self._handle(tuple(self._summary_handlers), record)
+
+    @staticmethod
+    def _handle(handlers: Tuple[logging.Handler, ...], record: logging.LogRecord):
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Handler installed on loggers in place of their configured handlers. `emit` only freezes the message arguments
+    and enqueues the record, all formatting and writing happens on the `QueueLogListener` thread.
+    """
+
+    def __init__(self, listener: QueueLogListener, target_handlers: Tuple[logging.Handler, ...]):
+        super().__init__()
+        self._listener: QueueLogListener = listener
+        self._target_handlers: Tuple[logging.Handler, ...] = target_handlers
+
+    @property
+    def target_handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._target_handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Message arguments may be mutated by the caller after the log call returns, render them eagerly.
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._listener.enqueue(self._target_handlers, self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+_listener: Optional[QueueLogListener] = None
+
+
+def get_queue_log_listener() -> Optional[QueueLogListener]:
+    return _listener
+
+
+def enable_queue_logging(max_queue_size: int = 10000,
+                         high_watermark: float = 0.8,
+                         priority_level: int = logging.WARNING,
+                         summary_interval: float = 10.0) -> QueueLogListener:
+    """
+    Moves the handlers of the root logger and of every configured logger behind a shared background writer thread.
+    Loggers using the same handler set share one `QueueLogHandler`.
+    """
+    global _listener
+    disable_queue_logging()
+    _listener = QueueLogListener(max_queue_size=max_queue_size,
+                                 high_watermark=high_watermark,
+                                 priority_level=priority_level,
+                                 summary_interval=summary_interval)
+    queue_handlers: Dict[Tuple[int, ...], QueueLogHandler] = {}
+    root_logger: logging.Logger = logging.getLogger()
+    loggers: List[logging.Logger] = [root_logger]
+    loggers.extend(logger for logger in logging.Logger.manager.loggerDict.values()
+                   if isinstance(logger, logging.Logger))
+    for logger in loggers:
+        target_handlers = tuple(logger.handlers)
+        if len(target_handlers) == 0:
+            continue
+        if logger is root_logger:
+            _listener.register_summary_handlers(target_handlers)
+        key = tuple(id(handler) for handler in target_handlers)
+        if key not in queue_handlers:
+            queue_handlers[key] = QueueLogHandler(_listener, target_handlers)
+        for handler in target_handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handlers[key])
+    _listener.start()
+    return _listener
+
+
+def disable_queue_logging():
+    """
+    Flushes the queue and restores the original handlers on every logger.
+    """
+    global _listener
+    if _listener is None:
+        return
+    loggers: List[logging.Logger] = [logging.getLogger()]
+    loggers.extend(logger for logger in logging.Logger.manager.loggerDict.values()
+                   if isinstance(logger, logging.Logger))
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueLogHandler):
+                logger.removeHandler(handler)
+                for target_handler in handler.target_handlers:
+                    logger.addHandler(target_handler)
+    _listener.stop()
+    _listener = None
+
+
+# Flush pending records on interpreter exit, this runs before logging.shutdown() closes the downstream handlers.
+atexit.register(disable_queue_logging)
@@ -2,14 +2,20 @@ import logging
 
 from enum import Enum
 from os.path import join
-from typing import Optional
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
 
 from sqlalchemy import (
     create_engine,
+    event,
     inspect,
     MetaData,
 )
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import (
     Query,
     Session,
@@ -29,6 +35,23 @@ class SQLConnectionType(Enum):
     TRADE_FILLS = 1
 
 
+# PRAGMAs applied to every new SQLite connection, by `db_sqlite_profile`.
+# The performance profile uses a write-ahead log, so readers never block the writer and commits only append to the
+# log, with synchronous=NORMAL the log is only fsync'ed at checkpoints instead of on every commit. A power loss can
+# lose the last commits but never corrupts the database.
+SQLITE_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,  # 256 MiB
+        "cache_size": -65536,  # 64 MiB, negative values are in KiB
+        "busy_timeout": 5000,  # ms
+    },
+}
+
+
 class SQLConnectionManager(TransactionBase):
     _scm_logger: Optional[HummingbotLogger] = None
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
@@ -73,8 +96,26 @@ class SQLConnectionManager(TransactionBase):
 
         if "sqlite" in dialect:
             db_path = params.get("db_path")
-
-            return create_engine(f"{dialect}:///{db_path}")
+            profile = params.get("db_sqlite_profile") or "default"
+            pragmas = SQLITE_PROFILES.get(profile, {})
+
+            if not pragmas or db_path == ":memory:":
+                return create_engine(f"{dialect}:///{db_path}")
+
+            # Keep the connections (and their prepared statements cache) open across the short-lived sessions instead
+            # of reconnecting for every session. One writer and a few readers only need a small pool.
+            engine = create_engine(f"{dialect}:///{db_path}",
+                                   poolclass=QueuePool,
+                                   pool_size=2,
+                                   max_overflow=8,
+                                   connect_args={"check_same_thread": False,
+                                                 "cached_statements": 256})
+
+            @event.listens_for(engine, "connect")
+            def on_connect(dbapi_connection, _):
+                cls._apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+            return engine
         else:
             username = params.get("db_username")
             password = params.get("db_password")
@@ -84,6 +125,15 @@ class SQLConnectionManager(TransactionBase):
 
             return create_engine(f"{dialect}://{username}:{password}@{host}:{port}/{db_name}")
 
+    @staticmethod
+    def _apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, Any]):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
     def __init__(self,
                  connection_type: SQLConnectionType,
                  db_path: Optional[str] = None,
@@ -99,8 +149,10 @@ class SQLConnectionManager(TransactionBase):
             "db_username": global_config_map.get("db_username").value,
             "db_password": global_config_map.get("db_password").value,
             "db_name": global_config_map.get("db_name").value,
+            "db_sqlite_profile": global_config_map.get("db_sqlite_profile").value,
             "db_path": db_path
         }
+        self._engine_options = engine_options
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = self.get_db_engine(
@@ -133,6 +185,12 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    def create_engine(self) -> Engine:
+        """
+        Creates a new engine, with its own connections, for the same database and settings as this manager's engine.
+        """
+        return self.get_db_engine(self._engine_options.get("db_engine"), self._engine_options)
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
@@ -0,0 +1,216 @@
+import logging
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from os import listdir, makedirs
+from os.path import (
+    basename,
+    dirname,
+    exists,
+    join,
+    splitext,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy import exists as sql_exists
+from sqlalchemy.engine.base import Engine
+
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_summary import TradeFillSummary
+
+# SQLite limits the number of bound parameters per statement
+ARCHIVE_CHUNK_SIZE = 500
+ARCHIVED_TABLES = [Order.__table__, OrderStatus.__table__, TradeFill.__table__]
+# Order.last_status of the orders which can no longer be updated, open orders stay in the trades database whatever
+# their age so that their later fills and status updates find them
+TERMINAL_ORDER_STATUSES = [MarketEvent.BuyOrderCompleted.name,
+                           MarketEvent.SellOrderCompleted.name,
+                           MarketEvent.OrderCancelled.name,
+                           MarketEvent.OrderFailure.name,
+                           MarketEvent.OrderExpired.name]
+
+
+def archive_month(timestamp: int) -> str:
+    """
+    :param timestamp: a timestamp in milliseconds
+    :returns: the month of the timestamp (UTC) as YYYY-MM, which names the archive partition holding it
+    """
+    return datetime.utcfromtimestamp(timestamp / 1e3).strftime("%Y-%m")
+
+
+def archive_dir_path(db_path: str) -> str:
+    return join(dirname(db_path), f"{splitext(basename(db_path))[0]}_archive")
+
+
+def archive_partition_paths(db_path: str) -> Dict[str, str]:
+    """
+    :returns: the archive partition files of the database, by month (YYYY-MM), in ascending month order
+    """
+    dir_path = archive_dir_path(db_path)
+    if not exists(dir_path):
+        return {}
+    months = sorted(splitext(f)[0] for f in listdir(dir_path) if f.endswith(".sqlite"))
+    return {month: join(dir_path, f"{month}.sqlite") for month in months}
+
+
+def create_partition_engine(partition_path: str) -> Engine:
+    engine = SQLConnectionManager.get_db_engine("sqlite", {"db_path": partition_path})
+    SQLConnectionManager.get_declarative_base().metadata.create_all(engine, tables=ARCHIVED_TABLES)
+    return engine
+
+
+class TradeArchiver:
+    """
+    Moves the finished orders which stopped being updated before a cutoff time, with their status updates and trade
+    fills, out of the trades database into per month SQLite partition files next to it, and keeps monthly
+    `TradeFillSummary` rollups of the archived trade fills in the trades database.
+
+    Trade fills are archived in the partition of the month they happened, orders and their status updates in the
+    partition of the month they were created. An order is also copied in the partitions of its trade fills, so every
+    partition can be queried on its own.
+    Rows are copied to the partitions before they are deleted from the trades database and copies ignore rows already
+    present, so an interrupted archival can simply be run again.
+    """
+    _ta_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ta_logger is None:
+            cls._ta_logger = logging.getLogger(__name__)
+        return cls._ta_logger
+
+    def __init__(self, sql_manager: SQLConnectionManager):
+        self._sql_manager = sql_manager
+
+    @property
+    def archive_dir_path(self) -> str:
+        return archive_dir_path(self._sql_manager.db_path)
+
+    def archive(self, cutoff_timestamp: int) -> int:
+        """
+        Archives the completed, cancelled, failed or expired orders last updated before the cutoff timestamp (in
+        milliseconds) which have no trade fill after it.
+        :returns: the number of archived orders
+        """
+        if self._sql_manager.engine.dialect.name != "sqlite":
+            return 0
+
+        with self._sql_manager.get_new_session() as session:
+            recent_fill = sql_exists().where(TradeFill.order_id == Order.id,
+                                             TradeFill.timestamp >= cutoff_timestamp)
+            query = (session
+                     .query(Order.id)
+                     .filter(Order.last_update_timestamp < cutoff_timestamp,
+                             Order.last_status.in_(TERMINAL_ORDER_STATUSES),
+                             ~recent_fill))
+            order_ids: List[str] = [order_id for order_id, in query]
+        if not order_ids:
+            return 0
+
+        makedirs(self.archive_dir_path, exist_ok=True)
+        partition_engines: Dict[str, Engine] = {}
+        try:
+            for i in range(0, len(order_ids), ARCHIVE_CHUNK_SIZE):
+                self._archive_orders(partition_engines, order_ids[i:i + ARCHIVE_CHUNK_SIZE])
+        finally:
+            for engine in partition_engines.values():
+                engine.dispose()
+        self.logger().info(f"Archived {len(order_ids)} orders to {self.archive_dir_path}.")
+        return len(order_ids)
+
+    def _partition_engine(self, partition_engines: Dict[str, Engine], month: str) -> Engine:
+        if month not in partition_engines:
+            partition_engines[month] = create_partition_engine(join(self.archive_dir_path, f"{month}.sqlite"))
+        return partition_engines[month]
+
+    def _archive_orders(self, partition_engines: Dict[str, Engine], order_ids: List[str]):
+        order_table, order_status_table, trade_fill_table = ARCHIVED_TABLES
+        with self._sql_manager.engine.begin() as conn:
+            orders = conn.execute(order_table.select().where(order_table.c.id.in_(order_ids))).fetchall()
+            statuses = conn.execute(order_status_table.select()
+                                    .where(order_status_table.c.order_id.in_(order_ids))).fetchall()
+            fills = conn.execute(trade_fill_table.select()
+                                 .where(trade_fill_table.c.order_id.in_(order_ids))).fetchall()
+
+            orders_by_id = {order.id: order for order in orders}
+            rows_by_month: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+            for order in orders:
+                rows_by_month[archive_month(order.creation_timestamp)][order_table.name].append(order)
+            for status in statuses:
+                order = orders_by_id[status.order_id]
+                rows_by_month[archive_month(order.creation_timestamp)][order_status_table.name].append(status)
+            fills_by_month: Dict[str, list] = defaultdict(list)
+            for fill in fills:
+                month = archive_month(fill.timestamp)
+                fills_by_month[month].append(fill)
+                rows_by_month[month][trade_fill_table.name].append(fill)
+                if archive_month(orders_by_id[fill.order_id].creation_timestamp) != month:
+                    rows_by_month[month][order_table.name].append(orders_by_id[fill.order_id])
+
+            for month, rows_by_table in rows_by_month.items():
+                with self._partition_engine(partition_engines, month).begin() as partition_conn:
+                    for table in ARCHIVED_TABLES:
+                        rows = rows_by_table.get(table.name)
+                        if rows:
+                            partition_conn.execute(table.insert().prefix_with("OR IGNORE"),
+                                                   [dict(row._mapping) for row in rows])
+
+            for month, month_fills in fills_by_month.items():
+                self._update_summaries(conn, month, month_fills)
+            conn.execute(trade_fill_table.delete().where(trade_fill_table.c.order_id.in_(order_ids)))
+            conn.execute(order_status_table.delete().where(order_status_table.c.order_id.in_(order_ids)))
+            conn.execute(order_table.delete().where(order_table.c.id.in_(order_ids)))
+
+    @staticmethod
+    def _update_summaries(conn, month: str, fills: list):
+        summary_table = TradeFillSummary.__table__
+        summaries: Dict[Tuple[str, str, str, str], dict] = {}
+        for fill in fills:
+            key = (fill.config_file_path, fill.market, fill.symbol, fill.trade_type)
+            summary = summaries.get(key)
+            if summary is None:
+                summary = summaries[key] = dict(month=month,
+                                                config_file_path=fill.config_file_path,
+                                                market=fill.market,
+                                                symbol=fill.symbol,
+                                                trade_type=fill.trade_type,
+                                                strategy=fill.strategy,
+                                                base_asset=fill.base_asset,
+                                                quote_asset=fill.quote_asset,
+                                                num_trades=0,
+                                                base_volume=Decimal(0),
+                                                quote_volume=Decimal(0),
+                                                first_timestamp=fill.timestamp,
+                                                last_timestamp=fill.timestamp)
+            summary["num_trades"] += 1
+            summary["base_volume"] += fill.amount
+            summary["quote_volume"] += fill.amount * fill.price
+            summary["first_timestamp"] = min(summary["first_timestamp"], fill.timestamp)
+            summary["last_timestamp"] = max(summary["last_timestamp"], fill.timestamp)
+
+        for summary in summaries.values():
+            key_filter = [summary_table.c.month == month,
+                          summary_table.c.config_file_path == summary["config_file_path"],
+                          summary_table.c.market == summary["market"],
+                          summary_table.c.symbol == summary["symbol"],
+                          summary_table.c.trade_type == summary["trade_type"]]
+            existing = conn.execute(summary_table.select().where(*key_filter)).first()
+            if existing is None:
+                conn.execute(summary_table.insert(), summary)
+            else:
+                conn.execute(summary_table.update().where(*key_filter).values(
+                    num_trades=existing.num_trades + summary["num_trades"],
+                    base_volume=existing.base_volume + summary["base_volume"],
+                    quote_volume=existing.quote_volume + summary["quote_volume"],
+                    first_timestamp=min(existing.first_timestamp, summary["first_timestamp"]),
+                    last_timestamp=max(existing.last_timestamp, summary["last_timestamp"])))
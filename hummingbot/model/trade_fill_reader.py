@@ -0,0 +1,149 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from sqlalchemy import func
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.orm import (
+    joinedload,
+    Query,
+    Session,
+    sessionmaker,
+)
+
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_archiver import archive_month, archive_partition_paths
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradesSummary(NamedTuple):
+    count: int
+    last_timestamp: Optional[int]
+
+
+class TradeFillReader:
+    """
+    Read-side access to the trade fills database for the UI and the client commands.
+
+    Queries run on a dedicated single thread with their own engine (and therefore their own connections), so reading
+    the trade history never blocks the event loop nor competes for the connection used by the markets recorder.
+    The returned `TradeFill` objects are detached from their session and can be used freely from the event loop.
+    """
+
+    def __init__(self, sql_manager: SQLConnectionManager):
+        self._sql_manager = sql_manager
+        self._engine: Engine = sql_manager.create_engine()
+        self._session_cls = sessionmaker(bind=self._engine, expire_on_commit=False)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1,
+                                                                thread_name_prefix="trade_fill_reader")
+
+    @property
+    def db_path(self) -> str:
+        return self._sql_manager.db_path
+
+    def get_new_session(self) -> Session:
+        return self._session_cls()
+
+    async def _run(self, func_, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, partial(func_, *args, **kwargs))
+
+    async def get_trades(self,
+                         start_timestamp: int,
+                         number_of_rows: Optional[int] = None,
+                         config_file_path: Optional[str] = None,
+                         with_orders: bool = False,
+                         include_archived: bool = False) -> List[TradeFill]:
+        """
+        Returns the trades since start_timestamp (in milliseconds) in ascending timestamp order, limited to the latest
+        `number_of_rows` trades if specified. Set `with_orders` to also load the orders of the trades, e.g. to use
+        `TradeFill.to_pandas`, and `include_archived` to also read the archive partitions (see `TradeArchiver`).
+        """
+        return await self._run(self._query_trades,
+                               start_timestamp,
+                               number_of_rows,
+                               config_file_path,
+                               with_orders,
+                               include_archived)
+
+    async def get_trades_summary(self,
+                                 start_timestamp: int,
+                                 config_file_path: Optional[str] = None) -> TradesSummary:
+        """
+        Returns the number of trades since start_timestamp (in milliseconds) and the timestamp of the latest one,
+        without loading the trades themselves.
+        """
+        return await self._run(self._query_trades_summary, start_timestamp, config_file_path)
+
+    def stop(self):
+        self._executor.shutdown(wait=False)
+        self._engine.dispose()
+
+    @staticmethod
+    def _filters(start_timestamp: int, config_file_path: Optional[str]) -> list:
+        filters = [TradeFill.timestamp >= start_timestamp]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        return filters
+
+    def _query_trades(self,
+                      start_timestamp: int,
+                      number_of_rows: Optional[int],
+                      config_file_path: Optional[str],
+                      with_orders: bool,
+                      include_archived: bool = False) -> List[TradeFill]:
+        with self.get_new_session() as session:
+            result: List[TradeFill] = self._query_session_trades(
+                session, start_timestamp, number_of_rows, config_file_path, with_orders)
+
+        if include_archived:
+            start_month = archive_month(start_timestamp)
+            for month, partition_path in archive_partition_paths(self.db_path).items():
+                if month < start_month:
+                    continue
+                engine = SQLConnectionManager.get_db_engine("sqlite", {"db_path": partition_path})
+                try:
+                    with Session(bind=engine, expire_on_commit=False) as session:
+                        result.extend(self._query_session_trades(
+                            session, start_timestamp, number_of_rows, config_file_path, with_orders))
+                finally:
+                    engine.dispose()
+            result.sort(key=lambda t: t.timestamp, reverse=True)
+            if number_of_rows is not None:
+                result = result[:number_of_rows]
+
+        # Get the latest trades in ascending timestamp order
+        result.reverse()
+        return result
+
+    def _query_session_trades(self,
+                              session: Session,
+                              start_timestamp: int,
+                              number_of_rows: Optional[int],
+                              config_file_path: Optional[str],
+                              with_orders: bool) -> List[TradeFill]:
+        query: Query = (session
+                        .query(TradeFill)
+                        .filter(*self._filters(start_timestamp, config_file_path))
+                        .order_by(TradeFill.timestamp.desc()))
+        if with_orders:
+            query = query.options(joinedload(TradeFill.order))
+        if number_of_rows is not None:
+            query = query.limit(number_of_rows)
+        result: List[TradeFill] = query.all() or []
+        session.expunge_all()
+        return result
+
+    def _query_trades_summary(self, start_timestamp: int, config_file_path: Optional[str]) -> TradesSummary:
+        with self.get_new_session() as session:
+            count, last_timestamp = (session
+                                     .query(func.count(), func.max(TradeFill.timestamp))
+                                     .select_from(TradeFill)
+                                     .filter(*self._filters(start_timestamp, config_file_path))
+                                     .one())
+        return TradesSummary(count=count or 0, last_timestamp=last_timestamp)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    Text,
+)
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimal
+
+
+class TradeFillSummary(HummingbotBase):
+    """
+    Monthly rollup of the trade fills that were moved out of the trades database into an archive partition.
+    """
+    __tablename__ = "TradeFillSummary"
+    __table_args__ = (Index("tfs_config_month_index",
+                            "config_file_path", "month"),
+                      )
+
+    month = Column(Text, primary_key=True, nullable=False)
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    market = Column(Text, primary_key=True, nullable=False)
+    symbol = Column(Text, primary_key=True, nullable=False)
+    trade_type = Column(Text, primary_key=True, nullable=False)
+    strategy = Column(Text, nullable=False)
+    base_asset = Column(Text, nullable=False)
+    quote_asset = Column(Text, nullable=False)
+    num_trades = Column(Integer, nullable=False)
+    base_volume = Column(SqliteDecimal(6), nullable=False)
+    quote_volume = Column(SqliteDecimal(6), nullable=False)
+    first_timestamp = Column(BigInteger, nullable=False)
+    last_timestamp = Column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradeFillSummary(month='{self.month}', config_file_path='{self.config_file_path}', " \
+               f"market='{self.market}', symbol='{self.symbol}', trade_type='{self.trade_type}', " \
+               f"num_trades={self.num_trades}, base_volume={self.base_volume}, " \
+               f"quote_volume={self.quote_volume}, first_timestamp={self.first_timestamp}, " \
+               f"last_timestamp={self.last_timestamp})"
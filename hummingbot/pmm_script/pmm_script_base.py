@@ -1,7 +1,6 @@
 import asyncio
 import traceback
 from decimal import Decimal
-from multiprocessing import Queue
 from operator import itemgetter
 from statistics import mean, median
 from typing import Any, Callable, Dict, List, Optional
@@ -10,6 +9,7 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
 )
+from .pmm_script_channel import PMMScriptChannel
 from .pmm_script_interface import (
     CallLog,
     CallNotify,
@@ -28,8 +28,8 @@ class PMMScriptBase:
     A user defined script should derive from this base class to get all its functionality.
     """
     def __init__(self):
-        self._parent_queue: Queue = None
-        self._child_queue: Queue = None
+        self._parent_queue: PMMScriptChannel = None
+        self._child_queue: PMMScriptChannel = None
         self._queue_check_interval: float = 0.0
         self.mid_prices: List[Decimal] = []
         self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
@@ -41,7 +41,8 @@ class PMMScriptBase:
         # all_available_balances has the same data structure as all_total_balances
         self.all_available_balances: Dict[str, Dict[str, Decimal]] = None
 
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+    def assign_init(self, parent_queue: PMMScriptChannel, child_queue: PMMScriptChannel,
+                    queue_check_interval: float):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
         self._queue_check_interval = queue_check_interval
@@ -59,10 +60,7 @@ class PMMScriptBase:
     async def listen_to_parent(self):
         while True:
             try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
+                item = await self._parent_queue.get_async()
                 # print(f"child gets {str(item)}")
                 if item is None:
                     # print("child exiting..")
@@ -72,9 +70,13 @@ class PMMScriptBase:
                     self.mid_prices.append(item.mid_price)
                     if len(self.mid_prices) > self.max_mid_prices_length:
                         self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
-                    self.all_total_balances = item.all_total_balances
-                    self.all_available_balances = item.all_available_balances
+                    if self.pmm_parameters is None:
+                        self.pmm_parameters = PMMParameters()
+                    self.pmm_parameters.apply_changes(item.changed_parameters)
+                    if item.all_total_balances is not None:
+                        self.all_total_balances = item.all_total_balances
+                    if item.all_available_balances is not None:
+                        self.all_available_balances = item.all_available_balances
                     self.on_tick()
                 elif isinstance(item, BuyOrderCompletedEvent):
                     self.on_buy_order_completed(item)
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import threading
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from typing import Any, Deque, Optional, Tuple
+
+
+class PMMScriptChannel:
+    """
+    One way, low latency message channel between the main application and a PMM script process.
+
+    It is a drop-in replacement for the multiprocessing.Queue previously used (`put`, `get` and `empty`), backed by
+    a pipe so that the receiving side can be woken up by the event loop as soon as data arrives (`get_async`)
+    instead of polling `empty()` on an interval. Like the Queue feeder thread, a sender thread writes the items to
+    the pipe, so that `put` never blocks the caller when the receiver is slow to read. `try_put` is provided for
+    messages that can be skipped (e.g. ticks): the item is dropped while the previous skippable item is not sent yet.
+    """
+    _logger: Optional[logging.Logger] = None
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, reader: Connection, writer: Connection, poll_interval: float = 0.01):
+        self._reader: Connection = reader
+        self._writer: Connection = writer
+        self._poll_interval: float = poll_interval
+        self._init_sender()
+
+    def _init_sender(self):
+        self._send_condition: threading.Condition = threading.Condition()
+        # (item, is skippable) pairs waiting for the sender thread, unbounded
+        self._pending_items: Deque[Tuple[Any, bool]] = deque()
+        self._has_skippable_item: bool = False
+        self._closing: bool = False
+        self._sender_thread: Optional[threading.Thread] = None
+
+    def __getstate__(self):
+        # The sender thread and its pending items belong to the process which created them
+        return self._reader, self._writer, self._poll_interval
+
+    def __setstate__(self, state):
+        self._reader, self._writer, self._poll_interval = state
+        self._init_sender()
+
+    @classmethod
+    def create(cls, poll_interval: float = 0.01) -> "PMMScriptChannel":
+        reader, writer = Pipe(duplex=False)
+        return cls(reader, writer, poll_interval)
+
+    def put(self, item: Any):
+        """
+        Queues the item for the sender thread, the caller is never blocked by a full pipe.
+        """
+        with self._send_condition:
+            if self._closing:
+                return
+            self._pending_items.append((item, False))
+            self._wake_up_sender()
+
+    def try_put(self, item: Any) -> bool:
+        """
+        Queues the item for the sender thread, unless the previous item passed to `try_put` was not sent yet.
+        :returns True if the item will be sent, False if it was skipped
+        """
+        with self._send_condition:
+            if self._has_skippable_item or self._closing:
+                return False
+            self._pending_items.append((item, True))
+            self._has_skippable_item = True
+            self._wake_up_sender()
+        return True
+
+    def _wake_up_sender(self):
+        if self._sender_thread is None:
+            self._sender_thread = threading.Thread(target=self._send_pending_items,
+                                                   name="PMMScriptChannelSender",
+                                                   daemon=True)
+            self._sender_thread.start()
+        self._send_condition.notify()
+
+    def _send_pending_items(self):
+        try:
+            while True:
+                with self._send_condition:
+                    while len(self._pending_items) == 0 and not self._closing:
+                        self._send_condition.wait()
+                    if len(self._pending_items) == 0:
+                        return
+                    item, is_skippable = self._pending_items.popleft()
+                try:
+                    self._writer.send(item)
+                except Exception:
+                    if self._closing:
+                        return
+                    self.logger().error(f"Unexpected error sending {item.__class__.__name__} to the PMM script.",
+                                        exc_info=True)
+                finally:
+                    if is_skippable:
+                        with self._send_condition:
+                            self._has_skippable_item = False
+        finally:
+            with self._send_condition:
+                self._sender_thread = None
+                self._pending_items.clear()
+                self._has_skippable_item = False
+
+    def empty(self) -> bool:
+        return not self._reader.poll()
+
+    def get(self) -> Any:
+        return self._reader.recv()
+
+    async def get_async(self) -> Any:
+        """
+        Waits for the next item without blocking the event loop. The reader file descriptor is registered with the
+        loop, falling back to polling on loops which do not support `add_reader`.
+        """
+        if self._reader.poll():
+            return self._reader.recv()
+        loop = asyncio.get_event_loop()
+        fd = self._reader.fileno()
+        readable: asyncio.Future = loop.create_future()
+        try:
+            loop.add_reader(fd, self._set_readable, readable)
+        except NotImplementedError:
+            while not self._reader.poll():
+                await asyncio.sleep(self._poll_interval)
+            return self._reader.recv()
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        return self._reader.recv()
+
+    @staticmethod
+    def _set_readable(readable: asyncio.Future):
+        if not readable.done():
+            readable.set_result(None)
+
+    @property
+    def connections(self) -> Tuple[Connection, Connection]:
+        return self._reader, self._writer
+
+    def close(self, timeout: float = 5.0):
+        """
+        Sends the items already queued, waiting up to timeout seconds for the receiver to read them, then closes the
+        pipe.
+        """
+        with self._send_condition:
+            self._closing = True
+            sender_thread = self._sender_thread
+            self._send_condition.notify()
+        if sender_thread is not None and sender_thread is not threading.current_thread():
+            sender_thread.join(timeout)
+        self._writer.close()
+        self._reader.close()
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 child_queue = None
 
@@ -98,10 +98,22 @@ class PMMParameters:
     # ping_pong_enabled = PMMParameter("ping_pong_enabled")
     # minimum_spread = PMMParameter("minimum_spread")
 
+    def apply_changes(self, changed_parameters: Dict[str, Any]):
+        """
+        Applies parameter values received from the main application. The values are written to the backing
+        attributes directly so that they are not reported back as script driven updates.
+        """
+        for name, value in changed_parameters.items():
+            setattr(self, "_" + name, value)
+
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
 
+PMM_PARAMETER_NAMES = tuple(attr for attr in PMMParameters.__dict__.keys()
+                            if isinstance(PMMParameters.__dict__[attr], StrategyParameter))
+
+
 class PMMMarketInfo:
     def __init__(self, exchange: str,
                  trading_pair: str,):
@@ -113,13 +125,17 @@ class PMMMarketInfo:
 
 
 class OnTick:
+    """
+    Sent on every tick. To keep the message small only the strategy parameters which changed since the previous
+    tick are included, and balances are None when they did not change.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]],
-                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 changed_parameters: Dict[str, Any],
+                 all_total_balances: Optional[Dict[str, Dict[str, Decimal]]],
+                 all_available_balances: Optional[Dict[str, Dict[str, Decimal]]],
                  ):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
+        self.changed_parameters = changed_parameters
         self.all_total_balances = all_total_balances
         self.all_available_balances = all_available_balances
 
@@ -15,6 +15,9 @@ cdef class PMMScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        dict _last_sent_parameters
+        object _last_sent_total_balances
+        object _last_sent_available_balances
         object _ev_loop
         object _script_process
         object _listen_to_child_task
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+from copy import deepcopy
+from multiprocessing import Process
 from typing import List
 
 from hummingbot.connector.exchange_base import ExchangeBase
@@ -15,13 +16,14 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
 from hummingbot.pmm_script.pmm_script_interface import (
     CallLog,
     CallNotify,
     OnTick,
     OnCommand,
     OnStatus,
-    PMMParameters,
+    PMM_PARAMETER_NAMES,
     PMMMarketInfo,
     ScriptError,
     StrategyParameter,
@@ -59,8 +61,11 @@ cdef class PMMScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
+        self._parent_queue = PMMScriptChannel.create(queue_check_interval)
+        self._child_queue = PMMScriptChannel.create(queue_check_interval)
+        self._last_sent_parameters = {}
+        self._last_sent_total_balances = None
+        self._last_sent_available_balances = None
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
@@ -89,19 +94,33 @@ cdef class PMMScriptIterator(TimeIterator):
         self._script_process.join()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+        self._parent_queue.close()
+        self._child_queue.close()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
-        self._parent_queue.put(on_tick)
+        cdef:
+            dict changed_parameters = {}
+            object total_balances = self.all_total_balances()
+            object available_balances = self.all_available_balances()
+            object on_tick
+        for attr in PMM_PARAMETER_NAMES:
+            param_value = getattr(self._strategy, attr)
+            if attr not in self._last_sent_parameters or self._last_sent_parameters[attr] != param_value:
+                changed_parameters[attr] = param_value
+        on_tick = OnTick(self.strategy.get_mid_price(),
+                         changed_parameters,
+                         None if total_balances == self._last_sent_total_balances else total_balances,
+                         None if available_balances == self._last_sent_available_balances else available_balances)
+        # A tick is superseded by the next one, skip it rather than block the loop when the script is lagging.
+        # The unsent changes stay pending and are included in the next tick.
+        if self._parent_queue.try_put(on_tick):
+            # Values such as the order_override dict can be changed in place, keep copies to detect those changes
+            self._last_sent_parameters.update(deepcopy(changed_parameters))
+            self._last_sent_total_balances = total_balances
+            self._last_sent_available_balances = available_balances
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
@@ -118,14 +137,13 @@ cdef class PMMScriptIterator(TimeIterator):
     async def listen_to_child_queue(self):
         while True:
             try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
+                item = await self._child_queue.get_async()
                 if item is None:
                     break
                 if isinstance(item, StrategyParameter):
                     self.logger().info(f"received: {str(item)}")
+                    # Always send the resulting value back on the next tick, in case the update was not accepted.
+                    self._last_sent_parameters.pop(item.name, None)
                     setattr(self._strategy, item.name, item.updated_value)
                 elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
                     # ignore this on unit testing as the below import will mess up unit testing.
@@ -3,12 +3,15 @@ import importlib
 import inspect
 import os
 
-from multiprocessing import Queue
 from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
 from hummingbot.pmm_script.pmm_script_interface import CallNotify, set_child_queue
 
 
-def run_pmm_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_pmm_script(script_file_name: str,
+                   parent_queue: PMMScriptChannel,
+                   child_queue: PMMScriptChannel,
+                   queue_check_interval: float):
     try:
         script_class = import_pmm_script_sub_class(script_file_name)
         script = script_class()
@@ -23,6 +26,9 @@ def run_pmm_script(script_file_name: str, parent_queue: Queue, child_queue: Queu
     except Exception as ex:
         child_queue.put(CallNotify(f'Failed to start script {script_file_name}:'))
         child_queue.put(CallNotify(f'{ex}'))
+    finally:
+        # Flushes the messages still queued for the main application before the process exits
+        child_queue.close()
 
 
 def import_pmm_script_sub_class(script_file_name: str):
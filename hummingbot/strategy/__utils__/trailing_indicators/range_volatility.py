@@ -0,0 +1,95 @@
+from collections import deque
+from typing import Deque, List, Tuple
+
+
+class RollingHighLow:
+    """
+    Highest and lowest values of the last `length` samples, kept in monotonic deques so that adding a sample and
+    reading the high and low are O(1) (amortized) instead of a max/min over the whole window.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._samples_count = 0
+        # (sample index, value) pairs, with decreasing values for the highs and increasing values for the lows
+        self._highs: Deque[Tuple[int, float]] = deque()
+        self._lows: Deque[Tuple[int, float]] = deque()
+
+    def add_sample(self, value: float):
+        index = self._samples_count
+        self._samples_count += 1
+        while self._highs and self._highs[-1][1] <= value:
+            self._highs.pop()
+        self._highs.append((index, value))
+        while self._lows and self._lows[-1][1] >= value:
+            self._lows.pop()
+        self._lows.append((index, value))
+
+        oldest_index = index - self._length + 1
+        if self._highs[0][0] < oldest_index:
+            self._highs.popleft()
+        if self._lows[0][0] < oldest_index:
+            self._lows.popleft()
+
+    @property
+    def high(self) -> float:
+        return self._highs[0][1] if self._highs else float("nan")
+
+    @property
+    def low(self) -> float:
+        return self._lows[0][1] if self._lows else float("nan")
+
+    @property
+    def is_full(self) -> bool:
+        return self._samples_count >= self._length
+
+
+class RangeVolatilityIndicator:
+    """
+    Average of the relative price ranges ((high - low) / low) of the last `processing_length` windows of
+    `sampling_length` samples, the windows ending at the last sample, `sampling_length` samples before it, and so on.
+    While there are not enough samples the oldest window is partial and fewer windows are averaged.
+
+    Every sample updates the range of the window ending at it with a `RollingHighLow` and stores it in a ring, so
+    the value is the average of `processing_length` stored ranges rather than a max/min over every window.
+    """
+
+    def __init__(self, sampling_length: int = 30, processing_length: int = 15):
+        self._sampling_length = sampling_length
+        self._processing_length = processing_length
+        self._high_low = RollingHighLow(sampling_length)
+        self._samples_count = 0
+        # Ranges of the windows ending at the last (processing_length - 1) * sampling_length + 1 samples
+        self._ranges: List[float] = [0.0] * ((processing_length - 1) * sampling_length + 1)
+        self._ranges_count = 0
+        self._next_range_index = 0
+
+    def add_sample(self, value: float):
+        self._high_low.add_sample(value)
+        self._samples_count += 1
+        if self._samples_count == 1:
+            # A single sample is not a window
+            return
+        low = self._high_low.low
+        self._ranges[self._next_range_index] = (self._high_low.high - low) / low
+        self._next_range_index = (self._next_range_index + 1) % len(self._ranges)
+        self._ranges_count = min(self._ranges_count + 1, len(self._ranges))
+
+    @property
+    def current_value(self) -> float:
+        if self._ranges_count == 0:
+            return float("nan")
+        ranges_sum = 0.0
+        windows_count = 0
+        for lag in range(0, self._ranges_count, self._sampling_length):
+            ranges_sum += self._ranges[(self._next_range_index - 1 - lag) % len(self._ranges)]
+            windows_count += 1
+        return ranges_sum / windows_count
+
+    @property
+    def is_sampling_buffer_full(self) -> bool:
+        return self._high_low.is_full
+
+    @property
+    def is_processing_buffer_full(self) -> bool:
+        return self._ranges_count == len(self._ranges)
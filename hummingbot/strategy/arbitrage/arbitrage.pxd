@@ -41,3 +41,14 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object sell_market_trading_pair_tuple,
                                              object buy_market_conversion_rate,
                                              object sell_market_conversion_rate)
+
+cdef tuple c_find_best_profitable_step(list cumulative_amounts,
+                                       list cumulative_bid_values_adjusted,
+                                       list cumulative_ask_values_adjusted,
+                                       double buy_fee_percent,
+                                       double total_buy_flat_fees,
+                                       double sell_fee_percent,
+                                       double total_sell_flat_fees,
+                                       double min_profitability,
+                                       double buy_market_quote_balance,
+                                       double sell_market_base_balance)
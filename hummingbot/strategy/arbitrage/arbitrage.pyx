@@ -481,35 +481,40 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The matched order book steps are turned into cumulative depth arrays of native floats, and the fees and
+        balances are read once, so that `c_find_best_profitable_step` can walk the steps without any Decimal math.
+        Only the resulting order size is computed back in Decimal.
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
         :rtype: Tuple[float, float, float, float]
         """
         cdef:
-            object total_bid_value = s_decimal_0  # total revenue
-            object total_ask_value = s_decimal_0  # total cost
-            object total_bid_value_adjusted = s_decimal_0  # total revenue adjusted with exchange rate conversion
-            object total_ask_value_adjusted = s_decimal_0  # total cost adjusted with exchange rate conversion
-            object total_previous_step_base_amount = s_decimal_0
             object bid_price = s_decimal_0  # bid price
             object ask_price = s_decimal_0  # ask price
-            object profitability
             object best_profitable_order_amount = s_decimal_0
             object best_profitable_order_profitability = s_decimal_0
             object buy_fee
             object sell_fee
             object total_sell_flat_fees
             object total_buy_flat_fees
-            object quantized_profitable_base_amount
-            object net_sell_proceeds
-            object net_buy_costs
             object buy_market_quote_balance
             object sell_market_base_balance
+            object buy_market_adjusted_order_size
+            double step_amount
+            double cumulative_amount = 0
+            double cumulative_bid_value_adjusted = 0
+            double cumulative_ask_value_adjusted = 0
+            list cumulative_amounts = []
+            list cumulative_bid_values_adjusted = []
+            list cumulative_ask_values_adjusted = []
+            int best_step
+            int last_step
+            double profitability
+            bint balance_limited
             ExchangeBase buy_market = buy_market_trading_pair_tuple.market
             ExchangeBase sell_market = sell_market_trading_pair_tuple.market
-            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
-            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
 
         buy_market_conversion_rate = self.market_conversion_rate(buy_market_trading_pair_tuple)
         sell_market_conversion_rate = self.market_conversion_rate(sell_market_trading_pair_tuple)
@@ -518,78 +523,89 @@ cdef class ArbitrageStrategy(StrategyBase):
                                                                sell_market_trading_pair_tuple,
                                                                buy_market_conversion_rate,
                                                                sell_market_conversion_rate)
+        if len(profitable_orders) == 0:
+            return best_profitable_order_amount, best_profitable_order_profitability, bid_price, ask_price
+
+        for bid_price_adjusted, ask_price_adjusted, _, _, amount in profitable_orders:
+            step_amount = float(amount)
+            cumulative_amount += step_amount
+            cumulative_bid_value_adjusted += float(bid_price_adjusted) * step_amount
+            cumulative_ask_value_adjusted += float(ask_price_adjusted) * step_amount
+            cumulative_amounts.append(cumulative_amount)
+            cumulative_bid_values_adjusted.append(cumulative_bid_value_adjusted)
+            cumulative_ask_values_adjusted.append(cumulative_ask_value_adjusted)
 
-        # check if each step meets the profit level after fees, and is within the wallet balance
-        # fee must be calculated at every step because fee might change a potentially profitable order to unprofitable
         # market.c_get_fee returns a namedtuple with 2 keys "percent" and "flat_fees"
         # "percent" is the percent in decimals the exchange charges for the particular trade
         # "flat_fees" returns list of additional fees ie: [("ETH", 0.01), ("BNB", 2.5)]
-        # typically most exchanges will only have 1 flat fee (ie: gas cost of transaction in ETH)
-        for bid_price_adjusted, ask_price_adjusted, bid_price, ask_price, amount in profitable_orders:
-            buy_fee = buy_market.c_get_fee(
-                buy_market_trading_pair_tuple.base_asset,
-                buy_market_trading_pair_tuple.quote_asset,
-                buy_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.BUY,
-                total_previous_step_base_amount + amount,
-                ask_price
-            )
-            sell_fee = sell_market.c_get_fee(
-                sell_market_trading_pair_tuple.base_asset,
-                sell_market_trading_pair_tuple.quote_asset,
-                sell_market_trading_pair_tuple.market.get_taker_order_type(),
-                TradeType.SELL,
-                total_previous_step_base_amount + amount,
-                bid_price
-            )
-            # accumulated flat fees of exchange
-            total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
-            total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
-
-            # accumulated profitability with fees
-            total_bid_value_adjusted += bid_price_adjusted * amount
-            total_ask_value_adjusted += ask_price_adjusted * amount
-            net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee.percent) - total_sell_flat_fees
-            net_buy_costs = total_ask_value_adjusted * (1 + buy_fee.percent) + total_buy_flat_fees
-            profitability = net_sell_proceeds / net_buy_costs
-
-            # if current step is within minimum profitability, set to best profitable order
-            # because the total amount is greater than the previous step
-            if profitability > (1 + self._min_profitability):
-                best_profitable_order_amount = total_previous_step_base_amount + amount
-                best_profitable_order_profitability = profitability
-
-            if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
-                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {profitability}, "
-                                                   f"Current step profitability: {bid_price/ask_price},"
-                                                   f"bid, ask price, amount: {bid_price, ask_price, amount}")
-            buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
-            sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
-            # stop current step if buy/sell market does not have enough asset
-            if (buy_market_quote_balance < net_buy_costs or
-                    sell_market_base_balance < (total_previous_step_base_amount + amount)):
-                # use previous step as best profitable order if below min profitability
-                if profitability < (1 + self._min_profitability):
-                    break
-                if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
-                    self.log_with_clock(logging.DEBUG,
-                                        f"Not enough asset to complete this step. "
-                                        f"Quote asset needed: {total_ask_value + ask_price * amount}. "
-                                        f"Quote asset available balance: {buy_market_quote_balance}. "
-                                        f"Base asset needed: {total_bid_value + bid_price * amount}. "
-                                        f"Base asset available balance: {sell_market_base_balance}. ")
-
-                # market buys need to be adjusted to account for additional fees
-                buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
-                                                  (1 + buy_fee.percent))
-                # buy and sell with the amount of available base or quote asset, whichever is smaller
-                best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
-                best_profitable_order_profitability = profitability
-                break
-
-            total_bid_value += bid_price * amount
-            total_ask_value += ask_price * amount
-            total_previous_step_base_amount += amount
+        # The fees are estimated once, with the top of the books, and used for all the steps
+        _, _, top_bid_price, top_ask_price, top_amount = profitable_orders[0]
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            buy_market_trading_pair_tuple.market.get_taker_order_type(),
+            TradeType.BUY,
+            top_amount,
+            top_ask_price
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            sell_market_trading_pair_tuple.market.get_taker_order_type(),
+            TradeType.SELL,
+            top_amount,
+            top_bid_price
+        )
+        # accumulated flat fees of exchange
+        total_buy_flat_fees = self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)
+        total_sell_flat_fees = self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)
+        buy_market_quote_balance = buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset)
+        sell_market_base_balance = sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)
+
+        best_step, profitability, last_step, balance_limited = c_find_best_profitable_step(
+            cumulative_amounts,
+            cumulative_bid_values_adjusted,
+            cumulative_ask_values_adjusted,
+            float(buy_fee.percent),
+            float(total_buy_flat_fees),
+            float(sell_fee.percent),
+            float(total_sell_flat_fees),
+            float(self._min_profitability),
+            float(buy_market_quote_balance),
+            float(sell_market_base_balance))
+
+        _, _, bid_price, ask_price, _ = profitable_orders[last_step]
+        if self._logging_options & self.OPTION_LOG_PROFITABILITY_STEP:
+            for step in range(last_step + 1):
+                _, _, step_bid_price, step_ask_price, step_base_amount = profitable_orders[step]
+                step_profitability = c_step_profitability(cumulative_bid_values_adjusted[step],
+                                                          cumulative_ask_values_adjusted[step],
+                                                          float(buy_fee.percent),
+                                                          float(total_buy_flat_fees),
+                                                          float(sell_fee.percent),
+                                                          float(total_sell_flat_fees))
+                self.log_with_clock(logging.DEBUG, f"Total profitability with fees: {step_profitability}, "
+                                                   f"Current step profitability: {step_bid_price/step_ask_price},"
+                                                   f"bid, ask price, amount: "
+                                                   f"{step_bid_price, step_ask_price, step_base_amount}")
+
+        if balance_limited:
+            if self._logging_options & self.OPTION_LOG_INSUFFICIENT_ASSET:
+                self.log_with_clock(logging.DEBUG,
+                                    f"Not enough asset to complete this step. "
+                                    f"Quote asset needed: {cumulative_ask_values_adjusted[last_step]}. "
+                                    f"Quote asset available balance: {buy_market_quote_balance}. "
+                                    f"Base asset needed: {cumulative_amounts[last_step]}. "
+                                    f"Base asset available balance: {sell_market_base_balance}. ")
+            # market buys need to be adjusted to account for additional fees
+            buy_market_adjusted_order_size = ((buy_market_quote_balance / ask_price - total_buy_flat_fees) /
+                                              (1 + buy_fee.percent))
+            # buy and sell with the amount of available base or quote asset, whichever is smaller
+            best_profitable_order_amount = min(sell_market_base_balance, buy_market_adjusted_order_size)
+        elif best_step >= 0:
+            best_profitable_order_amount = sum(order[4] for order in profitable_orders[:best_step + 1])
+        if balance_limited or best_step >= 0:
+            best_profitable_order_profitability = Decimal(profitability)
 
         if self._logging_options & self.OPTION_LOG_FULL_PROFITABILITY_STEP:
             self.log_with_clock(
@@ -613,6 +629,28 @@ cdef class ArbitrageStrategy(StrategyBase):
 
     def ready_for_new_orders(self, market_pair):
         return self.c_ready_for_new_orders(market_pair)
+
+    @staticmethod
+    def find_best_profitable_step(cumulative_amounts: List[float],
+                                  cumulative_bid_values_adjusted: List[float],
+                                  cumulative_ask_values_adjusted: List[float],
+                                  buy_fee_percent: float,
+                                  total_buy_flat_fees: float,
+                                  sell_fee_percent: float,
+                                  total_sell_flat_fees: float,
+                                  min_profitability: float,
+                                  buy_market_quote_balance: float,
+                                  sell_market_base_balance: float) -> Tuple[int, float, int, bool]:
+        return c_find_best_profitable_step(cumulative_amounts,
+                                           cumulative_bid_values_adjusted,
+                                           cumulative_ask_values_adjusted,
+                                           buy_fee_percent,
+                                           total_buy_flat_fees,
+                                           sell_fee_percent,
+                                           total_sell_flat_fees,
+                                           min_profitability,
+                                           buy_market_quote_balance,
+                                           sell_market_base_balance)
     # ---------------------------------------------------------------
 
 
@@ -704,3 +742,70 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         pass
 
     return profitable_orders
+
+
+cdef inline double c_step_profitability(double cumulative_bid_value_adjusted,
+                                        double cumulative_ask_value_adjusted,
+                                        double buy_fee_percent,
+                                        double total_buy_flat_fees,
+                                        double sell_fee_percent,
+                                        double total_sell_flat_fees):
+    cdef:
+        double net_sell_proceeds = cumulative_bid_value_adjusted * (1 - sell_fee_percent) - total_sell_flat_fees
+        double net_buy_costs = cumulative_ask_value_adjusted * (1 + buy_fee_percent) + total_buy_flat_fees
+    return net_sell_proceeds / net_buy_costs
+
+
+cdef tuple c_find_best_profitable_step(list cumulative_amounts,
+                                       list cumulative_bid_values_adjusted,
+                                       list cumulative_ask_values_adjusted,
+                                       double buy_fee_percent,
+                                       double total_buy_flat_fees,
+                                       double sell_fee_percent,
+                                       double total_sell_flat_fees,
+                                       double min_profitability,
+                                       double buy_market_quote_balance,
+                                       double sell_market_base_balance):
+    """
+    Walks the cumulative depth of the matched order book steps once, in native floats, and finds the deepest step
+    that is still profitable after fees and within the wallet balances.
+
+    :param cumulative_amounts: base amount traded up to each step
+    :param cumulative_bid_values_adjusted: sell proceeds up to each step, in the conversion rate adjusted quote
+    :param cumulative_ask_values_adjusted: buy costs up to each step, in the conversion rate adjusted quote
+    :return: (index of the best profitable step or -1, its profitability, index of the last step checked, whether the
+        balances stopped the walk at the last step checked while it was still profitable, in which case the order
+        size has to be derived from the balances)
+    """
+    cdef:
+        int best_step = -1
+        int step = 0
+        int steps_count = len(cumulative_amounts)
+        double best_profitability = 0
+        double profitability
+        double net_buy_costs
+        double min_profitability_ratio = 1 + min_profitability
+
+    while step < steps_count:
+        profitability = c_step_profitability(cumulative_bid_values_adjusted[step],
+                                             cumulative_ask_values_adjusted[step],
+                                             buy_fee_percent,
+                                             total_buy_flat_fees,
+                                             sell_fee_percent,
+                                             total_sell_flat_fees)
+        # if current step is within minimum profitability, set to best profitable order
+        # because the total amount is greater than the previous step
+        if profitability > min_profitability_ratio:
+            best_step = step
+            best_profitability = profitability
+
+        net_buy_costs = cumulative_ask_values_adjusted[step] * (1 + buy_fee_percent) + total_buy_flat_fees
+        # stop at the current step if buy/sell market does not have enough asset
+        if buy_market_quote_balance < net_buy_costs or sell_market_base_balance < cumulative_amounts[step]:
+            # use previous step as best profitable order if below min profitability
+            if profitability < min_profitability_ratio:
+                return best_step, best_profitability, step, False
+            return best_step, profitability, step, True
+        step += 1
+
+    return best_step, best_profitability, steps_count - 1, False
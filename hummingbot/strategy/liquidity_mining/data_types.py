@@ -18,6 +18,9 @@ class PriceSize:
     def __repr__(self):
         return f"[ p: {self.price} s: {self.size} ]"
 
+    def copy(self) -> "PriceSize":
+        return PriceSize(self.price, self.size)
+
 
 class Proposal:
     """
@@ -34,6 +37,9 @@ class Proposal:
     def __repr__(self):
         return f"{self.market} buy: {self.buy} sell: {self.sell}"
 
+    def copy(self) -> "Proposal":
+        return Proposal(self.market, self.buy.copy(), self.sell.copy())
+
     def base(self):
         return self.market.split("-")[0]
 
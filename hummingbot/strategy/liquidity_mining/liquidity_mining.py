@@ -1,8 +1,8 @@
 import asyncio
 import logging
+import math
 from decimal import Decimal
-from statistics import mean
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -15,6 +15,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import estimate_fee
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.__utils__.trailing_indicators.range_volatility import RangeVolatilityIndicator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
     calculate_bid_ask_ratios_from_base_asset_ratio
@@ -79,8 +80,14 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._volatility_indicators = {market: RangeVolatilityIndicator(volatility_interval, avg_volatility_period)
+                                       for market in market_infos}
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._current_mid_prices: Dict[str, Decimal] = {}
+        # Proposals of each market (before the budget constraint) with the inputs they were created from
+        self._market_proposals: Dict[str, Tuple[Tuple, Proposal]] = {}
+        self._constrained_proposals: List[Proposal] = []
+        self._constrained_balances: Optional[Tuple] = None
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -119,13 +126,11 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
         self.update_mid_prices()
         self.update_volatility()
-        proposals = self.create_base_proposals()
+        orders_by_market = self.active_orders_by_market()
         self._token_balances = self.adjusted_available_balances()
-        if self._inventory_skew_enabled:
-            self.apply_inventory_skew(proposals)
-        self.apply_budget_constraint(proposals)
-        self.cancel_active_orders(proposals)
-        self.execute_orders_proposal(proposals)
+        proposals = self.create_proposals()
+        self.cancel_active_orders(proposals, orders_by_market)
+        self.execute_orders_proposal(proposals, orders_by_market)
 
         self._last_timestamp = timestamp
 
@@ -268,20 +273,58 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def stop(self, clock: Clock):
         pass
 
-    def create_base_proposals(self):
+    def create_proposals(self) -> List[Proposal]:
+        """
+        Creates the proposals of all markets: base proposals, inventory skew and budget constraint.
+        Only the markets whose mid price, volatility or budgets changed since the last tick get new proposals, and
+        the budget constraint is applied again only if a proposal or the available balances changed.
+        """
+        market_inputs = {market: self._proposal_inputs(market) for market in self._market_infos}
+        changed_markets = [market for market, inputs in market_inputs.items()
+                           if market not in self._market_proposals or self._market_proposals[market][0] != inputs]
+        if changed_markets:
+            proposals = self.create_base_proposals(changed_markets)
+            if self._inventory_skew_enabled:
+                self.apply_inventory_skew(proposals)
+            for proposal in proposals:
+                self._market_proposals[proposal.market] = (market_inputs[proposal.market], proposal)
+
+        balances = tuple(sorted(self._token_balances.items()))
+        if changed_markets or balances != self._constrained_balances:
+            proposals = [self._market_proposals[market][1].copy() for market in self._market_infos]
+            self.apply_budget_constraint(proposals)
+            self._constrained_proposals = proposals
+            self._constrained_balances = balances
+        return self._constrained_proposals
+
+    def _proposal_inputs(self, market: str) -> Tuple:
+        inputs = (self.mid_price(market), self._volatility[market])
+        if self._inventory_skew_enabled:
+            inputs += (self._buy_budgets[market], self._sell_budgets[market])
+        return inputs
+
+    def mid_price(self, market: str) -> Decimal:
+        """
+        The mid price of the market sampled at the current tick
+        """
+        mid_price = self._current_mid_prices.get(market)
+        return self._market_infos[market].get_mid_price() if mid_price is None else mid_price
+
+    def create_base_proposals(self, markets: Optional[List[str]] = None) -> List[Proposal]:
         """
         Each tick this strategy creates a set of proposals based on the market_info and the parameters from the
         constructor.
+        :param markets: the markets to create proposals for, all markets if not specified
         """
         proposals = []
-        for market, market_info in self._market_infos.items():
+        for market in (self._market_infos if markets is None else markets):
             spread = self._spread
             if not self._volatility[market].is_nan():
                 # volatility applies only when it is higher than the spread setting.
                 spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
             if self._max_spread > s_decimal_zero:
                 spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
+            mid_price = self.mid_price(market)
             buy_price = mid_price * (Decimal("1") - spread)
             buy_price = self._exchange.quantize_order_price(market, buy_price)
             buy_size = self.base_order_size(market, buy_price)
@@ -332,11 +375,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
         if self._token == base:
             return self._order_amount
         if price == s_decimal_zero:
-            price = self._market_infos[trading_pair].get_mid_price()
+            price = self.mid_price(trading_pair)
         return self._order_amount / price
 
     def apply_budget_constraint(self, proposals: List[Proposal]):
         balances = self._token_balances.copy()
+        buy_fee = estimate_fee(self._exchange.name, True)
         for proposal in proposals:
             if balances[proposal.base()] < proposal.sell.size:
                 proposal.sell.size = balances[proposal.base()]
@@ -345,7 +389,6 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
             quote_size = proposal.buy.size * proposal.buy.price
             quote_size = balances[proposal.quote()] if balances[proposal.quote()] < quote_size else quote_size
-            buy_fee = estimate_fee(self._exchange.name, True)
             buy_size = quote_size / (proposal.buy.price * (Decimal("1") + buy_fee.percent))
             proposal.buy.size = self._exchange.quantize_order_amount(proposal.market, buy_size)
             balances[proposal.quote()] -= quote_size
@@ -367,13 +410,22 @@ class LiquidityMiningStrategy(StrategyPyBase):
             return False
         return True
 
-    def cancel_active_orders(self, proposals: List[Proposal]):
+    def active_orders_by_market(self) -> Dict[str, List[LimitOrder]]:
+        orders_by_market = {market: [] for market in self._market_infos}
+        for order in self.active_orders:
+            orders_by_market.setdefault(order.trading_pair, []).append(order)
+        return orders_by_market
+
+    def cancel_active_orders(self,
+                             proposals: List[Proposal],
+                             orders_by_market: Optional[Dict[str, List[LimitOrder]]] = None):
         """
         Cancel any orders that have an order age greater than self._max_order_age or if orders are not within tolerance
         """
+        orders_by_market = self.active_orders_by_market() if orders_by_market is None else orders_by_market
         for proposal in proposals:
             to_cancel = False
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
+            cur_orders = orders_by_market.get(proposal.market, [])
             if cur_orders and any(order_age(o, self.current_timestamp) > self._max_order_age for o in cur_orders):
                 to_cancel = True
             elif self._refresh_times[proposal.market] <= self.current_timestamp and \
@@ -385,17 +437,19 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     # To place new order on the next tick
                     self._refresh_times[order.trading_pair] = self.current_timestamp + 0.1
 
-    def execute_orders_proposal(self, proposals: List[Proposal]):
+    def execute_orders_proposal(self,
+                                proposals: List[Proposal],
+                                orders_by_market: Optional[Dict[str, List[LimitOrder]]] = None):
         """
         Execute a list of proposals if the current timestamp is less than its refresh timestamp.
         Update the refresh timestamp.
         """
+        orders_by_market = self.active_orders_by_market() if orders_by_market is None else orders_by_market
+        maker_order_type: OrderType = self._exchange.get_maker_order_type()
         for proposal in proposals:
-            maker_order_type: OrderType = self._exchange.get_maker_order_type()
-            cur_orders = [o for o in self.active_orders if o.trading_pair == proposal.market]
-            if cur_orders or self._refresh_times[proposal.market] > self.current_timestamp:
+            if orders_by_market.get(proposal.market) or self._refresh_times[proposal.market] > self.current_timestamp:
                 continue
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            mid_price = self.mid_price(proposal.market)
             spread = s_decimal_zero
             if proposal.buy.size > 0:
                 spread = abs(proposal.buy.price - mid_price) / mid_price
@@ -471,8 +525,6 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         tokens = self.all_tokens()
         adjusted_bals = {t: s_decimal_zero for t in tokens}
-        total_bals = {t: s_decimal_zero for t in tokens}
-        total_bals.update(self._exchange.get_all_balances())
         for token in tokens:
             adjusted_bals[token] = self._exchange.get_available_balance(token)
         for order in self.active_orders:
@@ -490,7 +542,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         for proposal in proposals:
             buy_budget = self._buy_budgets[proposal.market]
             sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
+            mid_price = self.mid_price(proposal.market)
             total_order_size = proposal.sell.size + proposal.buy.size
             bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
                 float(sell_budget),
@@ -526,32 +578,22 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
     def update_mid_prices(self):
         """
-        Query asset markets for mid price
+        Query asset markets for mid price and add it to the market volatility indicator
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        for market, market_info in self._market_infos.items():
+            mid_price = market_info.get_mid_price()
+            self._current_mid_prices[market] = mid_price
+            if not mid_price.is_nan():
+                self._volatility_indicators[market].add_sample(float(mid_price))
 
     def update_volatility(self):
         """
-        Update volatility data from the market
+        Update volatility data from the market, the average of the (high - low) / low ranges of the mid price over the
+        last avg_volatility_period intervals
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        for market, indicator in self._volatility_indicators.items():
+            volatility = indicator.current_value
+            self._volatility[market] = s_decimal_nan if math.isnan(volatility) else Decimal(str(volatility))
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
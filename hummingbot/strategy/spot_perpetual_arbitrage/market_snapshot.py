@@ -0,0 +1,55 @@
+from decimal import Decimal
+from typing import List, Optional
+
+from hummingbot.connector.derivative.position import Position
+from hummingbot.core.event.events import FundingInfo
+
+
+class SpotPerpetualMarketSnapshot:
+    """
+    The state of the spot and perpetual markets at one strategy tick: order prices of both sides on both markets for
+    the order amount, perpetual positions, funding info and available balances. It is taken once per tick, with the
+    prices requested concurrently, and shared by the proposals creation, the budget checks and the status report so
+    that they all see the same state.
+    """
+    def __init__(self,
+                 timestamp: float,
+                 order_amount: Decimal,
+                 spot_buy_price: Decimal,
+                 spot_sell_price: Decimal,
+                 perp_buy_price: Decimal,
+                 perp_sell_price: Decimal,
+                 perp_positions: List[Position],
+                 funding_info: Optional[FundingInfo],
+                 spot_base_balance: Decimal,
+                 spot_quote_balance: Decimal,
+                 perp_quote_balance: Decimal):
+        """
+        :param timestamp: The strategy timestamp the snapshot was taken at
+        :param order_amount: The order amount the prices are for
+        :param spot_buy_price: The order price to buy the order amount on the spot market
+        :param spot_sell_price: The order price to sell the order amount on the spot market
+        :param perp_buy_price: The order price to buy the order amount on the perpetual market
+        :param perp_sell_price: The order price to sell the order amount on the perpetual market
+        :param perp_positions: The open positions on the perpetual market trading pair
+        :param funding_info: The perpetual market funding info, None if it is not available yet
+        :param spot_base_balance: The available base asset balance on the spot market
+        :param spot_quote_balance: The available quote asset balance on the spot market
+        :param perp_quote_balance: The available quote asset balance on the perpetual market
+        """
+        self.timestamp: float = timestamp
+        self.order_amount: Decimal = order_amount
+        self.spot_buy_price: Decimal = spot_buy_price
+        self.spot_sell_price: Decimal = spot_sell_price
+        self.perp_buy_price: Decimal = perp_buy_price
+        self.perp_sell_price: Decimal = perp_sell_price
+        self.perp_positions: List[Position] = perp_positions
+        self.funding_info: Optional[FundingInfo] = funding_info
+        self.spot_base_balance: Decimal = spot_base_balance
+        self.spot_quote_balance: Decimal = spot_quote_balance
+        self.perp_quote_balance: Decimal = perp_quote_balance
+
+    def __repr__(self):
+        return f"Spot: buy at {self.spot_buy_price}, sell at {self.spot_sell_price}\n" \
+               f"Perpetual: buy at {self.perp_buy_price}, sell at {self.perp_sell_price}\n" \
+               f"Order amount: {self.order_amount}\nPositions: {len(self.perp_positions)}"
@@ -2,7 +2,7 @@ import asyncio
 import logging
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -14,6 +14,7 @@ from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_candidate import OrderCandidate, PerpetualOrderCandidate
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
+    FundingInfo,
     SellOrderCompletedEvent,
 )
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, TradeType
@@ -21,6 +22,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.spot_perpetual_arbitrage.arb_proposal import ArbProposal, ArbProposalSide
+from hummingbot.strategy.spot_perpetual_arbitrage.market_snapshot import SpotPerpetualMarketSnapshot
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
 NaN = float("nan")
@@ -97,6 +99,7 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
         self._strategy_state = StrategyState.Closed
         self._ready_to_start = False
         self._last_arb_op_reported_ts = 0
+        self._last_snapshot: Optional[SpotPerpetualMarketSnapshot] = None
         perp_market_info.market.set_leverage(perp_market_info.trading_pair, self._perp_leverage)
 
     @property
@@ -128,6 +131,18 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
         return [s for s in self._perp_market_info.market.account_positions.values() if
                 s.trading_pair == self._perp_market_info.trading_pair and s.amount != s_decimal_zero]
 
+    @property
+    def last_snapshot(self) -> Optional[SpotPerpetualMarketSnapshot]:
+        return self._last_snapshot
+
+    @property
+    def funding_info(self) -> Optional[FundingInfo]:
+        try:
+            return self._perp_market_info.market.get_funding_info(self._perp_market_info.trading_pair)
+        except KeyError:
+            # Funding info is only available once the perpetual market has received it
+            return None
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point, is run every second (on normal tick setting).
@@ -180,9 +195,10 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             return
         if self.strategy_state == StrategyState.Closed and self._next_arbitrage_opening_ts > self.current_timestamp:
             return
-        proposals = await self.create_base_proposals()
+        snapshot = await self.take_market_snapshot()
+        proposals = await self.create_base_proposals(snapshot)
         if self._strategy_state == StrategyState.Opened:
-            perp_is_buy = False if self.perp_positions[0].amount > 0 else True
+            perp_is_buy = False if snapshot.perp_positions[0].amount > 0 else True
             proposals = [p for p in proposals if p.perp_side.is_buy == perp_is_buy and p.profit_pct() >=
                          self._min_closing_arbitrage_pct]
         else:
@@ -196,7 +212,7 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             self.logger().info(f"Profitability ({proposal.profit_pct():.2%}) is now above min_{pos_txt}_arbitrage_pct.")
             self._last_arb_op_reported_ts = self.current_timestamp
         self.apply_slippage_buffers(proposal)
-        if self.check_budget_constraint(proposal):
+        if self.check_budget_constraint(proposal, snapshot):
             self.execute_arb_proposal(proposal)
 
     def update_strategy_state(self):
@@ -213,11 +229,17 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             self._completed_closing_order_ids.clear()
             self._next_arbitrage_opening_ts = self.current_timestamp + self._next_arbitrage_opening_delay
 
-    async def create_base_proposals(self) -> List[ArbProposal]:
+    async def take_market_snapshot(self) -> SpotPerpetualMarketSnapshot:
         """
-        Creates a list of 2 base proposals, no filter.
-        :return: A list of 2 base proposals.
+        Requests the order prices of both sides on both markets concurrently and captures them together with the
+        perpetual positions, funding info and available balances, so that the decisions of a tick are all based on
+        the same market state.
+        :return: The market snapshot, also kept as the last snapshot.
         """
+        self._last_snapshot = await self._create_market_snapshot()
+        return self._last_snapshot
+
+    async def _create_market_snapshot(self) -> SpotPerpetualMarketSnapshot:
         tasks = [self._spot_market_info.market.get_order_price(self._spot_market_info.trading_pair, True,
                                                                self._order_amount),
                  self._spot_market_info.market.get_order_price(self._spot_market_info.trading_pair, False,
@@ -228,13 +250,37 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
                                                                self._order_amount)]
         prices = await safe_gather(*tasks, return_exceptions=True)
         spot_buy, spot_sell, perp_buy, perp_sell = [*prices]
+        spot_market = self._spot_market_info.market
+        perp_market = self._perp_market_info.market
+        return SpotPerpetualMarketSnapshot(
+            timestamp=self.current_timestamp,
+            order_amount=self._order_amount,
+            spot_buy_price=spot_buy,
+            spot_sell_price=spot_sell,
+            perp_buy_price=perp_buy,
+            perp_sell_price=perp_sell,
+            perp_positions=self.perp_positions,
+            funding_info=self.funding_info,
+            spot_base_balance=spot_market.get_available_balance(self._spot_market_info.base_asset),
+            spot_quote_balance=spot_market.get_available_balance(self._spot_market_info.quote_asset),
+            perp_quote_balance=perp_market.get_available_balance(self._perp_market_info.quote_asset),
+        )
+
+    async def create_base_proposals(self, snapshot: Optional[SpotPerpetualMarketSnapshot] = None) -> List[ArbProposal]:
+        """
+        Creates a list of 2 base proposals, no filter.
+        :param snapshot: The market snapshot to take the prices from, a new one is taken if not specified
+        :return: A list of 2 base proposals.
+        """
+        if snapshot is None:
+            snapshot = await self.take_market_snapshot()
         return [
-            ArbProposal(ArbProposalSide(self._spot_market_info, True, spot_buy),
-                        ArbProposalSide(self._perp_market_info, False, perp_sell),
-                        self._order_amount),
-            ArbProposal(ArbProposalSide(self._spot_market_info, False, spot_sell),
-                        ArbProposalSide(self._perp_market_info, True, perp_buy),
-                        self._order_amount)
+            ArbProposal(ArbProposalSide(self._spot_market_info, True, snapshot.spot_buy_price),
+                        ArbProposalSide(self._perp_market_info, False, snapshot.perp_sell_price),
+                        snapshot.order_amount),
+            ArbProposal(ArbProposalSide(self._spot_market_info, False, snapshot.spot_sell_price),
+                        ArbProposalSide(self._perp_market_info, True, snapshot.perp_buy_price),
+                        snapshot.order_amount)
         ]
 
     def apply_slippage_buffers(self, proposal: ArbProposal):
@@ -255,19 +301,24 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             arb_side.order_price = market.quantize_order_price(arb_side.market_info.trading_pair,
                                                                arb_side.order_price)
 
-    def check_budget_available(self) -> bool:
+    def check_budget_available(self, snapshot: Optional[SpotPerpetualMarketSnapshot] = None) -> bool:
         """
         Checks if there's any balance for trading to be possible at all
+        :param snapshot: The market snapshot to take the balances from, the markets are queried if not specified
         :return: True if user has available balance enough for orders submission.
         """
 
         spot_base, spot_quote = self._spot_market_info.trading_pair.split("-")
         perp_base, perp_quote = self._perp_market_info.trading_pair.split("-")
 
-        balance_spot_base = self._spot_market_info.market.get_available_balance(spot_base)
-        balance_spot_quote = self._spot_market_info.market.get_available_balance(spot_quote)
-
-        balance_perp_quote = self._perp_market_info.market.get_available_balance(perp_quote)
+        if snapshot is not None:
+            balance_spot_base = snapshot.spot_base_balance
+            balance_spot_quote = snapshot.spot_quote_balance
+            balance_perp_quote = snapshot.perp_quote_balance
+        else:
+            balance_spot_base = self._spot_market_info.market.get_available_balance(spot_base)
+            balance_spot_quote = self._spot_market_info.market.get_available_balance(spot_quote)
+            balance_perp_quote = self._perp_market_info.market.get_available_balance(perp_quote)
 
         if balance_spot_base == s_decimal_zero and balance_spot_quote == s_decimal_zero:
             self.logger().info(f"Cannot arbitrage, {self._spot_market_info.market.display_name} {spot_base} balance "
@@ -282,18 +333,28 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
 
         return True
 
-    def check_budget_constraint(self, proposal: ArbProposal) -> bool:
+    def check_budget_constraint(self,
+                                proposal: ArbProposal,
+                                snapshot: Optional[SpotPerpetualMarketSnapshot] = None) -> bool:
         """
         Check balances on both exchanges if there is enough to submit both orders in a proposal.
         :param proposal: An arbitrage proposal
+        :param snapshot: The market snapshot the proposal was created from, to take the balances and the perpetual
+        positions from, the markets are queried if not specified
         :return: True if user has available balance enough for both orders submission.
         """
-        return self.check_spot_budget_constraint(proposal) and self.check_perpetual_budget_constraint(proposal)
+        if snapshot is not None and not self.check_budget_available(snapshot):
+            return False
+        return self.check_spot_budget_constraint(proposal, snapshot) and \
+            self.check_perpetual_budget_constraint(proposal, snapshot)
 
-    def check_spot_budget_constraint(self, proposal: ArbProposal) -> bool:
+    def check_spot_budget_constraint(self,
+                                     proposal: ArbProposal,
+                                     snapshot: Optional[SpotPerpetualMarketSnapshot] = None) -> bool:
         """
         Check balance on spot exchange.
         :param proposal: An arbitrage proposal
+        :param snapshot: The market snapshot to take the balances from, the market is queried if not specified
         :return: True if user has available balance enough for both orders submission.
         """
         proposal_side = proposal.spot_side
@@ -309,7 +370,14 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             price=proposal_side.order_price,
         )
 
-        adjusted_candidate_order = budget_checker.adjust_candidate(order_candidate, all_or_none=True)
+        if snapshot is None:
+            adjusted_candidate_order = budget_checker.adjust_candidate(order_candidate, all_or_none=True)
+        else:
+            adjusted_candidate_order = self.adjust_candidate_to_balances(
+                market_info.market,
+                order_candidate,
+                {market_info.base_asset: snapshot.spot_base_balance,
+                 market_info.quote_asset: snapshot.spot_quote_balance})
 
         if adjusted_candidate_order.amount < order_amount:
             self.logger().info(
@@ -320,21 +388,26 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
 
         return True
 
-    def check_perpetual_budget_constraint(self, proposal: ArbProposal) -> bool:
+    def check_perpetual_budget_constraint(self,
+                                          proposal: ArbProposal,
+                                          snapshot: Optional[SpotPerpetualMarketSnapshot] = None) -> bool:
         """
         Check balance on spot exchange.
         :param proposal: An arbitrage proposal
+        :param snapshot: The market snapshot to take the balance and the positions from, the market is queried if not
+        specified
         :return: True if user has available balance enough for both orders submission.
         """
         proposal_side = proposal.perp_side
         order_amount = proposal.order_amount
         market_info = proposal_side.market_info
         budget_checker = market_info.market.budget_checker
+        perp_positions = snapshot.perp_positions if snapshot is not None else self.perp_positions
 
         position_close = False
-        if self.perp_positions and abs(self.perp_positions[0].amount) == order_amount:
+        if perp_positions and abs(perp_positions[0].amount) == order_amount:
             perp_side = proposal.perp_side
-            cur_perp_pos_is_buy = True if self.perp_positions[0].amount > 0 else False
+            cur_perp_pos_is_buy = True if perp_positions[0].amount > 0 else False
             if perp_side != cur_perp_pos_is_buy:
                 position_close = True
 
@@ -349,7 +422,13 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             position_close=position_close,
         )
 
-        adjusted_candidate_order = budget_checker.adjust_candidate(order_candidate, all_or_none=True)
+        if snapshot is None:
+            adjusted_candidate_order = budget_checker.adjust_candidate(order_candidate, all_or_none=True)
+        else:
+            adjusted_candidate_order = self.adjust_candidate_to_balances(
+                market_info.market,
+                order_candidate,
+                {market_info.quote_asset: snapshot.perp_quote_balance})
 
         if adjusted_candidate_order.amount < order_amount:
             self.logger().info(
@@ -405,13 +484,14 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
             self._strategy_state = StrategyState.Opening
             self._completed_opening_order_ids.clear()
 
-    def active_positions_df(self) -> pd.DataFrame:
+    def active_positions_df(self, perp_positions: Optional[List[Position]] = None) -> pd.DataFrame:
         """
         Returns a new dataframe on current active perpetual positions.
+        :param perp_positions: The positions to report, the current ones if not specified
         """
         columns = ["Symbol", "Type", "Entry Price", "Amount", "Leverage", "Unrealized PnL"]
         data = []
-        for pos in self.perp_positions:
+        for pos in perp_positions if perp_positions is not None else self.perp_positions:
             data.append([
                 pos.trading_pair,
                 "LONG" if pos.amount > 0 else "SHORT",
@@ -423,17 +503,52 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
 
         return pd.DataFrame(data=data, columns=columns)
 
+    @staticmethod
+    def adjust_candidate_to_balances(market: ConnectorBase,
+                                     order_candidate: OrderCandidate,
+                                     balances: Dict[str, Decimal]) -> OrderCandidate:
+        """
+        Same as the market budget checker `adjust_candidate` with all_or_none, but checks the collaterals against
+        the balances given (e.g. from a market snapshot) instead of the current market balances.
+        :param market: The market the order is for
+        :param order_candidate: The candidate order to check
+        :param balances: The available balances by token, the market is queried for the tokens not included
+        :return: The adjusted order candidate, with a zero amount if the balances are insufficient
+        """
+        order_candidate = market.budget_checker.populate_collateral_entries(order_candidate)
+        collaterals = [order_candidate.order_collateral, order_candidate.percent_fee_collateral]
+        collaterals.extend(order_candidate.fixed_fee_collaterals)
+        available_balances = {}
+        for collateral in collaterals:
+            if collateral is not None:
+                token = collateral[0]
+                available_balances[token] = balances[token] if token in balances \
+                    else market.get_available_balance(token)
+        order_candidate.adjust_from_balances(available_balances)
+        if order_candidate.resized:
+            order_candidate.set_to_zero()
+        return order_candidate
+
     async def format_status(self) -> str:
         """
         Returns a status string formatted to display nicely on terminal. The strings composes of 4 parts: markets,
         assets, spread and warnings(if any).
         """
+        snapshot = self._last_snapshot
+        if snapshot is None or snapshot.timestamp != self.current_timestamp or \
+                snapshot.order_amount != self._order_amount:
+            # The last snapshot is the state the current tick decisions are based on, it is not replaced here
+            snapshot = await self._create_market_snapshot()
+
         columns = ["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"]
         data = []
-        for market_info in [self._spot_market_info, self._perp_market_info]:
+        market_infos = [self._spot_market_info, self._perp_market_info]
+        quote_prices = await safe_gather(*[market_info.market.get_quote_price(market_info.trading_pair, is_buy,
+                                                                              self._order_amount)
+                                           for market_info in market_infos for is_buy in (True, False)])
+        for i, market_info in enumerate(market_infos):
             market, trading_pair, base_asset, quote_asset = market_info
-            buy_price = await market.get_quote_price(trading_pair, True, self._order_amount)
-            sell_price = await market.get_quote_price(trading_pair, False, self._order_amount)
+            buy_price, sell_price = quote_prices[2 * i], quote_prices[2 * i + 1]
             mid_price = (buy_price + sell_price) / 2
             data.append([
                 market.display_name,
@@ -446,9 +561,12 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
         lines = []
         lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
 
+        if snapshot.funding_info is not None:
+            lines.extend(["", f"  Funding rate: {snapshot.funding_info.rate:.4%}"])
+
         # See if there're any active positions.
-        if len(self.perp_positions) > 0:
-            df = self.active_positions_df()
+        if len(snapshot.perp_positions) > 0:
+            df = self.active_positions_df(snapshot.perp_positions)
             lines.extend(["", "  Positions:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
         else:
             lines.extend(["", "  No active positions."])
@@ -457,7 +575,7 @@ class SpotPerpetualArbitrageStrategy(StrategyPyBase):
         lines.extend(["", "  Assets:"] +
                      ["    " + line for line in str(assets_df).split("\n")])
 
-        proposals = await self.create_base_proposals()
+        proposals = await self.create_base_proposals(snapshot)
         lines.extend(["", "  Opportunity:"] + self.short_proposal_msg(proposals))
 
         warning_lines = self.network_warning([self._spot_market_info])
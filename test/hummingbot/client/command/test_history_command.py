@@ -161,7 +161,7 @@ class HistoryCommandTest(unittest.TestCase):
                 session.add(t)
             session.commit()
 
-        self.app.list_trades(start_time=0)
+        self.async_run_with_timeout(self.app.list_trades(start_time=0))
 
         self.assertEqual(1, len(captures))
 
@@ -2,12 +2,17 @@ import asyncio
 import unittest
 from collections import Awaitable
 from copy import deepcopy
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 from hummingbot.client.config.config_helpers import read_system_configs_from_yml
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.mock.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 
 
 class OrderBookCommandTest(unittest.TestCase):
@@ -68,3 +73,84 @@ class OrderBookCommandTest(unittest.TestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_paper_trade_order_book_includes_simulated_fills(self, notify_mock):
+        global_config_map["tables_format"].value = "psql"
+
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        exchange_name = "paper"
+        exchange = MockPaperExchange()
+        self.app.markets[exchange_name] = exchange
+        trading_pair = "BTC-USDT"
+        exchange.set_balanced_order_book(
+            trading_pair,
+            mid_price=10,
+            min_price=8.5,
+            max_price=12.5,
+            price_step_size=1,
+            volume_step_size=1,
+        )
+        # A simulated market buy consumed the best ask level, it is no longer displayed
+        exchange.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            timestamp=1,
+            order_id="buy-BTC-USDT-1",
+            trading_pair=trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.MARKET,
+            price=Decimal("10.5"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+        self.async_run_with_timeout(self.app.show_order_book(lines=2, exchange=exchange_name, live=False))
+
+        self.assertEqual(1, len(captures))
+
+        df_str_expected = (
+            "  market: MockPaperExchange BTC-USDT"
+            "\n    +-------------+--------------+-------------+--------------+"
+            "\n    |   bid_price |   bid_volume |   ask_price |   ask_volume |"
+            "\n    |-------------+--------------+-------------+--------------|"
+            "\n    |         9.5 |            1 |        11.5 |            2 |"
+            "\n    |         8.5 |            2 |        12.5 |            3 |"
+            "\n    +-------------+--------------+-------------+--------------+"
+        )
+
+        self.assertEqual(df_str_expected, captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.cls_display_delay")
+    def test_show_live_order_book_formats_only_changed_top_levels(self, display_delay_mock, _):
+        exchange_name = "paper"
+        exchange = MockPaperExchange()
+        self.app.markets[exchange_name] = exchange
+        trading_pair = "BTC-USDT"
+        exchange.set_balanced_order_book(
+            trading_pair,
+            mid_price=10,
+            min_price=8.5,
+            max_price=11.5,
+            price_step_size=1,
+            volume_step_size=1,
+        )
+
+        displayed_texts = []
+
+        async def display(text, _):
+            displayed_texts.append(text)
+            if len(displayed_texts) == 3:
+                self.app.app.live_updates = False
+
+        display_delay_mock.side_effect = display
+
+        with patch("hummingbot.client.command.order_book_command.format_df_for_printout",
+                   wraps=format_df_for_printout) as format_mock:
+            self.async_run_with_timeout(self.app.show_order_book(lines=1, exchange=exchange_name, live=True), 3)
+
+        self.assertEqual(3, len(displayed_texts))
+        self.assertEqual(1, format_mock.call_count)
+        self.assertIn("9.5", displayed_texts[0])
+        self.assertNotIn("8.5", displayed_texts[0])
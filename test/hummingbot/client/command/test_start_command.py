@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+from copy import deepcopy
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import ClockMode
+from test.mock.mock_cli import CLIMockingAssistant
+
+
+class StartCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+
+        self.app = HummingbotApplication()
+        self.cli_mock_assistant = CLIMockingAssistant(self.app.app)
+        self.cli_mock_assistant.start()
+        self.global_config_backup = deepcopy(global_config_map)
+
+        self.market = MagicMock()
+        self.market.ready = True
+        self.market.limit_orders = []
+        self.order_book = MagicMock()
+        self.market.get_order_book.return_value = self.order_book
+        self.app.markets = {"binance": self.market}
+        self.app.market_trading_pairs_map = {"binance": ["COINALPHA-HBOT"]}
+        self.app.markets_recorder = MagicMock()
+        self.app.strategy = MagicMock()
+        self.app.strategy_name = "pure_market_making"
+        self.app._trading_required = False
+
+    def tearDown(self) -> None:
+        self.cli_mock_assistant.stop()
+        self.reset_global_config()
+        super().tearDown()
+
+    def reset_global_config(self):
+        for key, value in self.global_config_backup.items():
+            global_config_map[key] = value
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._run_clock", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.start_command.Clock")
+    def test_start_market_making_with_realtime_clock(self, clock_class_mock: MagicMock, _: AsyncMock):
+        global_config_map["clock_mode"].value = "realtime"
+
+        self.async_run_with_timeout(self.app.start_market_making())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        clock_class_mock.assert_called_once_with(ClockMode.REALTIME)
+        clock = clock_class_mock.return_value
+        clock.add_iterator.assert_any_call(self.market)
+        clock.add_iterator.assert_any_call(self.app.strategy)
+        clock.add_event_driven_iterator.assert_not_called()
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication._run_clock", new_callable=AsyncMock)
+    @patch("hummingbot.client.command.start_command.Clock")
+    def test_start_market_making_with_event_driven_clock(self, clock_class_mock: MagicMock, _: AsyncMock):
+        global_config_map["clock_mode"].value = "event_driven"
+        global_config_map["clock_event_debounce"].value = 0.01
+        global_config_map["clock_event_min_interval"].value = 0.1
+        clock_class_mock.return_value.clock_mode = ClockMode.EVENT_DRIVEN
+
+        self.async_run_with_timeout(self.app.start_market_making())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        clock_class_mock.assert_called_once_with(ClockMode.EVENT_DRIVEN, event_debounce=0.01, event_min_interval=0.1)
+        clock = clock_class_mock.return_value
+        clock.add_iterator.assert_any_call(self.app.strategy)
+        self.market.get_order_book.assert_called_once_with("COINALPHA-HBOT")
+        clock.add_event_driven_iterator.assert_called_once_with(self.app.strategy, [self.order_book])
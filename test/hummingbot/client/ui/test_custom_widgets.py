@@ -5,7 +5,7 @@ from typing import Awaitable
 from prompt_toolkit.document import Document
 
 from hummingbot.client.config.config_helpers import read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -89,3 +89,57 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+    def test_get_line_matches_of_different_styles_in_order(self):
+        self.lexer.text_style_tag_map.update({"&cOTHER_WORD": "SPECIAL_LABEL"})
+        TEXT = "&cOTHER_WORD THEN &cSPECIAL_WORD"
+        get_line = self.lexer.lex_document(Document(text=TEXT))
+
+        expected_fragments = [
+            ("", ""),
+            (self.lexer.get_css_style("output-pane"), "&c"),
+            (self.lexer.get_css_style("SPECIAL_LABEL"), "OTHER_WORD"),
+            ("", " THEN "),
+            (self.lexer.get_css_style("output-pane"), "&c"),
+            (self.lexer.get_css_style("SPECIAL_LABEL"), "SPECIAL_WORD"),
+            ("", ""),
+        ]
+        self.assertEqual(expected_fragments, get_line(0))
+        del self.lexer.text_style_tag_map["&cOTHER_WORD"]
+
+    def test_get_line_reuses_lexed_lines(self):
+        TEXT = "SOME RANDOM TEXT WITH &cSPECIAL_WORD"
+        first_fragments = self.lexer.lex_document(Document(text=TEXT))(0)
+        second_fragments = self.lexer.lex_document(Document(text=f"OTHER LINE\n{TEXT}"))(1)
+
+        self.assertEqual(first_fragments, second_fragments)
+        self.assertIn(TEXT, self.lexer._line_fragments_cache)
+
+    def test_log_keeps_max_line_count(self):
+        text_area = CustomTextArea(max_line_count=3)
+        text_area.log("line 1")
+        text_area.log("line 2\nline 3")
+        text_area.log("line 4")
+
+        self.assertEqual(["line 2", "line 3", "line 4"], list(text_area.log_lines))
+        self.assertEqual("line 2\nline 3\nline 4", text_area.text)
+
+        text_area.log("live update", save_log=False)
+        self.assertEqual("live update", text_area.text)
+
+        text_area.log("line 5", silent=True)
+        self.assertEqual("live update", text_area.text)
+        text_area.log("line 6")
+        self.assertEqual("line 4\nline 5\nline 6", text_area.text)
+
+    def test_log_refreshes_are_rate_limited(self):
+        text_area = CustomTextArea(refresh_interval=0.05)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual("", text_area.text)
+
+        text_area.log("line 1")
+        text_area.log("line 2")
+        self.assertEqual("", text_area.text)
+
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual("\nline 1\nline 2", text_area.text)
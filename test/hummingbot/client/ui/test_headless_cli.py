@@ -0,0 +1,53 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.config_helpers import read_system_configs_from_yml
+from hummingbot.client.ui.headless_cli import HeadlessCLI
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import HummingbotUIEvent
+
+
+class HeadlessCLITest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.ev_loop.run_until_complete(read_system_configs_from_yml())
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.input_handler = MagicMock()
+        self.cli = HeadlessCLI(input_handler=self.input_handler)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.ui.headless_cli.init_logging")
+    def test_run_triggers_ui_start_and_waits_for_exit(self, _):
+        start_logger = EventLogger()
+        self.cli.add_listener(HummingbotUIEvent.Start, start_logger)
+
+        run_task = self.ev_loop.create_task(self.cli.run())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(1, len(start_logger.event_log))
+        self.assertFalse(run_task.done())
+
+        self.cli.exit()
+        self.async_run_with_timeout(run_task)
+
+    @patch.object(HeadlessCLI, "logger")
+    def test_log_writes_saved_text_to_the_logs(self, logger_mock):
+        self.cli.log("Saved text")
+        self.cli.log("Live update", save_log=False)
+
+        logger_mock.return_value.info.assert_called_once_with("Saved text")
+
+    @patch.object(HeadlessCLI, "logger")
+    def test_prompt_stops_the_config(self, _):
+        result = self.async_run_with_timeout(self.cli.prompt(prompt="Do you want to continue? (Yes/No) >>> "))
+
+        self.assertEqual("", result)
+        self.assertTrue(self.cli.to_stop_config)
@@ -10,6 +10,7 @@ import pandas as pd
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.ui.interface_utils import start_trade_monitor, \
     format_bytes, start_timer, start_process_monitor, format_df_for_printout
+from hummingbot.model.trade_fill_reader import TradesSummary
 
 
 class ExpectedException(Exception):
@@ -82,7 +83,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_app.trade_fill_reader.get_trades_summary = AsyncMock(return_value=TradesSummary(1, 1))
+        mock_app.trade_fill_reader.get_trades = AsyncMock(return_value=[MagicMock(market="ExchangeA", symbol="HBOT-USDT")])
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
@@ -93,6 +95,9 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 1.00%', mock_result.log.call_args_list[1].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
+        # The trades are not reloaded while the trades summary is unchanged
+        self.assertEqual(2, mock_app.trade_fill_reader.get_trades_summary.call_count)
+        self.assertEqual(1, mock_app.trade_fill_reader.get_trades.call_count)
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
     @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
@@ -102,10 +107,11 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
+        mock_app.trade_fill_reader.get_trades_summary = AsyncMock(return_value=TradesSummary(2, 1))
+        mock_app.trade_fill_reader.get_trades = AsyncMock(return_value=[
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="HBOT-BTC")
-        ]
+        ])
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
@@ -124,10 +130,11 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
+        mock_app.trade_fill_reader.get_trades_summary = AsyncMock(return_value=TradesSummary(2, 1))
+        mock_app.trade_fill_reader.get_trades = AsyncMock(return_value=[
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="BTC-USDT")
-        ]
+        ])
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
@@ -144,12 +151,27 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
-        mock_app.markets.return_values = {"a": MagicMock(ready=False)}
+        mock_app.markets = {"a": MagicMock(ready=False)}
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
         self.assertEqual(1, mock_result.log.call_count)
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
+        mock_app.trade_fill_reader.get_trades_summary.assert_not_called()
+
+    @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    def test_start_trade_monitor_sleeps_after_error(self, mock_hb_app, mock_sleep):
+        mock_result = MagicMock()
+        mock_app = mock_hb_app.main_application()
+        mock_app.strategy_task.done.return_value = False
+        mock_app.markets = {"a": MagicMock(ready=True)}
+        mock_app.trade_fill_reader.get_trades_summary = AsyncMock(side_effect=ExpectedException())
+        mock_sleep.side_effect = asyncio.CancelledError()
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(mock_result))
+        mock_app.logger().exception.assert_called_once_with("start_trade_monitor failed.")
+        mock_sleep.assert_awaited_once_with(2)
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
@@ -158,7 +180,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = []
+        mock_app.trade_fill_reader.get_trades_summary = AsyncMock(return_value=TradesSummary(0, None))
+        mock_app.trade_fill_reader.get_trades = AsyncMock(return_value=[])
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
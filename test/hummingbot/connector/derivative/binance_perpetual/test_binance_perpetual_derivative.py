@@ -414,6 +414,18 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
 
         self.assertEqual(len(self.exchange.account_positions), 0)
 
+    @aioresponses()
+    def test_untracked_closed_position_on_stream_event_does_not_request_positions(self, mock_api):
+        account_update = self._get_account_update_ws_event_single_position_dict()
+        account_update["a"]["P"][0]["pa"] = "0"
+
+        # Processed synchronously, no positions request is registered in the mock
+        self.assertTrue(self.exchange._process_user_stream_event_nowait(account_update))
+
+        self.assertEqual(0, len(self.exchange.account_positions))
+        self.assertEqual(Decimal("122624.12345678"), self.exchange.get_balance("USDT"))
+        self.assertEqual(Decimal("100.12345678"), self.exchange.get_available_balance("USDT"))
+
     @aioresponses()
     def test_set_position_mode_initial_mode_is_none(self, mock_api):
         self.assertIsNone(self.exchange.position_mode)
@@ -1239,6 +1251,61 @@ class BinancePerpetualDerivativeUnitTest(unittest.TestCase):
 
         self.assertEqual(0, len(in_flight_orders["OID1"].order_fills))
 
+    @aioresponses()
+    @patch("hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivative."
+           "BinancePerpetualDerivative.current_timestamp")
+    def test_update_order_status_uses_open_orders_for_many_orders(self, req_mock, mock_timestamp):
+        self.exchange._last_poll_timestamp = 0
+        mock_timestamp.return_value = 1
+
+        for i in [1, 2, 3]:
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=f"888677{i}",
+                trading_pair=self.trading_pair,
+                trading_type=TradeType.SELL,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+                leverage=1,
+                position=PositionAction.OPEN,
+            )
+
+        def order_response(client_order_id: str, exchange_order_id: int, status: str) -> Dict[str, Any]:
+            return {"clientOrderId": client_order_id,
+                    "orderId": exchange_order_id,
+                    "status": status,
+                    "symbol": self.symbol,
+                    "updateTime": 2000}
+
+        open_orders_url = web_utils.rest_url(
+            CONSTANTS.OPEN_ORDERS_URL, domain=self.domain, api_version=CONSTANTS.API_VERSION
+        )
+        req_mock.get(re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps([order_response("OID1", 8886771, "NEW"),
+                                      order_response("OID2", 8886772, "PARTIALLY_FILLED")]))
+        order_url = web_utils.rest_url(
+            CONSTANTS.ORDER_URL, domain=self.domain, api_version=CONSTANTS.API_VERSION
+        )
+        req_mock.get(re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(order_response("OID3", 8886773, "CANCELED")))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        # One open orders request for the trading pair, and one order request for the order not open anymore
+        requested_urls = [str(url) for (method, url) in req_mock.requests.keys()]
+        self.assertEqual(1, len([url for url in requested_urls if CONSTANTS.OPEN_ORDERS_URL in url]))
+        self.assertEqual(1, len([url for url in requested_urls if "origClientOrderId=OID3" in url]))
+
+        in_flight_orders = self.exchange._client_order_tracker.all_orders
+        self.assertEqual(OrderState.OPEN, in_flight_orders["OID1"].current_state)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, in_flight_orders["OID2"].current_state)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+
+        # Orders are not checked again before their check interval elapsed
+        self.assertEqual([], self.exchange._polling_scheduler.orders_due(
+            self.exchange._client_order_tracker.active_orders.values(), 5))
+
     @aioresponses()
     def test_set_leverage_successful(self, req_mock):
         trading_pair = f"{self.base_asset}-{self.quote_asset}"
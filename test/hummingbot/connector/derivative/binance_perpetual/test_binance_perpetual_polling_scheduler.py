@@ -0,0 +1,59 @@
+import unittest
+from decimal import Decimal
+
+import hummingbot.connector.derivative.binance_perpetual.constants as CONSTANTS
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_polling_scheduler import (
+    BinancePerpetualPollingScheduler
+)
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder
+
+
+class BinancePerpetualPollingSchedulerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.scheduler = BinancePerpetualPollingScheduler(min_interval=10, max_interval=120, age_factor=0.25)
+
+    @staticmethod
+    def _order(client_order_id: str, creation_timestamp: float) -> InFlightOrder:
+        return InFlightOrder(client_order_id=client_order_id,
+                             trading_pair="COINALPHA-HBOT",
+                             order_type=OrderType.LIMIT,
+                             trade_type=TradeType.BUY,
+                             amount=Decimal("1"),
+                             creation_timestamp=creation_timestamp,
+                             price=Decimal("10"))
+
+    def test_check_interval_grows_with_order_age(self):
+        self.assertEqual(10, self.scheduler.check_interval(self._order("OID1", 1000), 1001))
+        self.assertEqual(25, self.scheduler.check_interval(self._order("OID1", 1000), 1100))
+        self.assertEqual(120, self.scheduler.check_interval(self._order("OID1", 0), 10000))
+
+    def test_orders_due(self):
+        young_order = self._order("OID1", 1000)
+        old_order = self._order("OID2", 0)
+        new_order = self._order("OID3", 1010)
+        self.scheduler.record_check("OID1", 1000)
+        self.scheduler.record_check("OID2", 1005)
+
+        due_orders = self.scheduler.orders_due([young_order, old_order, new_order], 1020)
+
+        # The old order was checked less than 120s ago, the never checked order comes first
+        self.assertEqual(["OID3", "OID1"], [o.client_order_id for o in due_orders])
+
+    def test_prune_forgets_untracked_orders(self):
+        self.scheduler.record_check("OID1", 1000)
+        self.scheduler.record_check("OID2", 1000)
+
+        self.scheduler.prune(["OID2"])
+
+        due_orders = self.scheduler.orders_due([self._order("OID1", 1000), self._order("OID2", 1000)], 1001)
+        self.assertEqual(["OID1"], [o.client_order_id for o in due_orders])
+
+    def test_weight_budget_keeps_reserve_for_trading(self):
+        throttler = AsyncThrottler(CONSTANTS.RATE_LIMITS)
+        scheduler = BinancePerpetualPollingScheduler(min_interval=10, max_interval=120, weight_reserve_pct=0.25)
+
+        self.assertEqual(1800, scheduler.weight_budget(throttler, CONSTANTS.REQUEST_WEIGHT))
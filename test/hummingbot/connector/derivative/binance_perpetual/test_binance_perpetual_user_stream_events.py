@@ -0,0 +1,87 @@
+import unittest
+
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_user_stream_events import (
+    AccountUpdateRecord,
+    BalanceUpdateRecord,
+    OrderTradeUpdateRecord,
+    PositionUpdateRecord,
+    decode_user_stream_event,
+)
+from hummingbot.core.data_type.in_flight_order import OrderState
+
+
+class BinancePerpetualUserStreamEventsTests(unittest.TestCase):
+
+    def test_decode_order_trade_update(self):
+        event_message = {
+            "e": "ORDER_TRADE_UPDATE",
+            "E": 1568879465651,
+            "T": 1568879465650,
+            "o": {
+                "s": "COINALPHAHBOT",
+                "c": "OID1",
+                "X": "PARTIALLY_FILLED",
+                "i": 8886774,
+                "l": "0.1",
+                "L": "10000",
+                "N": "HBOT",
+                "n": "20",
+                "T": 1568879465651,
+                "t": 1,
+                "ps": "SHORT",
+            }
+        }
+
+        record = decode_user_stream_event(event_message)
+
+        self.assertIsInstance(record, OrderTradeUpdateRecord)
+        self.assertEqual("OID1", record.client_order_id)
+        self.assertEqual("8886774", record.exchange_order_id)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, record.new_state)
+        self.assertTrue(record.has_trade)
+        self.assertEqual(1568879465.651, record.fill_timestamp)
+        self.assertEqual("10000", record.fill_price)
+        self.assertEqual("0.1", record.fill_base_amount)
+        self.assertEqual("HBOT", record.fee_asset)
+        self.assertEqual("20", record.fee_amount)
+        self.assertEqual("SHORT", record.position_side)
+
+    def test_decode_order_update_without_trade(self):
+        event_message = {
+            "e": "ORDER_TRADE_UPDATE",
+            "T": 1568879465650,
+            "o": {"c": "OID1", "X": "CANCELED", "i": 8886774, "t": 0},
+        }
+
+        record = decode_user_stream_event(event_message)
+
+        self.assertFalse(record.has_trade)
+        self.assertEqual(OrderState.CANCELED, record.new_state)
+        self.assertIsNone(record.fee_asset)
+        self.assertEqual("0", record.fee_amount)
+        self.assertEqual("LONG", record.position_side)
+
+    def test_decode_account_update(self):
+        event_message = {
+            "e": "ACCOUNT_UPDATE",
+            "T": 1564745798938,
+            "a": {
+                "m": "ORDER",
+                "B": [{"a": "USDT", "wb": "122624.12345678", "cw": "100.12345678", "bc": "50.12345678"}],
+                "P": [{"s": "COINALPHAHBOT", "pa": "1", "ep": "10", "cr": "200", "up": "1", "mt": "cross",
+                       "iw": "0.00000000", "ps": "BOTH"}],
+            },
+        }
+
+        record = decode_user_stream_event(event_message)
+
+        self.assertEqual(
+            AccountUpdateRecord(
+                timestamp=1564745798.938,
+                balances=[BalanceUpdateRecord("USDT", "122624.12345678", "100.12345678")],
+                positions=[PositionUpdateRecord("COINALPHAHBOT", "BOTH", "1", "10", "1")]),
+            record)
+
+    def test_other_events_are_not_decoded(self):
+        self.assertIsNone(decode_user_stream_event({"e": "MARGIN_CALL", "p": []}))
+        self.assertIsNone(decode_user_stream_event({"e": "listenKeyExpired"}))
@@ -1,9 +1,17 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.mock.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -21,3 +29,90 @@ class PaperTradeExchangeTests(TestCase):
 
         paper_exchange = create_paper_trade_market(exchange_name="kucoin", trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+    def test_queue_position_modelling_disabled_by_default(self):
+        paper_exchange = create_paper_trade_market(exchange_name="binance", trading_pairs=["COINALPHA-HBOT"])
+        self.assertFalse(paper_exchange.queue_position_modelling)
+
+        paper_exchange = create_paper_trade_market(exchange_name="binance",
+                                                   trading_pairs=["COINALPHA-HBOT"],
+                                                   queue_position_modelling=True)
+        self.assertTrue(paper_exchange.queue_position_modelling)
+
+
+class PaperTradeLimitOrderFillTests(TestCase):
+    start_timestamp: float = 1640000000
+    trading_pair: str = "COINALPHA-HBOT"
+
+    def create_exchange(self, queue_position_modelling: bool = False) -> MockPaperExchange:
+        exchange = MockPaperExchange(queue_position_modelling=queue_position_modelling)
+        # Bids at 99.5 (10), 98.5 (20)... and asks at 100.5 (10), 101.5 (20)...
+        exchange.set_balanced_order_book(self.trading_pair,
+                                         mid_price=100,
+                                         min_price=90,
+                                         max_price=110,
+                                         price_step_size=1,
+                                         volume_step_size=10)
+        exchange.set_balance("COINALPHA", 100)
+        exchange.set_balance("HBOT", 10000)
+        exchange.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock = Clock(ClockMode.BACKTEST, 1, self.start_timestamp, self.start_timestamp + 100)
+        self.clock.add_iterator(exchange)
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.buy_completed_logger = EventLogger()
+        exchange.add_listener(MarketEvent.BuyOrderCompleted, self.buy_completed_logger)
+        return exchange
+
+    def simulate_taker_sell(self, exchange: MockPaperExchange, price: Decimal, amount: Decimal):
+        exchange.get_order_book(self.trading_pair).apply_trade(
+            OrderBookTradeEvent(self.trading_pair, self.clock.current_timestamp, TradeType.SELL, price, amount))
+
+    def test_resting_order_filled_once_queued_ahead_volume_traded(self):
+        exchange = self.create_exchange(queue_position_modelling=True)
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+
+        # 10 are queued ahead of the order at 99.5
+        self.simulate_taker_sell(exchange, Decimal("99.5"), Decimal("6"))
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+        self.assertEqual([order_id], [order.client_order_id for order in exchange.limit_orders])
+
+        self.simulate_taker_sell(exchange, Decimal("99.5"), Decimal("5"))
+        self.assertEqual(1, len(self.buy_completed_logger.event_log))
+        self.assertEqual(order_id, self.buy_completed_logger.event_log[0].order_id)
+        self.assertEqual(0, len(exchange.limit_orders))
+
+    def test_resting_order_not_filled_at_its_price_without_queue_position_modelling(self):
+        exchange = self.create_exchange()
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+
+        self.simulate_taker_sell(exchange, Decimal("99.5"), Decimal("100"))
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+
+        # Trades through the order price fill it
+        self.simulate_taker_sell(exchange, Decimal("99"), Decimal("1"))
+        self.assertEqual(1, len(self.buy_completed_logger.event_log))
+
+    def test_new_order_crossing_unchanged_top_of_book_is_filled(self):
+        exchange = self.create_exchange()
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+
+        # The best ask did not move since the last check, the new order still has to be evaluated
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("101"))
+        self.clock.backtest_til(self.start_timestamp + 3)
+
+        self.assertEqual([order_id], [event.order_id for event in self.buy_completed_logger.event_log])
+        self.assertEqual(1, len(exchange.limit_orders))
+
+    def test_resting_order_filled_when_top_of_book_moves_across_it(self):
+        exchange = self.create_exchange()
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.5"))
+        self.clock.backtest_til(self.start_timestamp + 2)
+        self.clock.backtest_til(self.start_timestamp + 3)
+        self.assertEqual(0, len(self.buy_completed_logger.event_log))
+
+        exchange.get_order_book(self.trading_pair).apply_diffs([], [OrderBookRow(99, 5, 2)], 2)
+        self.clock.backtest_til(self.start_timestamp + 4)
+
+        self.assertEqual([order_id], [event.order_id for event in self.buy_completed_logger.event_log])
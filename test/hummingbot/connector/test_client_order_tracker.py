@@ -886,3 +886,46 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         complete_event: BuyOrderCompletedEvent = self.buy_order_completed_logger.event_log[0]
         self.assertGreaterEqual(complete_event.timestamp, 1640001120)
+
+    def test_process_order_update_nowait_applies_updates_not_waiting_for_fills(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_creation_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+
+        self.assertTrue(self.tracker.process_order_update_nowait(order_creation_update))
+
+        # The update is applied without running the event loop
+        self.assertEqual(OrderState.OPEN, order.current_state)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+
+        order_completion_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.FILLED,
+        )
+
+        # The order fills have not been received yet
+        self.assertFalse(self.tracker.process_order_update_nowait(order_completion_update))
+        self.assertEqual(OrderState.OPEN, order.current_state)
+
+        order.completely_filled_event.set()
+        self.assertTrue(self.tracker.process_order_update_nowait(order_completion_update))
+        self.assertTrue(order.is_filled)
+        self.assertIsNone(self.tracker.fetch_tracked_order(order.client_order_id))
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Awaitable, Dict, Mapping
+from unittest import TestCase
+
+from bidict import bidict
+
+from hummingbot.connector.symbol_map_cache import SymbolMapCacheMixin
+
+
+class SymbolMapCacheTests(TestCase):
+
+    class DataSource(SymbolMapCacheMixin):
+        _trading_pair_symbol_map: Dict[str, Mapping[str, str]] = {}
+        _mapping_initialization_lock = asyncio.Lock()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.domain = "test_domain"
+        self.init_calls = 0
+        self.next_mapping = bidict({"COINALPHAHBOT": "COINALPHA-HBOT"})
+        self.DataSource._trading_pair_symbol_map = {}
+
+    def tearDown(self) -> None:
+        self.DataSource.stop_symbol_map_refresh(self.domain)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def init_symbol_map(self):
+        self.init_calls += 1
+        self.DataSource._trading_pair_symbol_map[self.domain] = self.next_mapping
+
+    def test_ensure_symbol_map_loads_the_map_once(self):
+        self.assertFalse(self.DataSource.symbol_map_ready(self.domain))
+
+        self.async_run_with_timeout(self.DataSource.ensure_symbol_map(self.domain, self.init_symbol_map))
+        mapping = self.async_run_with_timeout(self.DataSource.ensure_symbol_map(self.domain, self.init_symbol_map))
+
+        self.assertEqual(1, self.init_calls)
+        self.assertEqual({"COINALPHAHBOT": "COINALPHA-HBOT"}, dict(mapping))
+        self.assertTrue(self.DataSource.symbol_map_ready(self.domain))
+
+    def test_synchronous_lookups(self):
+        self.DataSource._trading_pair_symbol_map = {self.domain: bidict({"COINALPHAHBOT": "COINALPHA-HBOT"})}
+
+        self.assertEqual("COINALPHA-HBOT", self.DataSource.trading_pair_for_symbol("COINALPHAHBOT", self.domain))
+        self.assertEqual("COINALPHAHBOT", self.DataSource.symbol_for_trading_pair("COINALPHA-HBOT", self.domain))
+        with self.assertRaisesRegex(ValueError, "There is no symbol mapping for exchange trading pair UNKNOWN"):
+            self.DataSource.trading_pair_for_symbol("UNKNOWN", self.domain)
+        with self.assertRaisesRegex(ValueError, "There is no symbol mapping for trading pair COINALPHA-HBOT"):
+            self.DataSource.symbol_for_trading_pair("COINALPHA-HBOT", "other_domain")
+
+    def test_refresh_replaces_the_map(self):
+        self.DataSource._trading_pair_symbol_map = {self.domain: bidict({"COINALPHAHBOT": "COINALPHA-HBOT"})}
+        self.next_mapping = bidict({"COINALPHAHBOT": "COINALPHA-HBOT", "WETHHBOT": "WETH-HBOT"})
+
+        self.async_run_with_timeout(self.DataSource.refresh_symbol_map(self.domain, self.init_symbol_map))
+
+        self.assertEqual("WETH-HBOT", self.DataSource.trading_pair_for_symbol("WETHHBOT", self.domain))
+
+    def test_failed_refresh_keeps_the_previous_map(self):
+        self.DataSource._trading_pair_symbol_map = {self.domain: bidict({"COINALPHAHBOT": "COINALPHA-HBOT"})}
+        self.next_mapping = bidict()
+
+        self.async_run_with_timeout(self.DataSource.refresh_symbol_map(self.domain, self.init_symbol_map))
+
+        self.assertEqual("COINALPHA-HBOT", self.DataSource.trading_pair_for_symbol("COINALPHAHBOT", self.domain))
+
+    def test_background_refresh(self):
+        self.DataSource.start_symbol_map_refresh(self.domain, self.init_symbol_map, interval=0.05)
+        # Starting it again does not create a second refresh loop
+        self.DataSource.start_symbol_map_refresh(self.domain, self.init_symbol_map, interval=0.05)
+
+        self.async_run_with_timeout(asyncio.sleep(0.075))
+
+        self.assertEqual(1, self.init_calls)
+        self.assertTrue(self.DataSource.symbol_map_ready(self.domain))
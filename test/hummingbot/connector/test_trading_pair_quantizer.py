@@ -0,0 +1,52 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.trading_pair_quantizer import TradingPairQuantizer
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingPairQuantizerTests(unittest.TestCase):
+
+    def test_power_of_ten_quanta(self):
+        quantizer = TradingPairQuantizer("COINALPHA-HBOT", Decimal("0.01"), Decimal("0.001"))
+
+        self.assertEqual(Decimal("1.23"), quantizer.quantize_price(Decimal("1.2399")))
+        self.assertEqual(Decimal("-1.23"), quantizer.quantize_price(Decimal("-1.2399")))
+        self.assertEqual(Decimal("0.123"), quantizer.quantize_amount(Decimal("0.12345")))
+        self.assertTrue(quantizer.quantize_price(Decimal("NaN")).is_nan())
+
+    def test_non_power_of_ten_quanta(self):
+        quantizer = TradingPairQuantizer("COINALPHA-HBOT", Decimal("0.25"), Decimal("5"))
+
+        self.assertEqual(Decimal("1.75"), quantizer.quantize_price(Decimal("1.8")))
+        self.assertEqual(Decimal("10"), quantizer.quantize_amount(Decimal("14.9")))
+
+    def test_quanta_with_trailing_zeros(self):
+        quantizer = TradingPairQuantizer("COINALPHA-HBOT", Decimal("0.010"), Decimal("10"))
+
+        self.assertEqual(Decimal("1.23"), quantizer.quantize_price(Decimal("1.2399")))
+        self.assertEqual(Decimal("120"), quantizer.quantize_amount(Decimal("123")))
+
+    def test_quanta_of_ten_and_above_are_not_in_scientific_notation(self):
+        quantizer = TradingPairQuantizer("COINALPHA-HBOT", Decimal("10"), Decimal("100"))
+
+        price = quantizer.quantize_price(Decimal("123.45"))
+        amount = quantizer.quantize_amount(Decimal("1234.5"))
+
+        self.assertEqual(Decimal("120"), price)
+        self.assertEqual("120", f"{price}")
+        self.assertEqual(Decimal("1200"), amount)
+        self.assertEqual("1200", f"{amount}")
+
+    def test_quantize_amount_with_limits(self):
+        trading_rule = TradingRule("COINALPHA-HBOT",
+                                   min_order_size=Decimal("1"),
+                                   min_price_increment=Decimal("0.01"),
+                                   min_base_amount_increment=Decimal("0.1"),
+                                   min_notional_size=Decimal("10"))
+        quantizer = TradingPairQuantizer.from_trading_rule(trading_rule)
+
+        self.assertEqual(Decimal("0"), quantizer.quantize_amount_with_limits(Decimal("0.99"), Decimal("100")))
+        # 1.0 * 10 is below the min notional size plus the 1% safety factor
+        self.assertEqual(Decimal("0"), quantizer.quantize_amount_with_limits(Decimal("1.05"), Decimal("10")))
+        self.assertEqual(Decimal("1.1"), quantizer.quantize_amount_with_limits(Decimal("1.15"), Decimal("10")))
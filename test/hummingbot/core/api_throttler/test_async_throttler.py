@@ -224,3 +224,17 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
+
+    def test_available_capacity(self):
+        self.assertEqual(10, self.throttler.get_limit(TEST_WEIGHTED_POOL_ID))
+        self.assertEqual(10, self.throttler.available_capacity(TEST_WEIGHTED_POOL_ID))
+
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time(),
+                                                 rate_limit=self.rate_limits[2],
+                                                 weight=5))
+        self.throttler._task_logs.append(TaskLog(timestamp=time.time() - 10,
+                                                 rate_limit=self.rate_limits[2],
+                                                 weight=5))
+
+        # The second task is out of the time window
+        self.assertEqual(5, self.throttler.available_capacity(TEST_WEIGHTED_POOL_ID))
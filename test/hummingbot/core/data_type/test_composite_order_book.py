@@ -0,0 +1,80 @@
+import unittest
+from collections import namedtuple
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+FillEvent = namedtuple("FillEvent", "trade_type price amount timestamp")
+
+
+class CompositeOrderBookTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot(
+            [OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97, 3, 1)],
+            [OrderBookRow(101, 1, 1), OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)],
+            1)
+
+    def test_entries_without_fills_match_live_book(self):
+        self.assertEqual(list(self.order_book.original_bid_entries()), list(self.order_book.bid_entries()))
+        self.assertEqual(list(self.order_book.original_ask_entries()), list(self.order_book.ask_entries()))
+        self.assertEqual(99, self.order_book.get_price(False))
+        self.assertEqual(101, self.order_book.get_price(True))
+
+    def test_partial_fill_reduces_composite_amount(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.BUY, 102, 0.5, 2))
+
+        asks = {row.price: row.amount for row in self.order_book.ask_entries()}
+        self.assertEqual({101: 1, 102: 1.5, 103: 3}, asks)
+        self.assertEqual([OrderBookRow(102, 0.5, 2)], list(self.order_book.traded_order_book.ask_entries()))
+
+    def test_full_fill_removes_level_and_caps_traded_amount(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.SELL, 99, 0.6, 2))
+        self.order_book.record_filled_order(FillEvent(TradeType.SELL, 99, 0.6, 3))
+
+        self.assertEqual([98, 97], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual(98, self.order_book.get_price(False))
+        self.assertEqual([OrderBookRow(99, 1, 3)], list(self.order_book.traded_order_book.bid_entries()))
+
+    def test_top_levels_return_composite_entries(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.BUY, 101, 1, 2))
+        self.order_book.record_filled_order(FillEvent(TradeType.SELL, 99, 0.5, 2))
+
+        bids, asks = self.order_book.top_levels(2)
+
+        self.assertEqual([OrderBookRow(99, 0.5, 1), OrderBookRow(98, 2, 1)], bids)
+        self.assertEqual([OrderBookRow(102, 2, 1), OrderBookRow(103, 3, 1)], asks)
+        self.assertEqual(list(self.order_book.bid_entries())[:2], bids)
+        self.assertEqual(list(self.order_book.ask_entries())[:2], asks)
+
+    def test_diff_updates_composite_incrementally(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.BUY, 101, 1, 2))
+        self.assertEqual(102, self.order_book.get_price(True))
+
+        # More liquidity arrives at the consumed level
+        self.order_book.apply_diffs([], [OrderBookRow(101, 3, 3)], 3)
+        self.assertEqual(101, self.order_book.get_price(True))
+        self.assertEqual(OrderBookRow(101, 2, 3), next(self.order_book.ask_entries()))
+
+        # The level is removed from the live book, the recorded fill is cleaned up
+        self.order_book.apply_diffs([], [OrderBookRow(101, 0, 4)], 4)
+        self.assertEqual(102, self.order_book.get_price(True))
+        self.assertEqual([], list(self.order_book.traded_order_book.ask_entries()))
+
+    def test_snapshot_rebuilds_composite_books(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.SELL, 98, 1, 2))
+        self.order_book.record_filled_order(FillEvent(TradeType.SELL, 97, 1, 2))
+
+        self.order_book.apply_snapshot([OrderBookRow(98, 4, 5), OrderBookRow(96, 1, 5)], [OrderBookRow(101, 1, 5)], 5)
+
+        bids = {row.price: row.amount for row in self.order_book.bid_entries()}
+        self.assertEqual({98: 3, 96: 1}, bids)
+        self.assertEqual([98], [row.price for row in self.order_book.traded_order_book.bid_entries()])
+
+    def test_clear_traded_order_book_restores_live_entries(self):
+        self.order_book.record_filled_order(FillEvent(TradeType.BUY, 101, 1, 2))
+        self.order_book.clear_traded_order_book()
+
+        self.assertEqual(list(self.order_book.original_ask_entries()), list(self.order_book.ask_entries()))
@@ -2,7 +2,13 @@
 
 import logging
 import unittest
+from array import array
+
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import LazyOrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
 import numpy as np
 
 
@@ -50,6 +56,78 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_lazy_messages(self):
+        order_book = OrderBook()
+        snapshot = LazyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "3"]],
+        }, timestamp=1640000000)
+        diff = LazyOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["10", "0"]],
+            "asks": [["10.5", "4"]],
+        }, timestamp=1640000001)
+
+        order_book.apply_snapshot_message(snapshot)
+        order_book.apply_diff_message(diff)
+
+        self.assertEqual([(9, 2, 1)], [(row.price, row.amount, row.update_id) for row in order_book.bid_entries()])
+        self.assertEqual([(10.5, 4, 2), (11, 3, 1)],
+                         [(row.price, row.amount, row.update_id) for row in order_book.ask_entries()])
+        self.assertEqual(2, order_book.last_diff_uid)
+
+        order_book.apply_diff_levels(array("d", [9.5, 1]), array("d"), 3)
+        self.assertEqual(9.5, order_book.get_price(False))
+
+    def test_top_levels(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(10, 2, 1), OrderBookRow(8, 3, 1)],
+                                  [OrderBookRow(11, 4, 1)],
+                                  1)
+
+        bids, asks = order_book.top_levels(2)
+
+        self.assertEqual([OrderBookRow(10, 2, 1), OrderBookRow(9, 1, 1)], bids)
+        self.assertEqual([OrderBookRow(11, 4, 1)], asks)
+        self.assertEqual(([], []), order_book.top_levels(0))
+
+    def test_top_of_book_change_events(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TopOfBookChangeEvent, event_logger)
+
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1), OrderBookRow(10, 2, 1)], [OrderBookRow(11, 3, 1)], 1)
+        self.assertEqual(1, len(event_logger.event_log))
+        event = event_logger.event_log[0]
+        self.assertEqual((10, 2, 11, 3), (event.best_bid, event.best_bid_size, event.best_ask, event.best_ask_size))
+
+        # Changes below the top of the book, and size changes without threshold, are not reported
+        order_book.apply_diffs([OrderBookRow(9, 5, 2)], [OrderBookRow(11, 1, 2)], 2)
+        self.assertEqual(1, len(event_logger.event_log))
+
+        # The sizes are compared with the sizes of the last event: the unreported ask size change (3 -> 1) is
+        # reported with the next check once a threshold is set
+        order_book.top_of_book_size_change_threshold = 0.5
+        order_book.apply_diffs([OrderBookRow(10, 1.5, 3)], [], 3)
+        self.assertEqual(2, len(event_logger.event_log))
+        event = event_logger.event_log[-1]
+        self.assertEqual((10, 1.5, 11, 1), (event.best_bid, event.best_bid_size, event.best_ask, event.best_ask_size))
+
+        order_book.apply_diffs([OrderBookRow(10, 1, 4)], [], 4)
+        self.assertEqual(2, len(event_logger.event_log))
+        # 1.5 -> 0.5 since the last event, even though the last step (1 -> 0.5) is below the threshold
+        order_book.apply_diffs([OrderBookRow(10, 0.5, 5)], [], 5)
+        self.assertEqual(3, len(event_logger.event_log))
+        self.assertEqual(0.5, event_logger.event_log[-1].best_bid_size)
+
+        # The best bid level is removed
+        order_book.apply_diffs([OrderBookRow(10, 0, 6)], [], 6)
+        self.assertEqual(4, len(event_logger.event_log))
+        self.assertEqual(9, event_logger.event_log[-1].best_bid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,7 +1,7 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+from hummingbot.core.data_type.order_book_message import LazyOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +248,48 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_lazy_message_parses_levels_once(self):
+        msg = LazyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "trading_pair": "COINALPHA-HBOT",
+                "first_update_id": 2,
+                "update_id": 3,
+                "bids": [["10.5", "1.5"], ["10.0", "0"]],
+                "asks": [["11.0", "2", "extra"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertEqual("COINALPHA-HBOT", msg.trading_pair)
+        self.assertEqual(2, msg.first_update_id)
+        self.assertEqual(3, msg.update_id)
+        self.assertEqual([10.5, 1.5, 10.0, 0.0], list(msg.bid_levels))
+        self.assertEqual([11.0, 2.0], list(msg.ask_levels))
+        self.assertEqual([OrderBookRow(10.5, 1.5, 3), OrderBookRow(10.0, 0, 3)], msg.bids)
+        self.assertEqual([OrderBookRow(11.0, 2, 3)], msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+        self.assertIs(msg.bid_levels, msg.bid_levels)
+
+    def test_lazy_message_compares_with_order_book_messages(self):
+        diff = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 2},
+            timestamp=time.time(),
+        )
+        lazy_diff = LazyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"update_id": 2},
+            timestamp=time.time(),
+        )
+        lazy_snapshot = LazyOrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"update_id": 1},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual(diff, lazy_diff)
+        self.assertTrue(lazy_snapshot < diff)
+        self.assertFalse(lazy_diff.has_trade_id)
+        self.assertEqual(-1, lazy_diff.trade_id)
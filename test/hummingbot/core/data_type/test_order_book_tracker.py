@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshot_update_id = 10
+        self.snapshot_requests = 0
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests += 1
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, self.snapshot_update_id)],
+                                  [OrderBookRow(11, 1, self.snapshot_update_id)],
+                                  self.snapshot_update_id)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.trading_pair = "COINALPHA-HBOT"
+        self.data_source = MockOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        self.tracker.RESYNC_MIN_INTERVAL = 0
+        self.tracker._order_books[self.trading_pair] = self.async_run_with_timeout(
+            self.data_source.get_new_order_book(self.trading_pair))
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _diff(self, first_update_id: int, update_id: int, bid_price: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "first_update_id": first_update_id,
+            "update_id": update_id,
+            "bids": [[str(bid_price), "1"]],
+            "asks": [],
+        }, timestamp=1640000000)
+
+    def test_continuous_diffs_are_applied(self):
+        self.assertTrue(self.tracker._apply_diff_message(self.trading_pair, self._diff(9, 12, 9.5)))
+        self.assertTrue(self.tracker._apply_diff_message(self.trading_pair, self._diff(13, 13, 9.6)))
+        # Diffs already included in the order book are ignored
+        self.assertFalse(self.tracker._apply_diff_message(self.trading_pair, self._diff(12, 13, 9.7)))
+
+        bids = [row.price for row in self.tracker.order_books[self.trading_pair].bid_entries()]
+        self.assertEqual([9.5, 9.6, 10], sorted(bids))
+        self.assertEqual({}, self.tracker.sequence_gaps_count)
+        self.assertEqual(1, self.data_source.snapshot_requests)
+
+    def test_sequence_gap_restores_the_order_book_from_a_new_snapshot(self):
+        self.data_source.snapshot_update_id = 20
+
+        # Updates 11 to 14 are missing
+        self.assertFalse(self.tracker._apply_diff_message(self.trading_pair, self._diff(15, 16, 9.5)))
+        # Diffs received while the snapshot is requested are buffered
+        self.assertFalse(self.tracker._apply_diff_message(self.trading_pair, self._diff(17, 21, 9.6)))
+        self.assertFalse(self.tracker._apply_diff_message(self.trading_pair, self._diff(22, 22, 9.7)))
+
+        self.async_run_with_timeout(self.tracker._resync_tasks[self.trading_pair])
+
+        bids = [row.price for row in self.tracker.order_books[self.trading_pair].bid_entries()]
+        # The diff older than the new snapshot is discarded
+        self.assertEqual([9.6, 9.7, 10], sorted(bids))
+        self.assertEqual(22, self.tracker._last_update_id(self.trading_pair))
+        self.assertEqual({self.trading_pair: 1}, self.tracker.sequence_gaps_count)
+        self.assertEqual({self.trading_pair: 1}, self.tracker.resyncs_count)
+        self.assertEqual(2, self.data_source.snapshot_requests)
+
+    def test_diffs_without_first_update_id_are_not_checked(self):
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair,
+            "update_id": 100,
+            "bids": [["9.5", "1"]],
+            "asks": [],
+        }, timestamp=1640000000)
+
+        self.assertTrue(self.tracker._apply_diff_message(self.trading_pair, diff))
+        self.assertEqual({}, self.tracker.sequence_gaps_count)
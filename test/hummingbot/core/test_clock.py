@@ -2,12 +2,38 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from typing import List
 
 from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.clock_mode import MissedTickPolicy
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class TickRecordingIterator(StrategyPyBase):
+    def __init__(self, name: str, ticks: List, tick_duration: float = 0):
+        super().__init__()
+        self.name = name
+        self.ticks = ticks
+        self.tick_duration = tick_duration
+
+    def tick(self, timestamp: float):
+        self.ticks.append((self.name, timestamp))
+        time.sleep(self.tick_duration)
+
+
+class ClockTimestampRecordingIterator(StrategyPyBase):
+    def __init__(self, clock_timestamps: List):
+        super().__init__()
+        self.clock_timestamps = clock_timestamps
+
+    def tick(self, timestamp: float):
+        self.clock_timestamps.append(self.clock.current_timestamp)
 
 
 class ClockUnitTest(unittest.TestCase):
@@ -112,6 +138,113 @@ class ClockUnitTest(unittest.TestCase):
 
         self.assertGreaterEqual(self.clock_realtime.current_timestamp, self.realtime_end_timestamp)
 
+    def test_add_iterator_with_priority(self):
+        first_iterator = TimeIterator()
+        second_iterator = TimeIterator()
+        high_priority_iterator = TimeIterator()
+
+        self.clock_backtest.add_iterator(first_iterator)
+        self.clock_backtest.add_iterator(second_iterator)
+        self.clock_backtest.add_iterator(high_priority_iterator, priority=1)
+
+        self.assertEqual([high_priority_iterator, first_iterator, second_iterator], self.clock_backtest.child_iterators)
+
+    def test_add_iterator_with_invalid_tick_interval(self):
+        with self.assertRaises(ValueError):
+            self.clock_backtest.add_iterator(TimeIterator(), tick_interval=0)
+
+    def test_backtest_with_tick_intervals(self):
+        ticks = []
+        slow_iterator = TickRecordingIterator("slow", ticks)
+        fast_iterator = TickRecordingIterator("fast", ticks)
+        self.clock_backtest.add_iterator(slow_iterator, tick_interval=self.tick_size * 3)
+        self.clock_backtest.add_iterator(fast_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size * 6)
+
+        self.assertEqual(6, len([tick for tick in ticks if tick[0] == "fast"]))
+        slow_ticks = [timestamp for name, timestamp in ticks if name == "slow"]
+        self.assertEqual([self.backtest_start_timestamp + self.tick_size,
+                          self.backtest_start_timestamp + self.tick_size * 4],
+                         slow_ticks)
+        self.assertEqual(self.tick_size * 3, self.clock_backtest.tick_schedule(slow_iterator).tick_interval)
+        self.assertEqual(self.tick_size, self.clock_backtest.tick_schedule(fast_iterator).tick_interval)
+
+    def test_realtime_tick_overrun_detection(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        ticks = []
+        skipping_iterator = TickRecordingIterator("skip", ticks, tick_duration=0.12)
+        coalescing_iterator = TickRecordingIterator("coalesce", [], tick_duration=0.12)
+        clock.add_iterator(skipping_iterator)
+        clock.add_iterator(coalescing_iterator, missed_tick_policy=MissedTickPolicy.COALESCE)
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.5))
+
+        skip_schedule = clock.tick_schedule(skipping_iterator)
+        coalesce_schedule = clock.tick_schedule(coalescing_iterator)
+        self.assertGreater(skip_schedule.overrun_count, 0)
+        self.assertGreaterEqual(skip_schedule.max_tick_duration, 0.12)
+        self.assertGreater(skip_schedule.missed_tick_count, 0)
+        self.assertGreater(coalesce_schedule.overrun_count, 0)
+        # Each tick lasts several tick intervals, every tick time is either ticked, skipped or coalesced
+        tick_times = [timestamp for _, timestamp in ticks]
+        self.assertEqual(sorted(tick_times), tick_times)
+        self.assertEqual(len(set(tick_times)), len(tick_times))
+
+    def test_realtime_current_timestamp_is_monotonic(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        clock_timestamps = []
+        slow_iterator = ClockTimestampRecordingIterator(clock_timestamps)
+        fast_iterator = ClockTimestampRecordingIterator(clock_timestamps)
+        clock.add_iterator(slow_iterator, tick_interval=0.2)
+        clock.add_iterator(fast_iterator)
+        end_timestamp = time.time() + 0.5
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(end_timestamp))
+
+        self.assertGreater(len(clock_timestamps), 0)
+        self.assertEqual(sorted(clock_timestamps), clock_timestamps)
+        self.assertGreaterEqual(clock.current_timestamp, end_timestamp - clock.tick_size)
+
+    def test_event_driven_iterator_requires_event_driven_mode(self):
+        with self.assertRaises(ValueError):
+            self.clock_realtime.add_event_driven_iterator(TimeIterator(), [OrderBook()])
+
+    def test_event_driven_ticks(self):
+        clock = Clock(ClockMode.EVENT_DRIVEN, tick_size=1000, event_debounce=0.01, event_min_interval=0.1)
+        order_book = OrderBook()
+        iterator = TimeIterator()
+        clock.add_iterator(iterator)
+        clock.add_event_driven_iterator(iterator, [order_book])
+        event_ticks = []
+
+        async def change_top_of_book():
+            await asyncio.sleep(0.05)
+            # The iterator is started with the clock timestamp once the clock runs
+            event_ticks.append(iterator.current_timestamp)
+            order_book.apply_snapshot([OrderBookRow(10, 1, 1)], [OrderBookRow(11, 1, 1)], 1)
+            # Debounced with the previous change
+            order_book.apply_diffs([OrderBookRow(10.5, 1, 2)], [], 2)
+            await asyncio.sleep(0.05)
+            event_ticks.append(iterator.current_timestamp)
+            # Rate limited until 0.1s after the first event tick
+            order_book.apply_diffs([OrderBookRow(10.6, 1, 3)], [], 3)
+            await asyncio.sleep(0.02)
+            event_ticks.append(iterator.current_timestamp)
+            await asyncio.sleep(0.2)
+            event_ticks.append(iterator.current_timestamp)
+
+        with clock:
+            run_task = self.ev_loop.create_task(clock.run())
+            self.ev_loop.run_until_complete(change_top_of_book())
+            run_task.cancel()
+
+        start_timestamp = event_ticks.pop(0)
+        self.assertGreater(event_ticks[0], start_timestamp)
+        self.assertEqual(event_ticks[0], event_ticks[1])
+        self.assertGreaterEqual(event_ticks[2] - event_ticks[0], 0.1)
+
     def test_backtest(self):
         # Note: Technically you do not execute `backtest()` when in REALTIME mode
 
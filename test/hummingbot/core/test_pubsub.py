@@ -3,11 +3,23 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
 
 
+class CallbackListener(EventListener):
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.calls = 0
+
+    def __call__(self, arg):
+        self.calls += 1
+        self.callback(arg)
+
+
 class PubSubTest(unittest.TestCase):
     def setUp(self) -> None:
         self.pubsub = PubSub()
@@ -89,6 +101,91 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_skipped_and_removed_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        listener_zero_weakref = weakref.ref(self.listener_zero)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+        self.assertIsNone(listener_zero_weakref())
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([self.event], self.listener_one.event_log)
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_listeners_changed_during_dispatch_are_changed_after_it(self):
+        def remove_self_and_add_listener_one(_):
+            self.pubsub.remove_listener(self.event_tag_zero, remover)
+            self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+            # The listeners are only changed once the dispatch is over
+            self.assertEqual(2, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+        remover = CallbackListener(remove_self_and_add_listener_one)
+        self.pubsub.add_listener(self.event_tag_zero, remover)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, remover.calls)
+        self.assertEqual(1, len(self.listener_zero.event_log))
+        self.assertEqual(0, len(self.listener_one.event_log))
+        listeners = self.pubsub.get_listeners(self.event_tag_zero)
+        self.assertEqual(2, len(listeners))
+        self.assertNotIn(remover, listeners)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, remover.calls)
+        self.assertEqual(2, len(self.listener_zero.event_log))
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_nested_trigger_event(self):
+        nested_trigger = CallbackListener(lambda _: self.pubsub.trigger_event(self.event_tag_one, self.event))
+        self.pubsub.add_listener(self.event_tag_zero, nested_trigger)
+        self.pubsub.add_listener(self.event_tag_one, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, nested_trigger.calls)
+        self.assertEqual([self.event], self.listener_one.event_log)
+
+    def test_failing_listener_does_not_stop_dispatch(self):
+        def fail(_):
+            raise ValueError("Test error")
+
+        failing_listener = CallbackListener(fail)
+        self.pubsub.add_listener(self.event_tag_zero, failing_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        with self.assertLogs(logger="hummingbot.core.pubsub", level="ERROR"):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(1, failing_listener.calls)
+        self.assertEqual([self.event], self.listener_zero.event_log)
+
+    def test_trigger_events(self):
+        events = [MockEvent(payload=i) for i in range(3)]
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_events(self.event_tag_zero, events)
+        self.pubsub.trigger_events(self.event_tag_one, events)
+        self.pubsub.trigger_events(self.event_tag_zero, [])
+
+        self.assertEqual(events, self.listener_zero.event_log)
+        self.assertEqual(events, self.listener_one.event_log)
+
+    def test_trigger_events_listener_removed_during_burst_receives_all_events(self):
+        events = [MockEvent(payload=i) for i in range(3)]
+        remover = CallbackListener(lambda _: self.pubsub.remove_listener(self.event_tag_zero, remover))
+        self.pubsub.add_listener(self.event_tag_zero, remover)
+
+        self.pubsub.trigger_events(self.event_tag_zero, events)
+
+        self.assertEqual(3, remover.calls)
+        self.assertEqual(0, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import unittest
+
+from hummingbot.core.utils.metrics import LatencyHistogram, MetricsRegistry
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram("test")
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.min)
+        self.assertEqual(0, histogram.percentile(99))
+        self.assertEqual(0.0, histogram.snapshot()["mean_us"])
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram("test")
+        for value in range(1, 101):
+            histogram.record(value)
+
+        self.assertEqual(100, histogram.count)
+        self.assertEqual(1, histogram.min)
+        self.assertEqual(100, histogram.max)
+        self.assertEqual(50.5, histogram.mean)
+        self.assertEqual(50, histogram.percentile(50))
+        self.assertEqual(99, histogram.percentile(99))
+        self.assertEqual(100, histogram.percentile(100))
+
+    def test_large_values_percentiles_relative_precision(self):
+        histogram = LatencyHistogram("test")
+        values = [1000 + 7919 * i for i in range(10000)]
+        for value in values:
+            histogram.record(value)
+
+        for pct in (50, 90, 99, 99.9):
+            expected = values[int(pct / 100 * len(values) + 0.5) - 1]
+            self.assertGreaterEqual(histogram.percentile(pct), expected)
+            self.assertLess(histogram.percentile(pct), expected * 1.01)
+        self.assertEqual(values[-1], histogram.percentile(100))
+
+    def test_record_seconds_and_negative_values(self):
+        histogram = LatencyHistogram("test")
+        histogram.record_seconds(0.002)
+        histogram.record(-5)
+
+        self.assertEqual(2, histogram.count)
+        self.assertEqual(0, histogram.min)
+        self.assertEqual(2_000_000, histogram.max)
+
+    def test_reset(self):
+        histogram = LatencyHistogram("test")
+        histogram.record(10)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.max)
+
+
+class MetricsRegistryTest(unittest.TestCase):
+
+    def test_metrics_are_created_once(self):
+        registry = MetricsRegistry()
+
+        self.assertIs(registry.counter("counter"), registry.counter("counter"))
+        self.assertIs(registry.gauge("gauge"), registry.gauge("gauge"))
+        self.assertIs(registry.histogram("histogram"), registry.histogram("histogram"))
+        self.assertIs(MetricsRegistry.get_instance(), MetricsRegistry.get_instance())
+
+    def test_disabled_by_default(self):
+        self.assertFalse(MetricsRegistry().enabled)
+
+    def test_snapshot_and_reset(self):
+        registry = MetricsRegistry(enabled=True)
+        counter = registry.counter("orders")
+        counter.increment()
+        counter.increment(2)
+        registry.gauge("queue_size").set(5)
+        registry.histogram("latency").record(1500)
+
+        snapshot = registry.snapshot()
+
+        self.assertTrue(snapshot["enabled"])
+        self.assertEqual({"orders": 3}, snapshot["counters"])
+        self.assertEqual({"queue_size": 5}, snapshot["gauges"])
+        self.assertEqual(1, snapshot["histograms"]["latency"]["count"])
+        self.assertEqual(1.5, snapshot["histograms"]["latency"]["max_us"])
+
+        registry.reset()
+
+        self.assertIs(counter, registry.counter("orders"))
+        self.assertEqual(0, counter.value)
+        self.assertEqual(0, registry.snapshot()["histograms"]["latency"]["count"])
+
+    def test_export_json(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.counter("orders").increment()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "metrics.json")
+            registry.export_json(file_path)
+            with open(file_path) as metrics_file:
+                exported = json.load(metrics_file)
+
+        self.assertEqual({"orders": 1}, exported["counters"])
@@ -7,6 +7,7 @@ from unittest.mock import patch
 import aiohttp
 from aioresponses import aioresponses
 
+from hummingbot.core.utils.metrics import MetricsRegistry
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.rest_connection import (
     RESTConnection
@@ -103,3 +104,23 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_rest_assistant_call_records_metrics_when_enabled(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        mocked_api.get(url, exception=aiohttp.ClientConnectionError())
+        metrics = MetricsRegistry.get_instance()
+        metrics.reset()
+        metrics.enabled = True
+        self.addCleanup(setattr, metrics, "enabled", False)
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection)
+        req = RESTRequest(method=RESTMethod.GET, url=url)
+
+        self.async_run_with_timeout(assistant.call(req))
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual(1, metrics.histogram("rest_assistant.call_duration").count)
+        self.assertEqual(1, metrics.counter("rest_assistant.call_errors").value)
@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+import unittest
+from typing import List
+
+from hummingbot.logger.queue_log_handler import QueueLogHandler, QueueLogListener
+
+
+class _RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+class _BlockingHandler(_RecordingHandler):
+    def __init__(self, unblock_event: threading.Event):
+        super().__init__()
+        self.unblock_event = unblock_event
+
+    def emit(self, record: logging.LogRecord):
+        self.unblock_event.wait()
+        super().emit(record)
+
+
+class QueueLogHandlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.target = _RecordingHandler()
+        self.logger = logging.getLogger(f"{__name__}.{self._testMethodName}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def tearDown(self) -> None:
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        super().tearDown()
+
+    def test_records_are_written_by_background_thread(self):
+        listener = QueueLogListener(max_queue_size=100)
+        self.logger.addHandler(QueueLogHandler(listener, (self.target,)))
+        listener.start()
+
+        self.logger.info("Message %s", 1)
+        self.logger.info("Message %s", 2)
+        listener.stop()
+
+        self.assertEqual(["Message 1", "Message 2"], [r.getMessage() for r in self.target.records])
+
+    def test_message_arguments_are_rendered_when_enqueued(self):
+        listener = QueueLogListener(max_queue_size=100)
+        self.logger.addHandler(QueueLogHandler(listener, (self.target,)))
+        args = {"value": 1}
+
+        self.logger.info("Value %s", args)
+        args["value"] = 2
+        listener.start()
+        listener.stop()
+
+        self.assertEqual("Value {'value': 1}", self.target.records[0].getMessage())
+
+    def test_low_priority_records_dropped_above_high_watermark(self):
+        listener = QueueLogListener(max_queue_size=4, high_watermark=0.5, priority_level=logging.WARNING)
+        listener.register_summary_handlers((self.target,))
+        self.logger.addHandler(QueueLogHandler(listener, (self.target,)))
+
+        for i in range(4):
+            self.logger.info(f"Info {i}")
+        self.logger.warning("Warning")
+        self.logger.error("Error")
+        self.logger.error("Error dropped")
+
+        self.assertEqual(3, listener.dropped_count)
+
+        listener.start()
+        listener.stop()
+
+        messages = [r.getMessage() for r in self.target.records]
+        self.assertEqual(["Info 0", "Info 1", "Warning", "Error"], messages[:4])
+        self.assertEqual("3 log records were dropped because the log queue was congested.", messages[-1])
+        self.assertEqual(0, listener.dropped_count)
+
+    def test_target_handler_level_respected(self):
+        listener = QueueLogListener(max_queue_size=100)
+        self.target.setLevel(logging.WARNING)
+        self.logger.addHandler(QueueLogHandler(listener, (self.target,)))
+        listener.start()
+
+        self.logger.info("Info")
+        self.logger.warning("Warning")
+        listener.stop()
+
+        self.assertEqual(["Warning"], [r.getMessage() for r in self.target.records])
+
+    def test_stop_does_not_block_on_full_queue(self):
+        unblock_event = threading.Event()
+        target = _BlockingHandler(unblock_event)
+        listener = QueueLogListener(max_queue_size=2, high_watermark=1)
+        self.logger.addHandler(QueueLogHandler(listener, (target,)))
+        listener.start()
+        writer_thread = listener._thread
+
+        self.logger.info("Message 0")
+        # Wait for the writer to block on the first record, then fill the queue
+        while listener.queue_size > 0:
+            time.sleep(0.01)
+        self.logger.info("Message 1")
+        self.logger.info("Message 2")
+
+        started = time.time()
+        listener.stop(timeout=0.1)
+        self.assertLess(time.time() - started, 1)
+
+        unblock_event.set()
+        writer_thread.join(1)
+        self.assertFalse(writer_thread.is_alive())
+        self.assertEqual(["Message 0", "Message 1", "Message 2"], [r.getMessage() for r in target.records])
@@ -0,0 +1,43 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from sqlalchemy.pool import QueuePool
+
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "trades.sqlite")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _pragma(self, engine, name: str):
+        with engine.connect() as conn:
+            return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_sqlite_performance_profile(self):
+        engine = SQLConnectionManager.get_db_engine("sqlite", {"db_path": self.db_path,
+                                                               "db_sqlite_profile": "performance"})
+
+        self.assertIsInstance(engine.pool, QueuePool)
+        self.assertEqual("wal", self._pragma(engine, "journal_mode"))
+        # NORMAL
+        self.assertEqual(1, self._pragma(engine, "synchronous"))
+        self.assertEqual(-65536, self._pragma(engine, "cache_size"))
+        engine.dispose()
+
+    def test_sqlite_default_profile(self):
+        engine = SQLConnectionManager.get_db_engine("sqlite", {"db_path": self.db_path,
+                                                               "db_sqlite_profile": "default"})
+
+        self.assertEqual("delete", self._pragma(engine, "journal_mode"))
+        # FULL
+        self.assertEqual(2, self._pragma(engine, "synchronous"))
+        engine.dispose()
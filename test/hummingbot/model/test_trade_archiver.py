@@ -0,0 +1,143 @@
+import asyncio
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_archiver import TradeArchiver, archive_partition_paths
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_reader import TradeFillReader
+from hummingbot.model.trade_fill_summary import TradeFillSummary
+
+JAN_31 = 1643587200000  # 2022-01-31 00:00:00 UTC
+FEB_01 = 1643673600000  # 2022-02-01 00:00:00 UTC
+MAR_01 = 1646092800000  # 2022-03-01 00:00:00 UTC
+
+
+class TradeArchiverTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_file_path = "test_config.yml"
+        self.db_path = str(Path(self.temp_dir.name) / "trades.sqlite")
+        self.sql_manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.trade_fee = AddedToCostTradeFee(percent=Decimal("0.1"))
+
+        with self.sql_manager.get_new_session() as session:
+            # Created in January, filled in January and February
+            self.add_order(session, "OID1", JAN_31, FEB_01)
+            self.add_fill(session, "OID1", "EOID1", JAN_31 + 1000, Decimal("10"))
+            self.add_fill(session, "OID1", "EOID2", FEB_01, Decimal("11"))
+            # Still recent
+            self.add_order(session, "OID2", MAR_01, MAR_01)
+            self.add_fill(session, "OID2", "EOID3", MAR_01, Decimal("12"))
+            session.commit()
+
+    def tearDown(self) -> None:
+        self.sql_manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def add_order(self,
+                  session,
+                  order_id: str,
+                  creation_timestamp: int,
+                  last_update_timestamp: int,
+                  last_status: str = "BuyOrderCompleted"):
+        session.add(Order(id=order_id,
+                          config_file_path=self.config_file_path,
+                          strategy="pure_market_making",
+                          market="binance",
+                          symbol="COINALPHA-HBOT",
+                          base_asset="COINALPHA",
+                          quote_asset="HBOT",
+                          creation_timestamp=creation_timestamp,
+                          order_type="LIMIT",
+                          amount=2,
+                          leverage=1,
+                          price=10,
+                          last_status=last_status,
+                          last_update_timestamp=last_update_timestamp))
+        session.add(OrderStatus(order_id=order_id, timestamp=creation_timestamp, status="BuyOrderCreated"))
+
+    def add_fill(self, session, order_id: str, exchange_trade_id: str, timestamp: int, price: Decimal):
+        session.add(TradeFill(config_file_path=self.config_file_path,
+                              strategy="pure_market_making",
+                              market="binance",
+                              symbol="COINALPHA-HBOT",
+                              base_asset="COINALPHA",
+                              quote_asset="HBOT",
+                              timestamp=timestamp,
+                              order_id=order_id,
+                              trade_type="BUY",
+                              order_type="LIMIT",
+                              price=price,
+                              amount=1,
+                              leverage=1,
+                              trade_fee=self.trade_fee.to_json(),
+                              exchange_trade_id=exchange_trade_id))
+
+    def test_archive_moves_old_orders_to_monthly_partitions(self):
+        archived = TradeArchiver(self.sql_manager).archive(cutoff_timestamp=MAR_01)
+
+        self.assertEqual(1, archived)
+        self.assertEqual(["2022-01", "2022-02"], list(archive_partition_paths(self.db_path)))
+        with self.sql_manager.get_new_session() as session:
+            self.assertEqual(["OID2"], [o.id for o in session.query(Order)])
+            self.assertEqual(["OID2"], [s.order_id for s in session.query(OrderStatus)])
+            self.assertEqual(["EOID3"], [t.exchange_trade_id for t in session.query(TradeFill)])
+
+            summaries = session.query(TradeFillSummary).order_by(TradeFillSummary.month).all()
+            self.assertEqual(["2022-01", "2022-02"], [s.month for s in summaries])
+            self.assertEqual([1, 1], [s.num_trades for s in summaries])
+            self.assertEqual([Decimal("10"), Decimal("11")], [s.quote_volume for s in summaries])
+
+    def test_archive_keeps_old_open_orders(self):
+        with self.sql_manager.get_new_session() as session:
+            # Created in January and partially filled, still open
+            self.add_order(session, "OID3", JAN_31, JAN_31 + 1000, last_status="OrderFilled")
+            self.add_fill(session, "OID3", "EOID4", JAN_31 + 1000, Decimal("10"))
+            self.add_order(session, "OID4", JAN_31, JAN_31, last_status="BuyOrderCreated")
+            session.commit()
+
+        archived = TradeArchiver(self.sql_manager).archive(cutoff_timestamp=MAR_01)
+
+        self.assertEqual(1, archived)
+        with self.sql_manager.get_new_session() as session:
+            self.assertEqual(["OID2", "OID3", "OID4"], sorted(o.id for o in session.query(Order)))
+            self.assertEqual(["OID2", "OID3", "OID4"], sorted(s.order_id for s in session.query(OrderStatus)))
+            self.assertEqual(["EOID3", "EOID4"], sorted(t.exchange_trade_id for t in session.query(TradeFill)))
+
+    def test_archive_is_idempotent(self):
+        archiver = TradeArchiver(self.sql_manager)
+        archiver.archive(cutoff_timestamp=MAR_01)
+
+        self.assertEqual(0, archiver.archive(cutoff_timestamp=MAR_01))
+
+    def test_reader_includes_archived_trades_when_asked(self):
+        TradeArchiver(self.sql_manager).archive(cutoff_timestamp=MAR_01)
+        reader = TradeFillReader(self.sql_manager)
+        try:
+            trades = self.async_run_with_timeout(reader.get_trades(FEB_01, with_orders=True))
+            self.assertEqual(["EOID3"], [t.exchange_trade_id for t in trades])
+
+            trades = self.async_run_with_timeout(reader.get_trades(FEB_01, with_orders=True, include_archived=True))
+            self.assertEqual(["EOID2", "EOID3"], [t.exchange_trade_id for t in trades])
+            # The order of a trade is available in the trade partition even if it was created in an earlier month
+            self.assertEqual(JAN_31, trades[0].order.creation_timestamp)
+
+            trades = self.async_run_with_timeout(reader.get_trades(0, number_of_rows=2, include_archived=True))
+            self.assertEqual(["EOID2", "EOID3"], [t.exchange_trade_id for t in trades])
+        finally:
+            reader.stop()
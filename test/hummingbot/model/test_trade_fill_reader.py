@@ -0,0 +1,88 @@
+import asyncio
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_fill_reader import TradeFillReader, TradesSummary
+
+
+class TradeFillReaderTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_file_path = "test_config.yml"
+        self.sql_manager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS,
+                                                db_path=str(Path(self.temp_dir.name) / "trades.sqlite"))
+        self.reader = TradeFillReader(self.sql_manager)
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.1"))
+        with self.sql_manager.get_new_session() as session:
+            session.add(Order(id="OID1",
+                              config_file_path=self.config_file_path,
+                              strategy="pure_market_making",
+                              market="binance",
+                              symbol="COINALPHA-HBOT",
+                              base_asset="COINALPHA",
+                              quote_asset="HBOT",
+                              creation_timestamp=1000,
+                              order_type="LIMIT",
+                              amount=3,
+                              leverage=1,
+                              price=10,
+                              last_status="FILLED",
+                              last_update_timestamp=3000))
+            for i in [1, 2, 3]:
+                session.add(TradeFill(config_file_path=self.config_file_path,
+                                      strategy="pure_market_making",
+                                      market="binance",
+                                      symbol="COINALPHA-HBOT",
+                                      base_asset="COINALPHA",
+                                      quote_asset="HBOT",
+                                      timestamp=i * 1000,
+                                      order_id="OID1",
+                                      trade_type="BUY",
+                                      order_type="LIMIT",
+                                      price=10,
+                                      amount=1,
+                                      leverage=1,
+                                      trade_fee=trade_fee.to_json(),
+                                      exchange_trade_id=f"EOID{i}"))
+            session.commit()
+
+    def tearDown(self) -> None:
+        self.reader.stop()
+        self.sql_manager.engine.dispose()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_get_trades_in_ascending_order(self):
+        trades = self.async_run_with_timeout(self.reader.get_trades(2000, config_file_path=self.config_file_path))
+
+        self.assertEqual(["EOID2", "EOID3"], [t.exchange_trade_id for t in trades])
+
+    def test_get_latest_trades_with_orders(self):
+        trades = self.async_run_with_timeout(self.reader.get_trades(0, number_of_rows=2, with_orders=True))
+
+        self.assertEqual(["EOID2", "EOID3"], [t.exchange_trade_id for t in trades])
+        # The order is loaded with the trades and can be used once the session is closed
+        self.assertEqual(1000, trades[0].order.creation_timestamp)
+
+    def test_get_trades_summary(self):
+        summary = self.async_run_with_timeout(
+            self.reader.get_trades_summary(2000, config_file_path=self.config_file_path))
+        self.assertEqual(TradesSummary(count=2, last_timestamp=3000), summary)
+
+        summary = self.async_run_with_timeout(self.reader.get_trades_summary(0, config_file_path="other_config.yml"))
+        self.assertEqual(TradesSummary(count=0, last_timestamp=None), summary)
@@ -0,0 +1,105 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
+from hummingbot.pmm_script.pmm_script_interface import (
+    OnTick,
+    PMM_PARAMETER_NAMES,
+    PMMParameters,
+    set_child_queue,
+)
+
+
+class PMMScriptChannelTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.channel = PMMScriptChannel.create(poll_interval=0.001)
+
+    def tearDown(self) -> None:
+        self.channel.close()
+        super().tearDown()
+
+    def test_put_and_get(self):
+        self.assertTrue(self.channel.empty())
+        self.channel.put("message")
+        self.assertEqual("message", self.channel.get())
+        self.assertTrue(self.channel.empty())
+
+    def test_put_does_not_block_while_the_pipe_is_full(self):
+        large_item = b"x" * 1_000_000
+        started = time.time()
+        self.channel.put(large_item)
+        self.channel.put(2)
+        self.assertLess(time.time() - started, 0.5)
+
+        self.assertEqual(large_item, self.channel.get())
+        self.assertEqual(2, self.channel.get())
+
+    def test_send_errors_are_logged_and_later_items_sent(self):
+        with self.assertLogs("hummingbot.pmm_script.pmm_script_channel", level="ERROR") as logs:
+            self.channel.put(lambda: None)
+            self.channel.put("message")
+            self.assertEqual("message", self.channel.get())
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    def test_get_async_wakes_up_when_item_arrives(self):
+        async def delayed_put():
+            await asyncio.sleep(0.01)
+            self.channel.put(OnTick(Decimal("100"), {"buy_levels": 2}, None, None))
+
+        async def receive():
+            put_task = asyncio.ensure_future(delayed_put())
+            item = await self.channel.get_async()
+            await put_task
+            return item
+
+        item = self.ev_loop.run_until_complete(asyncio.wait_for(receive(), timeout=1))
+
+        self.assertEqual(Decimal("100"), item.mid_price)
+        self.assertEqual({"buy_levels": 2}, item.changed_parameters)
+        self.assertIsNone(item.all_total_balances)
+
+    def test_try_put_sends_when_writable(self):
+        self.assertTrue(self.channel.try_put(1))
+        self.assertEqual(1, self.channel.get())
+
+    def test_try_put_skips_items_while_the_pipe_is_full(self):
+        large_item = b"x" * 1_000_000
+        self.assertTrue(self.channel.try_put(large_item))
+        # The sender thread is blocked until the receiver reads, the caller is not
+        started = time.time()
+        self.assertFalse(self.channel.try_put(2))
+        self.assertLess(time.time() - started, 0.5)
+
+        self.assertEqual(large_item, self.channel.get())
+        deadline = time.time() + 1
+        while not self.channel.try_put(3):
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.001)
+        self.assertEqual(3, self.channel.get())
+
+    def test_parameter_names_match_strategy_parameters(self):
+        self.assertIn("buy_levels", PMM_PARAMETER_NAMES)
+        self.assertIn("order_override", PMM_PARAMETER_NAMES)
+        self.assertNotIn("apply_changes", PMM_PARAMETER_NAMES)
+
+    def test_apply_changes_does_not_report_updates(self):
+        set_child_queue(self.channel)
+        parameters = PMMParameters()
+        parameters.apply_changes({"buy_levels": 1, "sell_levels": 2})
+        parameters.apply_changes({"buy_levels": 3})
+
+        self.assertEqual(3, parameters.buy_levels)
+        self.assertEqual(2, parameters.sell_levels)
+        self.assertTrue(self.channel.empty())
+
+        parameters.buy_levels = 0
+        update = self.channel.get()
+        self.assertEqual("buy_levels", update.name)
+        self.assertEqual(0, update.updated_value)
@@ -0,0 +1,96 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.pmm_script.pmm_script_interface import OnTick, PMM_PARAMETER_NAMES
+from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
+
+
+class PMMScriptIteratorTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        process_patcher = patch("hummingbot.pmm_script.pmm_script_iterator.Process")
+        process_patcher.start()
+        self.addCleanup(process_patcher.stop)
+        channel_patcher = patch("hummingbot.pmm_script.pmm_script_iterator.PMMScriptChannel")
+        channel_class_mock = channel_patcher.start()
+        self.addCleanup(channel_patcher.stop)
+        self.channel = channel_class_mock.create.return_value
+        self.channel.get_async = AsyncMock(return_value=None)
+        self.channel.try_put.return_value = True
+
+        self.market = MagicMock()
+        self.market.name = "paper"
+        self.market.get_all_balances.return_value = {"HBOT": Decimal("10"), "COINALPHA": Decimal("0")}
+        self.market.get_available_balance.return_value = Decimal("5")
+
+        self.strategy = MagicMock()
+        self.strategy.all_markets_ready.return_value = True
+        self.strategy.get_mid_price.return_value = Decimal("100")
+        for name in PMM_PARAMETER_NAMES:
+            setattr(self.strategy, name, Decimal("1"))
+        self.strategy.order_override = {"level_1": ["buy", "0.5", "100"]}
+
+        self.iterator = PMMScriptIterator("script.py", [self.market], self.strategy, is_unit_testing_mode=True)
+
+    def tearDown(self) -> None:
+        # Lets the child queue listener read the None item and exit
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        super().tearDown()
+
+    def sent_ticks(self) -> List[OnTick]:
+        return [call.args[0] for call in self.channel.try_put.call_args_list]
+
+    def test_only_changes_are_sent_after_the_first_tick(self):
+        self.iterator.tick(1)
+        self.iterator.tick(2)
+
+        first_tick, second_tick = self.sent_ticks()
+        self.assertEqual(set(PMM_PARAMETER_NAMES), set(first_tick.changed_parameters))
+        self.assertEqual({"paper": {"HBOT": Decimal("10")}}, first_tick.all_total_balances)
+        self.assertEqual({"paper": {"HBOT": Decimal("5")}}, first_tick.all_available_balances)
+        self.assertEqual({}, second_tick.changed_parameters)
+        self.assertIsNone(second_tick.all_total_balances)
+        self.assertIsNone(second_tick.all_available_balances)
+
+        self.strategy.bid_spread = Decimal("2")
+        self.market.get_available_balance.return_value = Decimal("4")
+        self.iterator.tick(3)
+
+        third_tick = self.sent_ticks()[-1]
+        self.assertEqual({"bid_spread": Decimal("2")}, third_tick.changed_parameters)
+        self.assertIsNone(third_tick.all_total_balances)
+        self.assertEqual({"paper": {"HBOT": Decimal("4")}}, third_tick.all_available_balances)
+
+    def test_in_place_parameter_changes_are_sent(self):
+        self.iterator.tick(1)
+        self.strategy.order_override["level_2"] = ["sell", "0.5", "100"]
+        self.iterator.tick(2)
+
+        changed_parameters = self.sent_ticks()[-1].changed_parameters
+        self.assertEqual(["order_override"], list(changed_parameters))
+        self.assertEqual({"level_1": ["buy", "0.5", "100"], "level_2": ["sell", "0.5", "100"]},
+                         changed_parameters["order_override"])
+
+    def test_changes_of_skipped_ticks_are_sent_with_the_next_tick(self):
+        self.iterator.tick(1)
+        self.channel.try_put.return_value = False
+        self.strategy.ask_spread = Decimal("3")
+        self.iterator.tick(2)
+        self.channel.try_put.return_value = True
+        self.iterator.tick(3)
+
+        skipped_tick, next_tick = self.sent_ticks()[1:]
+        self.assertEqual({"ask_spread": Decimal("3")}, skipped_tick.changed_parameters)
+        self.assertEqual({"ask_spread": Decimal("3")}, next_tick.changed_parameters)
+
+    def test_no_tick_until_the_markets_are_ready(self):
+        self.strategy.all_markets_ready.return_value = False
+        self.iterator.tick(1)
+
+        self.assertEqual([], self.sent_ticks())
@@ -221,6 +221,28 @@ class ArbitrageUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("0"), amount)
         self.assertAlmostEqual(Decimal("1.0399044681062792"), profitability)
 
+    def test_find_best_profitable_step(self):
+        cumulative_amounts = [10.0, 30.0, 60.0]
+        cumulative_bid_values = [11.0, 32.0, 62.0]
+        cumulative_ask_values = [10.0, 30.2, 61.0]
+
+        # The last step is not profitable enough
+        best_step, profitability, last_step, balance_limited = ArbitrageStrategy.find_best_profitable_step(
+            cumulative_amounts, cumulative_bid_values, cumulative_ask_values, 0, 0, 0, 0, 0.03, 1000, 1000)
+        self.assertEqual((1, 2, False), (best_step, last_step, balance_limited))
+        self.assertAlmostEqual(32.0 / 30.2, profitability)
+
+        # Fees make the second step unprofitable
+        best_step, profitability, last_step, balance_limited = ArbitrageStrategy.find_best_profitable_step(
+            cumulative_amounts, cumulative_bid_values, cumulative_ask_values, 0.02, 0, 0.02, 0, 0.03, 1000, 1000)
+        self.assertEqual((0, 2, False), (best_step, last_step, balance_limited))
+        self.assertAlmostEqual(11.0 * 0.98 / (10.0 * 1.02), profitability)
+
+        # The base balance stops the walk at the second step, which is still profitable
+        best_step, profitability, last_step, balance_limited = ArbitrageStrategy.find_best_profitable_step(
+            cumulative_amounts, cumulative_bid_values, cumulative_ask_values, 0, 0, 0, 0, 0.03, 1000, 20)
+        self.assertEqual((1, 1, True), (best_step, last_step, balance_limited))
+
     def test_find_profitable_arbitrage_orders(self):
         self.market_2.order_books[self.market_2_trading_pairs[0]].apply_diffs(
             [OrderBookRow(1.1, 30, 2)], [], 2)
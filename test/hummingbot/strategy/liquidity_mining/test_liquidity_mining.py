@@ -181,6 +181,30 @@ class LiquidityMiningTest(unittest.TestCase):
         self.simulate_maker_market_trade(False, 50, 1, "ETH-BTC")
         self.clock.backtest_til(self.start_timestamp + 16)
 
+    @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.estimate_fee')
+    def test_proposals_recomputed_only_for_changed_markets(self, estimate_fee_mock):
+        estimate_fee_mock.return_value = AddedToCostTradeFee(
+            percent=0, flat_fees=[TokenAmount('ETH', Decimal(0.00005))]
+        )
+        self.clock.add_iterator(self.default_strategy)
+        # The volatility is known from the second tick on
+        self.clock.backtest_til(self.start_timestamp + 2)
+
+        with unittest.mock.patch.object(self.default_strategy,
+                                        "create_base_proposals",
+                                        wraps=self.default_strategy.create_base_proposals) as create_mock:
+            self.clock.backtest_til(self.start_timestamp + 3)
+            create_mock.assert_not_called()
+
+            self.market.set_balanced_order_book(trading_pair="ETH-USDT",
+                                                mid_price=101,
+                                                min_price=1,
+                                                max_price=200,
+                                                price_step_size=1,
+                                                volume_step_size=10)
+            self.clock.backtest_til(self.start_timestamp + 4)
+            create_mock.assert_called_once_with(["ETH-USDT"])
+
     @unittest.mock.patch('hummingbot.strategy.liquidity_mining.liquidity_mining.estimate_fee')
     def test_tolerance_level(self, estimate_fee_mock):
         """
@@ -211,6 +211,47 @@ class TestSpotPerpetualArbitrage(unittest.TestCase):
         self.assertEqual(Decimal("110.5"), props[1].perp_side.order_price)
         self.assertEqual(Decimal("1"), props[1].order_amount)
 
+    def test_take_market_snapshot(self):
+        self.clock.add_iterator(self.strategy)
+        snapshot = asyncio.get_event_loop().run_until_complete(self.strategy.take_market_snapshot())
+        self.assertIs(snapshot, self.strategy.last_snapshot)
+        self.assertEqual(Decimal("100.5"), snapshot.spot_buy_price)
+        self.assertEqual(Decimal("99.5"), snapshot.spot_sell_price)
+        self.assertEqual(Decimal("110.5"), snapshot.perp_buy_price)
+        self.assertEqual(Decimal("109.5"), snapshot.perp_sell_price)
+        self.assertEqual(Decimal("5"), snapshot.spot_base_balance)
+        self.assertEqual(Decimal("500"), snapshot.spot_quote_balance)
+        self.assertEqual(Decimal("500"), snapshot.perp_quote_balance)
+        self.assertEqual([], snapshot.perp_positions)
+        self.assertIsNone(snapshot.funding_info)
+
+        # Proposals and budget checks use the state captured in the snapshot
+        self.spot_connector.set_balanced_order_book(trading_pair=trading_pair,
+                                                    mid_price=50,
+                                                    min_price=1,
+                                                    max_price=200,
+                                                    price_step_size=1,
+                                                    volume_step_size=10)
+        props = asyncio.get_event_loop().run_until_complete(self.strategy.create_base_proposals(snapshot))
+        self.assertEqual(Decimal("100.5"), props[0].spot_side.order_price)
+        self.assertEqual(Decimal("109.5"), props[0].perp_side.order_price)
+
+        self.spot_connector.set_balance(base_asset, 0)
+        self.spot_connector.set_balance(quote_asset, 0)
+        self.assertTrue(self.strategy.check_budget_available(snapshot))
+        self.assertFalse(self.strategy.check_budget_available())
+        proposal = ArbProposal(ArbProposalSide(self.spot_market_info, False, Decimal("100")),
+                               ArbProposalSide(self.perp_market_info, True, Decimal("100")),
+                               Decimal("1"))
+        self.perp_connector.set_balance(quote_asset, 0)
+        self.assertTrue(self.strategy.check_budget_constraint(proposal, snapshot))
+        self.assertFalse(self.strategy.check_budget_constraint(proposal))
+
+        # The status report does not replace the snapshot the tick decisions are based on
+        self.strategy._order_amount = Decimal("2")
+        asyncio.get_event_loop().run_until_complete(self.strategy.format_status())
+        self.assertIs(snapshot, self.strategy.last_snapshot)
+
     def test_apply_slippage_buffers(self):
         proposal = ArbProposal(ArbProposalSide(self.spot_market_info, True, Decimal("100")),
                                ArbProposalSide(self.perp_market_info, False, Decimal("100")),
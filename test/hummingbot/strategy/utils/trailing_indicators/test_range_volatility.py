@@ -0,0 +1,55 @@
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.range_volatility import (
+    RangeVolatilityIndicator,
+    RollingHighLow,
+)
+
+
+class RangeVolatilityTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    @staticmethod
+    def windows_average_range(samples, interval: int, period: int) -> float:
+        # Ranges computed over every window, the way the liquidity mining strategy used to do it
+        samples = samples[-interval * period:]
+        ranges = []
+        for end in range(len(samples), 1, -interval):
+            window = samples[max(0, end - interval):end]
+            ranges.append((max(window) - min(window)) / min(window))
+        return sum(ranges) / len(ranges) if ranges else float("nan")
+
+    def test_rolling_high_low(self):
+        high_low = RollingHighLow(3)
+        for sample, (high, low) in zip([5, 3, 4, 1, 2, 6], [(5, 5), (5, 3), (5, 3), (4, 1), (4, 1), (6, 1)]):
+            high_low.add_sample(sample)
+            self.assertEqual((high, low), (high_low.high, high_low.low))
+        self.assertTrue(high_low.is_full)
+
+    def test_no_volatility_without_enough_samples(self):
+        indicator = RangeVolatilityIndicator(sampling_length=5, processing_length=2)
+        self.assertTrue(math.isnan(indicator.current_value))
+
+        indicator.add_sample(100)
+        self.assertTrue(math.isnan(indicator.current_value))
+
+        indicator.add_sample(110)
+        self.assertAlmostEqual(0.1, indicator.current_value)
+
+    def test_matches_the_average_of_the_windows_ranges(self):
+        interval, period = 7, 4
+        samples = list(np.random.normal(100, 2, 100))
+        indicator = RangeVolatilityIndicator(sampling_length=interval, processing_length=period)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            if i > 0:
+                self.assertAlmostEqual(self.windows_average_range(samples[:i + 1], interval, period),
+                                       indicator.current_value)
+        self.assertTrue(indicator.is_processing_buffer_full)
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.ui.headless_cli import HeadlessCLI
 
 
 class HummingbotApplicationTest(unittest.TestCase):
@@ -33,3 +34,13 @@ class HummingbotApplicationTest(unittest.TestCase):
 
         self.assertEqual(None, self.app.strategy_file_name)
         self.assertEqual(1, mock.call_count)
+
+    def test_headless_application_does_not_build_the_terminal_ui(self):
+        app = HummingbotApplication(headless=True)
+
+        self.assertIsInstance(app.app, HeadlessCLI)
+        self.assertTrue(app.headless)
+        self.assertFalse(self.app.headless)
+        with patch.object(HeadlessCLI, "logger") as logger_mock:
+            app.notify("Test notification")
+        logger_mock.return_value.info.assert_called_with("Test notification")